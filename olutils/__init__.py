@@ -22,6 +22,7 @@ from .conversion import (
     err2str,
 )
 from .os import (
+    copen,
     mkdirs,
     rmdirs,
     sopen,
@@ -35,6 +36,7 @@ from .storing import (
     save,
 )
 from .sequencing import (
+    chunkiter,
     countiter,
     display,
     wait_until,
@@ -1,16 +1,22 @@
 """Temporality converters
 
+Numpy arrays are converted at once, datetimes and timedeltas being represented
+as datetime64 / timedelta64 arrays (microsecond precision, as datetime).
+
 # TODO : Handle timezones
 """
 from collections.abc import Iterable as IterableABC
 from datetime import datetime, timedelta
 from typing import Iterable, Union
 
+import numpy as np
 from dateutil.parser import parse
 
 from olutils.typing import Number, TimeRepr
 
 DATE_REF = datetime(1970, 1, 1)
+DATE_REF64 = np.datetime64(DATE_REF, "us")
+SECOND64 = np.timedelta64(1, "s")
 
 HOUR = 3600
 DAY = 24 * HOUR
@@ -30,15 +36,25 @@ UNIT_TO_SEC = {
     "y": YEAR,
     "year": YEAR,
 }
+DT_UNITS = ["dt", "datetime"]
+TD_UNITS = ["td", "timedelta"]
+
+
+def _secs2td64(secs: np.ndarray, /) -> np.ndarray:
+    """Return timedelta64 array (us) from array of seconds (NaN are NaT)"""
+    if secs.dtype.kind in "iub":
+        return secs.astype(np.int64) * np.timedelta64(1_000_000, "us")
+    return np.rint(secs.astype(np.float64) * 1e6).astype("timedelta64[us]")
 
 
 def secs2unit(
-    secs: Union[Number, Iterable[Number]], /, unit: str
-) -> Union[TimeRepr, Iterable[TimeRepr]]:
+    secs: Union[Number, Iterable[Number], np.ndarray], /, unit: str
+) -> Union[TimeRepr, Iterable[TimeRepr], np.ndarray]:
     """Convert number of seconds to given unit
 
     Args:
         secs: number of seconds
+            timedelta64 arrays are converted as their number of seconds
         unit: unit to convert to
 
     Available units:
@@ -60,11 +76,21 @@ def secs2unit(
             if unit is dt: return datetime
             elif unit is timedelta: return timedelta
             else: return int|float
+        elif secs is ndarray
+            if unit is dt: return datetime64 ndarray
+            elif unit is td: return timedelta64 ndarray
+            else: return float ndarray
         elif secs is iterable
             if secs is list|set|tuple: return list|set|tuple
-            elif secs is ndarray & unit is not dt|td: return ndarray
             else: return map-object
     """
+    if isinstance(secs, np.ndarray):
+        if secs.dtype.kind == "m":
+            secs = secs / SECOND64
+        if unit in DT_UNITS:
+            return ts2dt(secs)
+        if unit in TD_UNITS:
+            return _secs2td64(secs)
     try:
         divisor = UNIT_TO_SEC[unit]
     except KeyError:
@@ -72,9 +98,9 @@ def secs2unit(
     try:
         if divisor:
             return secs / divisor
-        if unit in ["dt", "datetime"]:
+        if unit in DT_UNITS:
             return ts2dt(secs)
-        if unit in ["td", "timedelta"]:
+        if unit in TD_UNITS:
             return timedelta(seconds=float(secs))
         raise ValueError(f"Unknown time unit '{unit}'")
     except TypeError:
@@ -85,13 +111,26 @@ def secs2unit(
         raise TypeError(f"Can't convert type {type(secs)}") from None
 
 
-def dt2ts(dt: datetime, /) -> float:
-    """Return seconds since the Unix Epoch"""
+def dt2ts(
+    dt: Union[datetime, np.datetime64, np.ndarray], /
+) -> Union[float, np.ndarray]:
+    """Return seconds since the Unix Epoch
+
+    datetime64 values (and arrays of datetimes) are converted at once to
+    float arrays, NaT being NaN.
+    """
+    if isinstance(dt, (np.ndarray, np.datetime64)):
+        return (np.asarray(dt).astype("datetime64[us]") - DATE_REF64) / SECOND64
     return (dt - DATE_REF).total_seconds()
 
 
-def ts2dt(ts: Number, /) -> datetime:
-    """Return datetime from seconds since the Unix Epoch"""
+def ts2dt(ts: Union[Number, np.ndarray], /) -> Union[datetime, np.ndarray]:
+    """Return datetime from seconds since the Unix Epoch
+
+    Arrays are converted at once to datetime64 arrays, NaN being NaT.
+    """
+    if isinstance(ts, np.ndarray):
+        return DATE_REF64 + _secs2td64(ts)
     return DATE_REF + timedelta(seconds=float(ts))
 
 
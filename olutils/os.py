@@ -1,7 +1,18 @@
 """Function to manage files"""
+import bz2
+import gzip
+import io
+import lzma
 import os
 import shutil
-from typing import TextIO
+from typing import IO, Optional
+
+COMPRESSIONS = {
+    "gz": gzip.GzipFile,
+    "bz2": bz2.BZ2File,
+    "xz": lzma.LZMAFile,
+}
+DFT_BUFFER_SIZE = 1024 * 1024  # Bytes, buffer size of compressed streams
 
 
 # --------------------------------------------------------------------------- #
@@ -22,9 +33,98 @@ def rmdirs(dirtree: str):
     return shutil.rmtree(dirtree)
 
 
-def sopen(filepath: str, /, option: str = "w+", **kwargs) -> TextIO:
+# --------------------------------------------------------------------------- #
+# File opening
+
+
+def get_compression(filepath: str, /) -> Optional[str]:
+    """Return compression of file given its suffix (None if not compressed)
+
+    Example:
+        >>> get_compression("data.csv.gz")
+        'gz'
+    """
+    parts = os.path.basename(filepath).split(".")
+    return parts[-1] if len(parts) > 1 and parts[-1] in COMPRESSIONS else None
+
+
+def strip_compression(filepath: str, /) -> str:
+    """Return path without its compression suffix (if any)"""
+    if get_compression(filepath) is None:
+        return filepath
+    return filepath[: filepath.rindex(".")]
+
+
+def copen(
+    filepath: str,
+    /,
+    option: str = "r",
+    *,
+    compression: Optional[str] = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
+    encoding: str = None,
+    errors: str = None,
+    newline: str = None,
+) -> IO:
+    """Open a file, transparently (de)compressing it given its suffix
+
+    Args:
+        filepath
+        option      : @see `open`
+            '+' is ignored for compressed files
+        compression : compression of file, one of COMPRESSIONS keys
+            "infer" > @see `get_compression`
+            None    > no compression
+        compresslevel: compression level (preset for 'xz'), dft is library's
+        buffering   : @see `open`, buffer size in bytes of compressed stream
+            -1 means DFT_BUFFER_SIZE for compressed files
+        encoding, errors, newline: @see `open`, for text mode
+
+    Raise:
+        (ValueError): unknown compression
+    """
+    if compression == "infer":
+        compression = get_compression(filepath)
+    if compression is None:
+        return open(
+            filepath,
+            option,
+            buffering=buffering,
+            encoding=encoding,
+            errors=errors,
+            newline=newline,
+        )
+    try:
+        opener = COMPRESSIONS[compression]
+    except KeyError:
+        raise ValueError(f"Unknown compression '{compression}'") from None
+
+    binary = "b" in option
+    if binary and encoding is not None:
+        raise ValueError("binary mode doesn't take an encoding argument")
+    bmode = option.replace("t", "").replace("b", "").replace("+", "") + "b"
+    if compresslevel is None:
+        stream = opener(filepath, bmode)
+    elif compression == "xz":
+        stream = opener(filepath, bmode, preset=compresslevel)
+    else:
+        stream = opener(filepath, bmode, compresslevel=compresslevel)
+
+    buffer_size = DFT_BUFFER_SIZE if buffering < 0 else buffering
+    if buffer_size > 1:
+        buffered = io.BufferedReader if "r" in bmode else io.BufferedWriter
+        stream = buffered(stream, buffer_size)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, errors=errors, newline=newline)
+
+
+def sopen(filepath: str, /, option: str = "w+", **kwargs) -> IO:
     """Safely open a file, by default for writing, by creating dir tree
 
+    Files with a compression suffix (.gz, .bz2, .xz) are (de)compressed
+
     Args:
         filepath
         option:
@@ -33,7 +133,8 @@ def sopen(filepath: str, /, option: str = "w+", **kwargs) -> TextIO:
             'a'       open for writing, appending to the end of the file if it exists
             't'       text mode (default)
             '+'       open a disk file for updating (reading and writing)
-        **kwargs: @see `open`
+        **kwargs: @see `copen`
+            compression, compresslevel, buffering, encoding, ...
     """
     mkdirs(os.path.dirname(filepath))
-    return open(filepath, option, **kwargs)
+    return copen(filepath, option, **kwargs)
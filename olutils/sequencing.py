@@ -1,6 +1,7 @@
 """Functions for sequencing"""
+from itertools import islice
 from time import sleep, time
-from typing import Callable, Iterable, Union
+from typing import Callable, Iterable, List, Union
 
 from olutils.typing import Number, T
 
@@ -56,6 +57,34 @@ def countiter(
         print()
 
 
+def chunkiter(iterable: Iterable[T], /, size: int) -> Iterable[List[T]]:
+    """Iterate elements of iterable by lists of at most size elements
+
+    Args:
+        iterable
+        size    : max number of elements in each chunk
+
+    Raise:
+        (ValueError): size is not strictly positive
+
+    Example:
+        >>> list(chunkiter(range(5), 2))
+        [[0, 1], [2, 3], [4]]
+    """
+    if size <= 0:
+        raise ValueError(f"size must be strictly positive, got {size}")
+
+    def chunk_iterator():
+        """Iterate chunks of iterable"""
+        iterator = iter(iterable)
+        chunk = list(islice(iterator, size))
+        while chunk:
+            yield chunk
+            chunk = list(islice(iterator, size))
+
+    return chunk_iterator()
+
+
 def display(*args, **kwargs):
     """Extension of print with verbose kwarg
 
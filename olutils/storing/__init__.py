@@ -1,7 +1,63 @@
-"""Functions to load and save objects"""
+"""Functions to load and save objects
 
+Modules of storing formats (csv, npy, ...) are imported on first use only, as
+hooks of the format registry (@see `registry`): their functions exported here
+are imported lazily as well.
+"""
+from importlib import import_module
+
+from .cache import LoadCache
 from .common import DFT_EOL
-from .csv import read_csv, write_csv
+from .durability import GroupCommit
 from .functions import load, save
-from .rowreader import RowReader
-from .txt import read_txt, write_txt
+from .memoize import memoize  # Eager: submodule would shadow function
+from .registry import register_format
+
+_LAZY_EXPORTS = {  # name: module
+    "aload": "aio",
+    "aread_csv": "aio",
+    "asave": "aio",
+    "load_many": "bulk",
+    "save_many": "bulk",
+    "read_csv": "csv",
+    "write_csv": "csv",
+    "read_json": "json",
+    "write_json": "json",
+    "read_jsonl": "jsonl",
+    "write_jsonl": "jsonl",
+    "read_npy": "npy",
+    "read_npz": "npy",
+    "write_npy": "npy",
+    "write_npz": "npy",
+    "RowError": "parallel",
+    "read_csv_parallel": "parallel",
+    "read_rows_parallel": "parallel",
+    "PartitionedWriter": "partition",
+    "write_partitioned": "partition",
+    "read_pickle": "pickle",
+    "write_pickle": "pickle",
+    "RowReader": "rowreader",
+    "requires": "rowreader",
+    "vectorized": "rowreader",
+    "infer_schema": "schema",
+    "sort_csv": "sort",
+    "read_txt": "txt",
+    "write_txt": "txt",
+}
+_LAZY_MODULES = {*_LAZY_EXPORTS.values(), "index"}
+
+
+def __getattr__(name: str):
+    """Import lazy exports and submodules on first access"""
+    if name in _LAZY_EXPORTS:
+        value = getattr(import_module(f".{_LAZY_EXPORTS[name]}", __name__), name)
+    elif name in _LAZY_MODULES:
+        value = import_module(f".{name}", __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_LAZY_EXPORTS, *_LAZY_MODULES})
@@ -0,0 +1,217 @@
+"""Asynchronous counterparts of storing functions
+
+Blocking file I/O and parsing are run in an executor (dft is the default one
+of the event loop) so that the event loop is never stalled. Rows are read by
+batches, a bounded number of batches being read ahead of consumption.
+
+Iterators (e.g. rows of a file) can't be sent to other processes: they are
+consumed in threads only, a ProcessPoolExecutor can only be used to load
+objects that are not iterators.
+"""
+import asyncio
+from collections.abc import Iterator as IteratorABC
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, List, Union
+
+from olutils.typing import RowDict, T
+from .csv import read_csv
+from .functions import load, save
+
+DFT_BATCHSIZE = 1000  # Elements read at once in executor
+DFT_READAHEAD = 4  # Batches read ahead of consumption
+
+
+def _take(iterator: IteratorABC, size: int) -> List:
+    """Return list of (at most) size next elements of iterator"""
+    return list(islice(iterator, size))
+
+
+def _check_thread_executor(executor: Union[Executor, None], /):
+    """Raise ValueError if executor runs calls in other processes"""
+    if isinstance(executor, ProcessPoolExecutor):
+        raise ValueError(
+            "Iterators can't be consumed in a ProcessPoolExecutor,"
+            " use a ThreadPoolExecutor"
+        )
+
+
+def _load(path: str, mthd: str, /, *, in_process: bool, **kwargs) -> Any:
+    """Return object loaded from path, @see `~olutils.storing.load`
+
+    Raise:
+        (ValueError): in_process and loaded object is an iterator
+    """
+    res = load(path, mthd, **kwargs)
+    if in_process and isinstance(res, IteratorABC):
+        close = getattr(res, "close", None)
+        if close is not None:
+            close()
+        raise ValueError(
+            f"Loading '{path}' returns an iterator, which can't be consumed in"
+            " a ProcessPoolExecutor, use a ThreadPoolExecutor"
+        )
+    return res
+
+
+async def aiterate(
+    iterable: Iterable[T],
+    /,
+    *,
+    executor: Executor = None,
+    batchsize: int = DFT_BATCHSIZE,
+    readahead: int = DFT_READAHEAD,
+) -> AsyncIterator[T]:
+    """Iterate asynchronously on elements of a blocking iterable
+
+    Iterator of iterable is closed (if it has a close method, as generators)
+    once exhausted, or when iteration is stopped early or cancelled.
+
+    Args:
+        iterable    : blocking iterable (e.g. rows of a file)
+        executor    : executor where iterable is consumed, in threads
+            None for default executor of running loop
+        batchsize   : number of elements taken from iterable at once
+        readahead   : max number of batches read and not consumed yet
+
+    Raise:
+        (ValueError): executor is a ProcessPoolExecutor
+    """
+    _check_thread_executor(executor)
+    loop = asyncio.get_running_loop()
+    iterator = iter(iterable)
+    queue = asyncio.Queue(maxsize=readahead)
+    taking = None  # Future of batch being taken from iterator
+
+    async def produce():
+        """Put batches of iterator in queue (empty batch at the end)"""
+        nonlocal taking
+        try:
+            batch = None
+            while batch != []:
+                taking = loop.run_in_executor(executor, _take, iterator, batchsize)
+                # Shielded: cancelling producer must not forget a running take
+                batch = await asyncio.shield(taking)
+                await queue.put(batch)
+        except Exception as error:  # pylint: disable=broad-except
+            await queue.put(error)
+
+    producer = asyncio.ensure_future(produce())
+    try:
+        while True:
+            batch = await queue.get()
+            if isinstance(batch, Exception):
+                raise batch
+            if not batch:
+                break
+            for elem in batch:
+                yield elem
+    finally:
+        producer.cancel()
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            if taking is not None:  # Iterator can't be closed while running
+                await asyncio.wait([taking])
+            await loop.run_in_executor(executor, close)
+
+
+async def aload(
+    path: str,
+    /,
+    mthd: str = None,
+    *,
+    executor: Executor = None,
+    batchsize: int = DFT_BATCHSIZE,
+    readahead: int = DFT_READAHEAD,
+    **kwargs,
+) -> Union[Any, AsyncIterator[Any]]:
+    """Load object at path in executor
+
+    Args:
+        path, mthd  : @see `~olutils.storing.load`
+        executor    : executor where object is loaded
+            None for default executor of running loop
+            ProcessPoolExecutor can't be used when load returns an iterator
+        batchsize, readahead: @see `aiterate`
+            used when load returns an iterator (csv rows, ...)
+        **kwargs    : @see `~olutils.storing.load`
+
+    Raise:
+        (ValueError): load returns an iterator in a ProcessPoolExecutor
+
+    Returns:
+        loaded object, or async iterator if load returns an iterator
+    """
+    loop = asyncio.get_running_loop()
+    res = await loop.run_in_executor(
+        executor,
+        partial(
+            _load,
+            path,
+            mthd,
+            in_process=isinstance(executor, ProcessPoolExecutor),
+            **kwargs,
+        ),
+    )
+    if isinstance(res, IteratorABC):
+        return aiterate(
+            res, executor=executor, batchsize=batchsize, readahead=readahead
+        )
+    return res
+
+
+async def asave(
+    __obj: Any,
+    path: str,
+    /,
+    mthd: str = None,
+    *,
+    executor: Executor = None,
+    **params,
+):
+    """Save object to path in executor
+
+    Args:
+        __obj, path, mthd: @see `~olutils.storing.save`
+        executor    : executor where object is saved
+            None for default executor of running loop
+        **params    : @see `~olutils.storing.save`
+    """
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(executor, partial(save, __obj, path, mthd, **params))
+
+
+async def aread_csv(
+    path: str,
+    /,
+    *,
+    executor: Executor = None,
+    batchsize: int = DFT_BATCHSIZE,
+    readahead: int = DFT_READAHEAD,
+    **kwargs,
+) -> AsyncIterator[RowDict]:
+    """Iterate asynchronously on rows of csv file, read in executor
+
+    Args:
+        path        : path to input
+        executor    : executor where file is read, in threads
+            None for default executor of running loop
+        batchsize, readahead: @see `aiterate`
+        **kwargs    : @see `~olutils.storing.read_csv`
+            delimiter, usecols, schema, chunksize, ...
+
+    Raise:
+        (ValueError): executor is a ProcessPoolExecutor
+    """
+    _check_thread_executor(executor)
+    loop = asyncio.get_running_loop()
+    rows = await loop.run_in_executor(executor, partial(read_csv, path, **kwargs))
+    arows = aiterate(
+        rows, executor=executor, batchsize=batchsize, readahead=readahead
+    )
+    try:
+        async for row in arows:
+            yield row
+    finally:
+        await arows.aclose()
@@ -0,0 +1,218 @@
+"""Load and save many files concurrently
+
+Files are processed by a pool of threads (dft, best for I/O bound work) or of
+processes (best for parsing bound work), a bounded number of files being
+processed and not consumed at once. Errors are collected per file instead of
+being raised, including errors of the pool itself (e.g. pickling errors of a
+pool of processes) and glob patterns matching no file.
+
+Example:
+    >> results = load_many("configs/*.json", workers=16)
+    >> configs = {res.path: res.value for res in results if res.error is None}
+"""
+import glob
+from collections.abc import Iterator as IteratorABC, Mapping
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Iterable, Iterator, List, NamedTuple, Tuple, Union
+
+from .functions import load, save
+from .parallel import pool_map
+
+DFT_WORKERS = 8
+EXECUTORS = {"thread": ThreadPoolExecutor, "process": ProcessPoolExecutor}
+
+
+class BulkResult(NamedTuple):
+    """Result of processing one file"""
+
+    path: str
+    value: Any = None  # Loaded object (None when saving or on error)
+    error: Exception = None  # Error raised while processing file, if any
+
+
+def expand_paths(paths: Union[str, Iterable[str]], /) -> List[str]:
+    """Return list of paths, glob patterns being expanded (sorted, recursive)
+
+    Patterns matching no file are kept as is (loading them fails)
+    """
+    if isinstance(paths, str):
+        paths = [paths]
+    expanded = []
+    for path in paths:
+        matches = glob.glob(path, recursive=True) if glob.has_magic(path) else []
+        expanded += sorted(matches) or [path]
+    return expanded
+
+
+def _load_error(args: Tuple[str, str, dict], error: Exception) -> BulkResult:
+    """Return result of file whose loading task failed in pool"""
+    return BulkResult(args[0], error=error)
+
+
+def _save_error(args: Tuple[Any, str, str, dict], error: Exception) -> BulkResult:
+    """Return result of object whose saving task failed in pool"""
+    return BulkResult(args[1], error=error)
+
+
+def _load_one(args: Tuple[str, str, dict]) -> BulkResult:
+    """Return result of loading file (iterators are read in lists)"""
+    path, mthd, kwargs = args
+    try:
+        value = load(path, mthd, **kwargs)
+        if isinstance(value, IteratorABC):
+            value = list(value)
+    except Exception as error:  # pylint: disable=broad-except
+        return BulkResult(path, error=error)
+    return BulkResult(path, value)
+
+
+def _save_one(args: Tuple[Any, str, str, dict]) -> BulkResult:
+    """Return result of saving object"""
+    obj, path, mthd, params = args
+    try:
+        save(obj, path, mthd, **params)
+    except Exception as error:  # pylint: disable=broad-except
+        return BulkResult(path, error=error)
+    return BulkResult(path)
+
+
+def _run(
+    func: Callable,
+    tasks: Iterable,
+    /,
+    *,
+    on_error: Callable,
+    executor: Union[str, Executor],
+    workers: Union[int, None],
+    ordered: bool,
+) -> Union[List[BulkResult], Iterator[BulkResult]]:
+    """Return results of func over tasks, computed by executor
+
+    Raise:
+        (ValueError): unknown executor, or workers of given executor unknown
+    """
+    if isinstance(executor, Executor):
+        if workers is None:
+            workers = getattr(executor, "_max_workers", None)
+        if workers is None:
+            raise ValueError(
+                f"workers must be given with executor {executor!r}"
+                " (number of workers unknown)"
+            )
+        results = pool_map(
+            func,
+            tasks,
+            executor,
+            ordered=ordered,
+            max_pending=2 * workers,
+            on_error=on_error,
+        )
+        return list(results) if ordered else results
+    if workers is None:
+        workers = DFT_WORKERS
+    try:
+        executor_cls = EXECUTORS[executor]
+    except KeyError:
+        raise ValueError(
+            f"executor must be an Executor or one of {list(EXECUTORS)},"
+            f" got {executor!r}"
+        ) from None
+
+    def result_iterator():
+        """Iterate results, within pool of workers"""
+        with executor_cls(workers) as pool:
+            yield from pool_map(
+                func,
+                tasks,
+                pool,
+                ordered=ordered,
+                max_pending=2 * workers,
+                on_error=on_error,
+            )
+
+    return list(result_iterator()) if ordered else result_iterator()
+
+
+def load_many(
+    paths: Union[str, Iterable[str]],
+    /,
+    mthd: str = None,
+    *,
+    executor: Union[str, Executor] = "thread",
+    workers: int = None,
+    ordered: bool = True,
+    **kwargs,
+) -> Union[List[BulkResult], Iterator[BulkResult]]:
+    """Load objects of many files concurrently
+
+    Args:
+        paths       : paths (or glob patterns) of files to load
+        mthd        : @see `~olutils.storing.load` (dft is guessed per path)
+        executor    : pool running loads
+            "thread"    > pool of threads (dft)
+            "process"   > pool of processes (kwargs must be picklable)
+            (Executor)  > given executor
+        workers     : number of workers of pool (max files processed at once
+            and not consumed is twice this number)
+            None for DFT_WORKERS, or workers of given executor
+        ordered     : return list of results in order of paths
+            False means iterator on results in order of completion
+        **kwargs    : @see `~olutils.storing.load`
+            iterators returned by load (csv rows, ...) are read in lists
+
+    Returns:
+        result per file, @see `BulkResult`
+            errors raised loading a file are set to its result, not raised
+            a pattern matching no file has a FileNotFoundError result
+
+    Raise:
+        (ValueError): unknown executor, or workers of given executor unknown
+    """
+    tasks = ((path, mthd, kwargs) for path in expand_paths(paths))
+    return _run(
+        _load_one,
+        tasks,
+        on_error=_load_error,
+        executor=executor,
+        workers=workers,
+        ordered=ordered,
+    )
+
+
+def save_many(
+    objects: Union[Mapping, Iterable[Tuple[str, Any]]],
+    /,
+    mthd: str = None,
+    *,
+    executor: Union[str, Executor] = "thread",
+    workers: int = None,
+    ordered: bool = True,
+    **params,
+) -> Union[List[BulkResult], Iterator[BulkResult]]:
+    """Save many objects concurrently
+
+    Args:
+        objects     : objects to save by path, or (path, object) pairs
+        mthd        : @see `~olutils.storing.save` (dft is guessed per path)
+        executor, workers, ordered: @see `load_many`
+        **params    : @see `~olutils.storing.save`
+            atomic, fsync, ...
+
+    Returns:
+        result per file, @see `BulkResult`
+            errors raised saving an object are set to its result, not raised
+
+    Raise:
+        (ValueError): unknown executor, or workers of given executor unknown
+    """
+    if isinstance(objects, Mapping):
+        objects = objects.items()
+    tasks = ((obj, path, mthd, params) for path, obj in objects)
+    return _run(
+        _save_one,
+        tasks,
+        on_error=_save_error,
+        executor=executor,
+        workers=workers,
+        ordered=ordered,
+    )
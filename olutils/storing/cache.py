@@ -0,0 +1,189 @@
+"""In-process cache of loaded objects
+
+Objects are cached by (path, load parameters) and validated against file stat
+(inode, size and modification time) on each access: a file rewritten since
+it was loaded is loaded again.
+
+Example:
+    >> cache = LoadCache(max_bytes=64 * 1024 * 1024)
+    >> for _ in range(1000):
+    ..     config = load("config.json", cache=cache)  # Read once
+    >> cache.hits, cache.misses
+    (999, 1)
+"""
+import os
+import sys
+from collections import OrderedDict
+from collections.abc import Iterator as IteratorABC
+from copy import deepcopy
+from threading import Lock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Tuple
+
+import numpy as np
+
+DFT_MAX_BYTES = 256 * 1024 * 1024
+ACCESSES = ["shared", "copy", "readonly"]
+
+
+def sizeof(obj: Any, /) -> int:
+    """Return estimated number of bytes used by object (and its content)
+
+    Data of memory-mapped arrays is not counted (it is in page cache)
+    """
+    if isinstance(obj, np.memmap):
+        return sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        return max(sys.getsizeof(obj), obj.nbytes)
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(sizeof(key) + sizeof(value) for key, value in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(sizeof(elem) for elem in obj)
+    return size
+
+
+def freeze(obj: Any, /) -> Any:
+    """Return read-only version of object
+
+    Dictionaries are read-only mappings, lists tuples, sets frozensets and
+    numpy arrays read-only views.
+    """
+    if isinstance(obj, np.ndarray):
+        view = obj.view()
+        view.flags.writeable = False
+        return view
+    if isinstance(obj, dict):
+        return MappingProxyType({key: freeze(value) for key, value in obj.items()})
+    if isinstance(obj, (list, tuple)):
+        return tuple(freeze(elem) for elem in obj)
+    if isinstance(obj, set):
+        return frozenset(obj)
+    return obj
+
+
+def is_resource(obj: Any, /) -> bool:
+    """Return if object holds resources: iterator, closeable or context manager
+
+    Such objects (csv rows, npz archives, ...) are bound to one consumer and
+    must not be shared by a cache.
+    """
+    return (
+        isinstance(obj, IteratorABC)
+        or callable(getattr(obj, "close", None))
+        or hasattr(obj, "__exit__")
+    )
+
+
+def make_key(params: Dict[str, Any], /) -> Hashable:
+    """Return hashable key of parameters (repr of unhashable values)"""
+    items = []
+    for name, value in sorted(params.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        items.append((name, value))
+    return tuple(items)
+
+
+class LoadCache:
+    """LRU cache of loaded objects, bounded in bytes, validated by file stat
+
+    Loaded resources (csv rows, npz archives, ...) are never cached, @see
+    `is_resource`. Objects are validated
+    by inode, size and modification time (in ns) of file: a rewrite keeping
+    all of them is not detected.
+    """
+
+    def __init__(self, *, max_bytes: int = DFT_MAX_BYTES, access: str = "shared"):
+        """Initialize instance
+
+        Args:
+            max_bytes   : budget of cache in bytes (@see `sizeof`)
+                least recently used objects are evicted above budget
+            access      : how cached objects are returned
+                "shared"    > cached object itself (must not be modified)
+                "copy"      > deep copy of cached object
+                "readonly"  > read-only version of object (@see `freeze`)
+
+        Raise:
+            (ValueError): unknown access
+        """
+        if access not in ACCESSES:
+            raise ValueError(f"access must be one of {ACCESSES}, got {access!r}")
+        self.max_bytes = max_bytes
+        self.access = access
+        self.hits = 0
+        self.misses = 0
+        self.nbytes = 0
+        self._entries = OrderedDict()  # key -> (stat, obj, nbytes)
+        self._lock = Lock()
+
+    @staticmethod
+    def _stat(path: str, /) -> Tuple[int, int, int]:
+        """Return (inode, size, modification time) of file at path"""
+        stat = os.stat(path)
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _output(self, obj: Any, /) -> Any:
+        """Return cached object given access"""
+        return deepcopy(obj) if self.access == "copy" else obj
+
+    def get(self, path: str, /, params: Dict[str, Any], loader: Callable[[], Any]):
+        """Return object loaded from path with params, from cache if valid
+
+        Args:
+            path    : path of loaded file
+            params  : parameters of loading, part of cache key
+            loader  : function returning object when not in cache
+        """
+        path = os.path.abspath(path)
+        key = (path, make_key(params))
+        stat = self._stat(path)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == stat:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._output(entry[1])
+            self.misses += 1
+
+        obj = loader()
+        if is_resource(obj):
+            return obj
+        if self.access == "readonly":
+            obj = freeze(obj)
+        nbytes = sizeof(obj)
+        with self._lock:
+            self._pop(key)
+            if nbytes <= self.max_bytes:
+                self._entries[key] = (stat, obj, nbytes)
+                self.nbytes += nbytes
+                while self.nbytes > self.max_bytes:
+                    self._pop(next(iter(self._entries)))
+        return self._output(obj)
+
+    def _pop(self, key: Hashable, /):
+        """Remove entry of key, if any (lock must be held)"""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.nbytes -= entry[2]
+
+    def clear(self):
+        """Remove all cached objects (counters are kept)"""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(entries={len(self)}, nbytes={self.nbytes},"
+            f" hits={self.hits}, misses={self.misses})"
+        )
+
+
+LOAD_CACHE = LoadCache()  # Cache used by load(..., cache=True)
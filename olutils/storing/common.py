@@ -1,3 +1,14 @@
 """Common objects within storing module"""
+from olutils.os import strip_compression
 
 DFT_EOL = "\n"
+
+
+def path2mthd(path: str, /) -> str:
+    """Return storing method given path extension (ignoring compression suffix)
+
+    Example:
+        >>> path2mthd("data.csv.gz")
+        'csv'
+    """
+    return strip_compression(path).split(".")[-1]
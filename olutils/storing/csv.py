@@ -11,14 +11,74 @@ Also, because it is based on csv library, it has same limitations :
 
 @see https://stackoverflow.com/questions/11379300/csv-reader-behavior-with-none-and-empty-string
 """
-from csv import DictReader, DictWriter
-from typing import Iterable, List
+from csv import DictWriter, reader as csv_reader, writer as csv_writer
+from itertools import chain, islice
+from operator import itemgetter
+from typing import Callable, Dict, Iterable, List, Sequence, Union
 
-from olutils.typing import RowDict
-from olutils.os import sopen
+import numpy as np
+
+from olutils.typing import ColumnDict, RowDict
+from olutils.os import copen, sopen
 from olutils.params import read_params
-from olutils.sequencing import countiter
+from olutils.sequencing import chunkiter, countiter
 from .common import DFT_EOL
+from .index import IndexedCsv
+from .schema import Schema, compile_converter, infer_schema, parse_column
+
+DFT_BUFFERING = 1024 * 1024  # Bytes
+DFT_CHUNKSIZE = 10000  # Rows
+
+
+def guess_delimiter(path: str, /, *, mode: str = "r", **kwargs) -> str:
+    """Return the common delimiter building more columns in first line of file
+
+    Args:
+        path    : path to file
+        mode    : mode to open file with
+        **kwargs: @see `~olutils.os.copen`
+            encoding, compression, ...
+
+    Raise:
+        (ValueError): no common delimiter found in first line
+    """
+    with copen(path, mode, **kwargs) as file:
+        line = file.readline()
+    delimiters = sorted(
+        [(delimiter, len(line.split(delimiter))) for delimiter in ",;\t"],
+        key=lambda i: i[1],
+        reverse=True,
+    )
+    delimiter, n_cols = delimiters[0]
+    if n_cols <= 1:
+        raise ValueError(f"Could not find delimiter of '{path}'")
+    return delimiter
+
+
+def rows2columns(
+    rows: List[List[str]],
+    fieldnames: List[str],
+    /,
+    dtypes: Dict[str, Union[str, type, np.dtype]] = None,
+) -> ColumnDict:
+    """Return columns of rows as numpy arrays
+
+    Args:
+        rows        : rows as lists of values (short rows are completed with '')
+        fieldnames  : name of each column
+        dtypes      : (field, dtype) items to build columns with (dft is str)
+    """
+    dtypes = {} if dtypes is None else dtypes
+    n_cols = len(fieldnames)
+    rows = [
+        row if len(row) == n_cols else (row + [""] * n_cols)[:n_cols]
+        for row in rows
+    ]
+    columns = zip(*rows) if rows else [()] * n_cols
+    return {
+        field: np.array(column, dtype=dtypes.get(field, str))
+        for field, column in zip(fieldnames, columns)
+    }
 
 
 def read_csv(
@@ -28,9 +88,24 @@ def read_csv(
     delimiter: str = "smart",
     mode: str = None,
     encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    usecols: List[str] = None,
+    where: Union[Callable[[List[str]], bool], Dict[str, Callable]] = None,
+    nrows: int = None,
+    skiprows: int = 0,
+    schema: Union[Schema, str] = None,
+    infer_rows: int = 100,
+    chunksize: int = None,
+    dtypes: Dict[str, Union[str, type, np.dtype]] = None,
+    index: bool = False,
     **kwargs,
-) -> Iterable[RowDict]:
-    """Return csv.DictReader iterator on file at path (can display row count)
+) -> Union[Iterable[RowDict], Iterable[ColumnDict], IndexedCsv]:
+    """Return iterator on rows of file at path (can display row count)
+
+    Rows are read as lists by csv.reader, filtered and projected before any
+    dictionary is built. Without usecols, rows are the same as the ones of
+    csv.DictReader (missing values are None, extra ones are listed at None).
 
     Args:
         path            : path to input
@@ -38,37 +113,183 @@ def read_csv(
             "smart" > try common delimiters and use the one building more cols
         mode            : mode to open file with (default is 'r')
         encoding        : encoding of file
+        compression     : @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are decompressed given suffix
+        buffering       : @see `~olutils.os.copen`
+        usecols         : columns to read (dft is all columns of file)
+        where           : predicate rows must satisfy to be read
+            (callable)  > called with raw row (list of all values, missing
+                ones being None, or '' in batch mode)
+            (dict)      > (column, predicate on value) items
+        nrows           : max number of rows to read from file (after skiprows)
+            rows not satisfying where predicate are counted
+        skiprows        : number of rows to skip after header
+        schema          : (column, type) items to convert values of rows with
+            @see `~olutils.storing.schema.SCHEMA_TYPES` for available types
+            "infer" > infer types from first rows of file
+            empty values are None (NaN/NaT in batch mode), extra ones ignored
+        infer_rows      : number of rows to infer schema from
+        chunksize       : batch mode, iterate chunks of chunksize rows
+            each chunk is a dict of numpy columns (@see `rows2columns`)
+        dtypes          : (field, dtype) items for columns in batch mode
+            missing fields are read as str (or parsed given schema)
+        index           : return sequence of rows with random access
+            @see `~olutils.storing.index.IndexedCsv`
+            index of records is stored next to file (built if not up-to-date)
+            only delimiter, encoding, usecols and schema options are used
+            where, nrows, skiprows and chunksize can't be used
         **kwargs        : @see `~olutils.countiter`
-            vbatch      nb of lines b/w progress displays (dft=0, no display)
+            vbatch      nb of lines (chunks in batch mode) b/w progress
+                displays (dft=0, no display)
             start       first index of progress counter (dft=1)
+
+    Raise:
+        (ValueError): delimiter can't be guessed, unknown column in usecols,
+            where or schema, chunksize is not positive, compressed file is
+            indexed or index is used with where, nrows, skiprows or chunksize
     """
+    if index:
+        unsupported = [
+            name
+            for name, value, default in [
+                ("where", where, None),
+                ("nrows", nrows, None),
+                ("skiprows", skiprows, 0),
+                ("chunksize", chunksize, None),
+            ]
+            if value != default
+        ]
+        if unsupported:
+            raise ValueError(
+                f"index can't be used with {', '.join(unsupported)}"
+            )
     mode = "r" if mode is None else mode
+    o_kwargs = {  # copen kwargs
+        "encoding": encoding,
+        "compression": compression,
+        "buffering": buffering,
+    }
     if delimiter == "smart":
-        with open(path, mode, encoding=encoding) as file:
-            line = file.readline()
-        delimiters = sorted(
-            [(delimiter, len(line.split(delimiter))) for delimiter in ",;\t"],
-            key=lambda i: i[1],
-            reverse=True,
+        delimiter = guess_delimiter(path, mode=mode, **o_kwargs)
+    if chunksize is not None and chunksize <= 0:
+        raise ValueError(f"chunksize must be strictly positive, got {chunksize}")
+    if schema == "infer":
+        schema = infer_schema(read_csv(
+            path,
+            delimiter=delimiter,
+            mode=mode,
+            usecols=usecols,
+            nrows=infer_rows,
+            **o_kwargs,
+        ))
+    if usecols is not None or isinstance(where, dict) or schema:
+        with copen(path, mode, **o_kwargs) as buffer:
+            fieldnames = next(filter(None, csv_reader(buffer, delimiter=delimiter)), [])
+        missing = [
+            col
+            for col in chain(usecols or [], where or [], schema or [])
+            if col not in fieldnames
+        ]
+        if missing:
+            raise ValueError(
+                f"Unknown columns in '{path}': {', '.join(map(repr, missing))}"
+            )
+    if index:
+        return IndexedCsv(
+            path,
+            delimiter=delimiter,
+            encoding=encoding,
+            usecols=usecols,
+            schema=schema,
         )
-        delimiter, n_cols = delimiters[0]
-        if n_cols <= 1:
-            raise ValueError(f"Could not find delimiter of '{path}'")
+
+    def record_iterator(buffer, restval):
+        """Return fieldnames and iterator on filtered raw rows of buffer"""
+        reader = filter(None, csv_reader(buffer, delimiter=delimiter))
+        fieldnames = next(reader, [])
+        n_cols = len(fieldnames)
+        if skiprows or nrows is not None:
+            stop = None if nrows is None else skiprows + nrows
+            reader = islice(reader, skiprows, stop)
+
+        if isinstance(where, dict):
+            checks = [(fieldnames.index(col), func) for col, func in where.items()]
+
+            def predicate(row):
+                return all(func(row[index]) for index, func in checks)
+
+        else:
+            predicate = where
+
+        def records():
+            """Iterate completed raw rows satisfying predicate"""
+            for row in reader:
+                if len(row) < n_cols:
+                    row += [restval] * (n_cols - len(row))
+                if predicate is None or predicate(row):
+                    yield row
+
+        return fieldnames, records()
 
     def row_iterator(filepath):
         """Iterate row of file at path"""
-        with open(filepath, mode, encoding=encoding) as buffer:
-            reader = DictReader(buffer, delimiter=delimiter)
-            for elem in countiter(reader, **kwargs):
+        with copen(filepath, mode, **o_kwargs) as buffer:
+            fieldnames, records = record_iterator(buffer, None)
+            n_cols = len(fieldnames)
+            if usecols is None and not schema:
+
+                def build(row):
+                    """Build row dictionary like csv.DictReader does"""
+                    elem = dict(zip(fieldnames, row))
+                    if len(row) > n_cols:
+                        elem[None] = row[n_cols:]
+                    return elem
+
+                rows = map(build, records)
+            else:
+                rows = map(compile_converter(fieldnames, schema, usecols), records)
+            for elem in countiter(rows, **kwargs):
+                yield elem
+
+    def chunk_iterator(filepath):
+        """Iterate chunks of rows of file at path as numpy columns"""
+        with copen(filepath, mode, **o_kwargs) as buffer:
+            fieldnames, records = record_iterator(buffer, "")
+            if not fieldnames:
+                return
+            if usecols is not None:
+                getter = itemgetter(*[fieldnames.index(col) for col in usecols])
+                records = (
+                    list(getter(row)) if len(usecols) > 1 else [getter(row)]
+                    for row in records
+                )
+                fieldnames = list(usecols)
+            parsers = {
+                col: ctype
+                for col, ctype in (schema or {}).items()
+                if col in fieldnames and col not in (dtypes or {})
+            }
+
+            def build(rows):
+                """Build columns from rows, parsing the ones in schema"""
+                columns = rows2columns(rows, fieldnames, dtypes=dtypes)
+                for col, ctype in parsers.items():
+                    columns[col] = parse_column(columns[col], ctype)
+                return columns
+
+            chunks = map(build, chunkiter(records, chunksize))
+            for elem in countiter(chunks, **kwargs):
                 yield elem
 
     kwargs["vbatch"] = kwargs.pop("vbatch", 0)
     kwargs["start"] = kwargs.pop("start", 1)
-    return row_iterator(path)
+    if chunksize is None:
+        return row_iterator(path)
+    return chunk_iterator(path)
 
 
 def write_csv(
-    rows: Iterable[RowDict],
+    rows: Union[Iterable[RowDict], Iterable[Sequence], ColumnDict],
     path: str,
     /,
     *,
@@ -76,17 +297,30 @@ def write_csv(
     header: List[str] = None,
     pretty: bool = False,
     encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    chunksize: int = DFT_CHUNKSIZE,
+    buffering: int = DFT_BUFFERING,
     **kwargs,
 ):
-    """ "Write a list of dictionaries to path
+    """ "Write a list of dictionaries (or of tuples, or numpy columns) to path
 
     Args:
-        rows        : rows (dictionaries sharing same keys)
+        rows        : rows to write, one of
+            dictionaries sharing same keys
+            tuples / lists of values ordered as fieldnames (fast path)
+            dict of numpy columns (or lists) sharing same length (fast path)
         path        : path to output (path tree is auto-generated)
-        fieldnames  (n-list of str) : from rows to use (dft is row keys)
+        fieldnames  (n-list of str) : from rows to use
+            dft is row keys (column keys), or header for tuple rows
         header      (n-list)        : column names regarding field names
         pretty      : pretty frmt header
         encoding    : encoding to open output
+        compression : @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are compressed given suffix
+        compresslevel: @see `~olutils.os.copen`
+        chunksize   : number of rows converted from columns at once
+        buffering   : size of file write buffer in bytes
         **kwargs: @see `csv.DictWriter`
             delimiter       dft is ","
             lineterminator  dft is DFT_EOL
@@ -94,7 +328,9 @@ def write_csv(
             extrasaction    dft is "ignore" additional fields in rows
 
     Raise:
-        (ValueError): empty rows and fieldnames is None
+        (ValueError): empty rows and fieldnames is None, or tuple rows and
+            neither fieldnames nor header is given, or columns do not have
+            same length
         (TypeError) : first row is not a dictionary and fieldnames is None
         else same behavior than csv.DictWriter
     """
@@ -108,18 +344,46 @@ def write_csv(
         },
         safe=False,
     )
-    i_rows = iter(rows)
+    w_kwargs = {key: kwargs[key] for key in ["delimiter", "lineterminator"]}
 
-    # Read fieldnames
-    if fieldnames is None:
+    # Read fieldnames and rows to write
+    if isinstance(rows, dict) and rows and all(
+        isinstance(column, (np.ndarray, list, tuple)) for column in rows.values()
+    ):
+        fieldnames = list(rows.keys()) if fieldnames is None else fieldnames
+        columns = [rows[field] for field in fieldnames]
+        size = len(columns[0]) if columns else 0
+        if any(len(column) != size for column in columns):
+            raise ValueError("Columns must have same length")
+        values = chain.from_iterable(
+            zip(*[
+                column[i:i + chunksize].tolist()
+                if isinstance(column, np.ndarray)
+                else column[i:i + chunksize]
+                for column in columns
+            ])
+            for i in range(0, size, chunksize)
+        )
+        dict_rows = False
+    else:
+        i_rows = iter(rows)
         try:
             fstrow = next(i_rows)
         except StopIteration:
-            raise ValueError("Can't deduce fieldnames if rows is empty") from None
-        try:
-            fieldnames = list(fstrow.keys())
-        except AttributeError:
-            raise TypeError("rows must be an iterable on dictionaries") from None
+            if fieldnames is None:
+                raise ValueError("Can't deduce fieldnames if rows is empty") from None
+            fstrow = None
+        dict_rows = not isinstance(fstrow, (list, tuple))
+        if not dict_rows and fieldnames is None:
+            if header is None:
+                raise ValueError("fieldnames or header required for tuple rows")
+            fieldnames = header
+        if fieldnames is None:
+            try:
+                fieldnames = list(fstrow.keys())
+            except AttributeError:
+                raise TypeError("rows must be an iterable on dictionaries") from None
+        values = i_rows if fstrow is None else chain([fstrow], i_rows)
 
     # Read and compute header
     header = fieldnames if header is None else header
@@ -133,8 +397,19 @@ def write_csv(
         ]
 
     # Write file
-    with sopen(path, "w+", encoding=encoding) as file:
-        # TODO : find a convenient way to raise error when field is missing
-        writer = DictWriter(file, fieldnames=fieldnames, **kwargs)
+    with sopen(
+        path,
+        "w+",
+        encoding=encoding,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
         file.write(kwargs["delimiter"].join(header) + kwargs["lineterminator"])
-        writer.writerows(rows)
+        if dict_rows:
+            # TODO : find a convenient way to raise error when field is missing
+            writer = DictWriter(file, fieldnames=fieldnames, **kwargs)
+        else:
+            writer = csv_writer(file, **w_kwargs)
+        for chunk in chunkiter(values, chunksize):
+            writer.writerows(chunk)
@@ -0,0 +1,201 @@
+"""Tools to make file writes atomic and durable
+
+- atomic: content is written to a temporary file in the same directory, then
+renamed to target path, so that readers see either old or new content
+- durable: content is flushed to disk (fsync) once written
+
+Flushing to disk is slow, hence GroupCommit to flush many files at once. With
+atomic writes, temporary files are renamed on commit once flushed, so that a
+crash never leaves a target renamed before its content is on disk.
+"""
+import os
+from contextlib import contextmanager
+from threading import Lock, Timer
+from typing import Iterable, Iterator, Union
+from uuid import uuid4
+
+from olutils.typing import Number
+
+
+def fsync_path(path: str, /):
+    """Flush file (or directory) at path to disk
+
+    Directories can't be flushed on some platforms (Windows): it is skipped
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except PermissionError:
+        if os.path.isdir(path):
+            return
+        raise
+    try:
+        os.fsync(fd)
+    except OSError:
+        if not os.path.isdir(path):
+            raise
+    finally:
+        os.close(fd)
+
+
+def fsync_paths(paths: Iterable[str], /):
+    """Flush files at paths, then their directories (each one once)"""
+    directories = set()
+    for path in paths:
+        fsync_path(path)
+        directories.add(os.path.dirname(os.path.abspath(path)))
+    for directory in directories:
+        fsync_path(directory)
+
+
+class GroupCommit:
+    """Batch flushes to disk of many files
+
+    Paths added are flushed on commit, which happens when max_pending paths
+    are waiting, after delay seconds since first path waiting (if given), or
+    when leaving context. On commit, files are flushed first, then renamed to
+    their target (if any), then their directories are flushed.
+
+    An error raised by a delayed commit (run in a timer thread) is raised by
+    the next call to add or commit (or when leaving context).
+
+    Example:
+        >> with GroupCommit() as commit:
+        ..     for i, obj in enumerate(objects):
+        ..         save(obj, f"obj_{i}.json", atomic=True, fsync=commit)
+    """
+
+    def __init__(self, *, max_pending: int = 256, delay: Number = None):
+        """Initialize instance
+
+        Args:
+            max_pending : max number of paths waiting for commit
+            delay       : max number of seconds a path waits for commit
+                None means no time limit
+        """
+        self.max_pending = max_pending
+        self.delay = delay
+        self.commits = 0  # Number of commits with at least one path flushed
+        self._pending = []
+        self._lock = Lock()
+        self._timer = None
+        self._error = None  # Error raised by delayed commit, not raised yet
+
+    @property
+    def pending(self) -> int:
+        """Number of paths waiting for commit"""
+        return len(self._pending)
+
+    def _raise_error(self):
+        """Raise error of delayed commit, if any (lock must be held)"""
+        if self._error is not None:
+            error, self._error = self._error, None
+            raise error
+
+    def _delayed_commit(self):
+        """Commit, keeping error to raise it in thread of caller"""
+        try:
+            self.commit()
+        except BaseException as error:  # pylint: disable=broad-except
+            with self._lock:
+                self._error = error
+
+    def add(self, path: str, /, target: str = None):
+        """Add path to flush on next commit
+
+        Args:
+            path    : path of file to flush
+            target  : path to rename file to once flushed (None to keep it)
+
+        Raise:
+            error raised by last delayed commit (path is not added)
+        """
+        with self._lock:
+            self._raise_error()
+            self._pending.append((path, target))
+            full = len(self._pending) >= self.max_pending
+            if not full and self.delay is not None and self._timer is None:
+                self._timer = Timer(self.delay, self._delayed_commit)
+                self._timer.daemon = True
+                self._timer.start()
+        if full:
+            self.commit()
+
+    def commit(self):
+        """Flush waiting files, rename them to their target, flush directories
+
+        Files not renamed yet are removed if an error is raised
+
+        Raise:
+            error raised by last delayed commit, or by this commit
+        """
+        with self._lock:
+            self._raise_error()
+            entries, self._pending = list(dict.fromkeys(self._pending)), []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if not entries:
+                return
+            renamed = 0
+            try:
+                for path, _ in entries:
+                    fsync_path(path)
+                for path, target in entries:
+                    if target is not None:
+                        os.replace(path, target)
+                    renamed += 1
+            except BaseException:
+                for path, target in entries[renamed:]:
+                    if target is not None and os.path.exists(path):
+                        os.remove(path)
+                raise
+            directories = dict.fromkeys(
+                os.path.dirname(os.path.abspath(target or path))
+                for path, target in entries
+            )
+            for directory in directories:
+                fsync_path(directory)
+            self.commits += 1
+
+    def __enter__(self) -> "GroupCommit":
+        return self
+
+    def __exit__(self, *args):
+        self.commit()
+
+
+def tmp_sibling(path: str, /) -> str:
+    """Return path to a temporary file in the same directory as path"""
+    directory, name = os.path.split(path)
+    return os.path.join(directory, f".{name}.{uuid4().hex[:12]}.tmp")
+
+
+@contextmanager
+def atomic_path(
+    path: str, /, *, fsync: Union[bool, GroupCommit] = False
+) -> Iterator[str]:
+    """Yield temporary path to write to, renamed to path when leaving context
+
+    Temporary file is removed if an error is raised within context
+
+    Args:
+        path    : target path
+        fsync   : flush file to disk before renaming it and directory after
+            (GroupCommit) > file is flushed, renamed to path and directory
+                flushed on commit: path is updated on commit only
+    """
+    tmp_path = tmp_sibling(path)
+    try:
+        yield tmp_path
+        if isinstance(fsync, GroupCommit):
+            fsync.add(tmp_path, target=path)
+            return
+        if fsync:
+            fsync_path(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if fsync:
+        fsync_path(os.path.dirname(os.path.abspath(path)))
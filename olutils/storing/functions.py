@@ -1,13 +1,11 @@
 """General functions for object saving and loading."""
-import json
 import os
-import pickle
-from typing import Any
+from typing import Any, Union
 
-from olutils.os import sopen
-from olutils.params import read_params
-from .csv import read_csv, write_csv
-from .txt import read_txt, write_txt
+from olutils.os import get_compression
+from .cache import LOAD_CACHE, LoadCache
+from .durability import GroupCommit, atomic_path, fsync_paths
+from .registry import get_format, path2format
 
 
 def load(
@@ -17,6 +15,10 @@ def load(
     *,
     mode: str = None,
     encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    stream: bool = False,
+    cache: Union[bool, LoadCache] = False,
     **kwargs,
 ) -> Any:
     """Load object at path given a method
@@ -25,8 +27,14 @@ def load(
         path: path where object is stored
         mthd: method of storing
             None        > catch method from path extension
+                compression suffix is ignored (data.csv.gz is csv)
+            other methods can be registered
+                @see `~olutils.storing.registry.register_format`
             'csv'       > return iterable on rows
             'json'      > return object using json loading library
+            'jsonl'     > return iterable on records (one per line)
+            'npy'       > return array (memory-mapped by default)
+            'npz'       > return lazy mapping of arrays (memory-mapped by default)
             'pickle'    > return object using pickle loading method
             'txt'       > return content of text file
         mode: mode to open file with
@@ -35,35 +43,48 @@ def load(
             None for default
             'utf-8' for classic Linux encoding
             'utf-8-sig' for classic windows encoding
+        compression: @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are decompressed given suffix
+        buffering: @see `~olutils.os.copen`
+        stream: return an iterator on elements of stored object (rows, lines)
+            requires method to have a streamer
+        cache: return object from cache if file didn't change since loaded
+            True        > use shared cache of module (@see `cache.LOAD_CACHE`)
+            (LoadCache) > use given cache
+            iterators and closeable objects (csv rows, npz, ...) are never cached
         **kwargs: available kwargs depend on mthd value
             'csv'       > @see `~olutils.storing.read_csv`
                 delimiter, ...
             'json'      > @see `json.load`
-            'pickle'    > @see `pickle.load`
-            'txt'       > @see `~olutils.storing.write_txt`
+                with stream, @see `~olutils.storing.json.iter_json`
+            'jsonl'     > @see `~olutils.storing.read_jsonl`
+                vbatch, start
+            'npy', 'npz'> @see `~olutils.storing.read_npy`
+                mmap_mode, allow_pickle
+            'pickle'    > @see `~olutils.storing.read_pickle`
+                mmap_mode (for out-of-band buffers), ...
+            'txt'       > @see `~olutils.storing.read_txt`
                 rtype, w_eol, f_eol
 
     Raise:
-        (ValueError): unknown method
+        (ValueError): unknown method, or stream and method has no streamer
     """
-    if mthd is None:
-        mthd = path.split(".")[-1]
-
-    if mthd == "csv":
-        res = read_csv(path, mode=mode, encoding=encoding, **kwargs)
-    elif mthd == "json":
-        mode = "r" if mode is None else mode
-        with open(path, mode, encoding=encoding) as file:
-            res = json.load(file, **kwargs)
-    elif mthd == "pickle":
-        mode = "rb" if mode is None else mode
-        with open(path, mode, encoding=encoding) as file:
-            res = pickle.load(file, **kwargs)
-    elif mthd == "txt":
-        res = read_txt(path, mode=mode, encoding=encoding, **kwargs)
-    else:
-        raise ValueError(f"Unknown mthd '{mthd}'")
-    return res
+    fmt = path2format(path) if mthd is None else get_format(mthd)
+    hook = fmt.streamer if stream else fmt.loader
+    params = {
+        "mode": mode,
+        "encoding": encoding,
+        "compression": compression,
+        "buffering": buffering,
+        **kwargs,
+    }
+    if cache is True:
+        cache = LOAD_CACHE
+    if isinstance(cache, LoadCache) and not stream:
+        return cache.get(
+            path, {"mthd": fmt.name, **params}, lambda: hook(path, **params)
+        )
+    return hook(path, **params)
 
 
 def save(
@@ -73,6 +94,11 @@ def save(
     mthd: str = None,
     *,
     encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = None,
+    atomic: bool = False,
+    fsync: Union[bool, GroupCommit] = False,
     **params,
 ):
     """Save object to path given a method
@@ -82,20 +108,42 @@ def save(
         path: path where to save object
         mthd: method of storing
             None        > catch method from path extension
+                compression suffix is ignored (data.csv.gz is csv)
+            other methods can be registered
+                @see `~olutils.storing.registry.register_format`
             'csv'       > store as csv file (requires obj to be list of dict)
             'json'      > store as pretty json file (requires obj to be json like)
+                iterators are streamed as arrays
+            'jsonl'     > store iterable as compact json records, one per line
+            'npy'       > store array as numpy file
+            'npz'       > store dict (or list) of arrays as numpy archive
             'pickle'    > store as pickle file
             'txt'       > store as text file
         encoding: file encoding
             None for default
             'utf-8' for classic Linux encoding
             'utf-8-sig' for classic windows encoding
+        compression: @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are compressed given suffix
+        compresslevel: @see `~olutils.os.copen`
+        buffering: @see `~olutils.os.copen` (dft is method default)
+        atomic: write to a temporary file renamed to path once written
+            readers (and crashes) never see a partially written file
+        fsync: flush file (and its directory) to disk once written
+            (GroupCommit) > defer flush to next commit of given group
+                @see `~olutils.storing.durability.GroupCommit`
+                with atomic, path is updated on commit only
         **params: available kwargs depend on mthd value
             'csv'       > @see `~olutils.storing.write_csv`
                 fieldnames, header, pretty, ...
             'json'      > @see `json.dump`
                 encoding issues can be avoid using ensure_ascii=False
-            'pickle'    > @see `pickle.dump`
+            'jsonl'     > @see `~olutils.storing.write_jsonl`
+                chunksize, ensure_ascii, sort_keys, ...
+            'npz'       > @see `~olutils.storing.write_npz`
+                compressed
+            'pickle'    > @see `~olutils.storing.write_pickle`
+                oob (large buffers stored out-of-band), protocol, ...
             'txt'       > @see `~olutils.storing.write_txt`
                 has_eol, eol
 
@@ -104,26 +152,27 @@ def save(
     """
     directory = os.path.dirname(path)
 
-    if mthd is None:
-        mthd = path.split(".")[-1]
+    saver = (path2format(path) if mthd is None else get_format(mthd)).saver
+    o_kwargs = {  # copen kwargs
+        "encoding": encoding,
+        "compression": compression,
+        "compresslevel": compresslevel,
+    }
+    if buffering is not None:
+        o_kwargs["buffering"] = buffering
+
+    if compression == "infer":
+        o_kwargs["compression"] = get_compression(path)
 
     if directory and not os.path.exists(directory):
         os.makedirs(directory)
 
-    if mthd == "csv":
-        write_csv(__obj, path, encoding=encoding, **params)
-    elif mthd == "json":
-        with sopen(path, "w", encoding=encoding) as file:
-            params = read_params(
-                params,
-                {"sort_keys": True, "indent": 4, "separators": (",", ": ")},
-                safe=False,
-            )
-            json.dump(__obj, file, **params)
-    elif mthd == "pickle":
-        with sopen(path, "wb", encoding=encoding) as file:
-            pickle.dump(__obj, file, **params)
-    elif mthd == "txt":
-        write_txt(__obj, path, encoding=encoding, **params)
-    else:
-        raise ValueError(f"Unknown mthd '{mthd}'")
+    if atomic:
+        with atomic_path(path, fsync=fsync) as tmp_path:
+            saver(__obj, tmp_path, **o_kwargs, **params)
+        return
+    saver(__obj, path, **o_kwargs, **params)
+    if fsync is True:
+        fsync_paths([path])
+    elif fsync:
+        fsync.add(path)
@@ -0,0 +1,314 @@
+"""Random access into text and csv files through an index of line offsets
+
+The index (offsets of records in file) is built once and stored in a sidecar
+file next to the indexed one. It is rebuilt whenever size or modification
+time of the indexed file changes.
+
+For csv files, line terminators within quoted fields do not end records and
+blank lines are skipped. For text files, lines end as in text mode (universal
+newlines: '\n', '\r\n' or '\r').
+"""
+import os
+from abc import ABC, abstractmethod
+from csv import reader as csv_reader
+from io import StringIO
+from locale import getpreferredencoding
+from random import Random
+from typing import Any, Callable, Iterable, List, Tuple, Union
+
+import numpy as np
+
+from olutils.collection import identity
+from olutils.os import get_compression
+from olutils.typing import RowDict
+from .durability import atomic_path
+from .schema import Schema, compile_converter
+
+DFT_BATCH = 10000  # Records read at once when iterating an indexed file
+DFT_CHUNK_SIZE = 16 * 1024 * 1024  # Bytes read at once when building index
+SIDECAR_SUFFIX = ".idx"
+LF, CR = ord("\n"), ord("\r")
+
+
+def _skip_blank(path: str, offsets: np.ndarray, /) -> np.ndarray:
+    """Return offsets without starts of blank records (merged in previous)"""
+    if len(offsets) < 2:
+        return offsets
+    data = np.memmap(path, dtype=np.uint8, mode="r")
+    starts, lengths = offsets[:-1].astype(np.int64), np.diff(offsets)
+    last = len(data) - 1
+    first = data[np.minimum(starts, last)]
+    second = data[np.minimum(starts + 1, last)]
+    blank = (
+        ((lengths == 1) & ((first == LF) | (first == CR)))
+        | ((lengths == 2) & (first == CR) & (second == LF))
+    )
+    del data
+    return np.append(offsets[:-1][~blank], offsets[-1])
+
+
+def build_offsets(
+    path: str,
+    /,
+    *,
+    quotechar: str = None,
+    universal: bool = False,
+    skip_blank: bool = False,
+    chunk_size: int = DFT_CHUNK_SIZE,
+) -> np.ndarray:
+    """Return start offsets of records in file, followed by file size
+
+    Args:
+        path        : path to file
+        quotechar   : char quoting fields, whose line terminators are ignored
+            None means each line is a record
+        universal   : lines also end with '\r' alone (as in text mode)
+        skip_blank  : blank lines are not records (they end previous one)
+        chunk_size  : number of bytes read at once
+    """
+    starts = [np.zeros(1, dtype=np.uint64)]
+    quotebyte = None if quotechar is None else ord(quotechar)
+    parity = 0  # Parity of number of quotechar read so far
+    position = 0
+    with open(path, "rb") as file:
+        chunk = file.read(chunk_size)
+        while chunk:
+            while universal and chunk.endswith(b"\r"):  # Is it followed by \n ?
+                more = file.read(1)
+                if not more:
+                    break
+                chunk += more
+            data = np.frombuffer(chunk, dtype=np.uint8)
+            newlines = np.flatnonzero(data == LF)
+            if universal:
+                crs = np.flatnonzero(data == CR)
+                if len(crs):
+                    following = np.append(data, np.uint8(0))[crs + 1]
+                    newlines = np.union1d(newlines, crs[following != LF])
+            if quotebyte is not None:
+                quotes = np.flatnonzero(data == quotebyte)
+                counts = np.searchsorted(quotes, newlines) + parity
+                newlines = newlines[counts % 2 == 0]
+                parity = (parity + len(quotes)) % 2
+            starts.append(newlines.astype(np.uint64) + np.uint64(position + 1))
+            position += len(chunk)
+            chunk = file.read(chunk_size)
+    offsets = np.concatenate(starts)
+    if offsets[-1] != position:  # Last record has no line terminator
+        offsets = np.append(offsets, np.uint64(position))
+    if skip_blank:
+        offsets = _skip_blank(path, offsets)
+    return offsets
+
+
+class LineIndex:
+    """Offsets of records (lines) in a file, persisted in a sidecar file"""
+
+    def __init__(
+        self,
+        path: str,
+        /,
+        *,
+        quotechar: str = None,
+        universal: bool = False,
+        skip_blank: bool = False,
+        sidecar: str = None,
+        persist: bool = True,
+    ):
+        """Load index of file from sidecar, (re)building it if needed
+
+        Args:
+            path        : path to indexed file
+            quotechar, universal, skip_blank: @see `build_offsets`
+            sidecar     : path to index file (dft is path + SIDECAR_SUFFIX)
+            persist     : store index in sidecar when (re)built
+
+        Raise:
+            (ValueError): file is compressed
+        """
+        if get_compression(path) is not None:
+            raise ValueError(f"Can't index compressed file '{path}'")
+        self.path = path
+        self.params = {
+            "quotechar": quotechar,
+            "universal": universal,
+            "skip_blank": skip_blank,
+        }
+        self.sidecar = f"{path}{SIDECAR_SUFFIX}" if sidecar is None else sidecar
+        self.offsets = self._load()
+        if self.offsets is None:
+            self.offsets = build_offsets(path, **self.params)
+            if persist:
+                self._save()
+
+    def _stamp(self) -> np.ndarray:
+        """Return stamp (size, mtime) of indexed file"""
+        stat = os.stat(self.path)
+        return np.array([stat.st_size, stat.st_mtime_ns], dtype=np.int64)
+
+    def _load(self) -> Union[np.ndarray, None]:
+        """Return offsets stored in sidecar, None if missing or outdated"""
+        try:
+            with np.load(self.sidecar) as content:
+                if (
+                    np.array_equal(content["stamp"], self._stamp())
+                    and str(content["params"]) == repr(self.params)
+                ):
+                    return content["offsets"]
+        except (OSError, KeyError, ValueError):
+            pass
+        return None
+
+    def _save(self):
+        """Store offsets in sidecar (silently skipped if not writable)"""
+        try:
+            with atomic_path(self.sidecar) as tmp_path:
+                with open(tmp_path, "wb") as file:
+                    np.savez(
+                        file,
+                        offsets=self.offsets,
+                        stamp=self._stamp(),
+                        params=np.array(repr(self.params)),
+                    )
+        except OSError:
+            pass
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def span(self, start: int, stop: int = None, /) -> Tuple[int, int]:
+        """Return byte range of records b/w start and stop (dft is start + 1)"""
+        stop = start + 1 if stop is None else stop
+        return int(self.offsets[start]), int(self.offsets[stop])
+
+    def read(self, start: int, stop: int = None, /) -> bytes:
+        """Return bytes of records b/w start and stop (dft is start + 1)"""
+        beg, end = self.span(start, stop)
+        with open(self.path, "rb") as file:
+            file.seek(beg)
+            return file.read(end - beg)
+
+
+class IndexedFile(ABC):
+    """Sequence of records of an indexed file
+
+    Sub-classes implement `_parse` to convert decoded records
+    """
+
+    def __init__(self, index: LineIndex, /, *, encoding: str = None, first: int = 0):
+        """Initialize instance
+
+        Args:
+            index   : index of file
+            encoding: encoding of file
+            first   : number of records to hide at the beginning (header)
+        """
+        self.index = index
+        self.encoding = getpreferredencoding(False) if encoding is None else encoding
+        self.first = first
+
+    @abstractmethod
+    def _parse(self, text: str, /) -> List[Any]:
+        """Return records of decoded text"""
+
+    def _records(self, start: int, stop: int) -> List[Any]:
+        """Return records b/w start and stop (sequence indexes)"""
+        if stop <= start:
+            return []
+        data = self.index.read(start + self.first, stop + self.first)
+        return self._parse(data.decode(self.encoding))
+
+    def __len__(self) -> int:
+        return max(len(self.index) - self.first, 0)
+
+    def __getitem__(self, key: Union[int, slice]) -> Any:
+        indexes = range(len(self))[key]
+        if isinstance(indexes, int):
+            return self._records(indexes, indexes + 1)[0]
+        if indexes.step == 1:
+            return self._records(indexes.start, indexes.stop)
+        return [self._records(i, i + 1)[0] for i in indexes]
+
+    def __iter__(self) -> Iterable[Any]:
+        for start in range(0, len(self), DFT_BATCH):
+            yield from self._records(start, min(start + DFT_BATCH, len(self)))
+
+    def sample(self, k: int, /, seed: Any = None) -> List[Any]:
+        """Return k records chosen randomly (without replacement)"""
+        indexes = Random(seed).sample(range(len(self)), k)
+        return [self[i] for i in indexes]
+
+
+class IndexedTxt(IndexedFile):
+    """Sequence of lines of an indexed text file (line terminators are '\n')"""
+
+    def __init__(
+        self,
+        path: str,
+        /,
+        *,
+        line_conv: Callable[[str], str] = identity,
+        encoding: str = None,
+        **kwargs,
+    ):
+        """Initialize instance
+
+        Args:
+            path        : path to text file
+            line_conv   : function applied to each line
+            encoding    : encoding of file
+            **kwargs    : @see `LineIndex`
+                sidecar, persist
+        """
+        super().__init__(LineIndex(path, universal=True, **kwargs), encoding=encoding)
+        self.line_conv = line_conv
+
+    def _parse(self, text: str, /) -> List[str]:
+        return [self.line_conv(line) for line in StringIO(text, newline=None)]
+
+
+class IndexedCsv(IndexedFile):
+    """Sequence of rows of an indexed csv file (header and blank lines excluded)"""
+
+    def __init__(
+        self,
+        path: str,
+        /,
+        *,
+        delimiter: str = ",",
+        encoding: str = None,
+        usecols: List[str] = None,
+        schema: Schema = None,
+        **kwargs,
+    ):
+        """Initialize instance
+
+        Args:
+            path        : path to csv file
+            delimiter   : delimiter for columns
+            encoding    : encoding of file
+            usecols     : columns to read (dft is all columns of file)
+            schema      : @see `~olutils.storing.schema.compile_converter`
+            **kwargs    : @see `LineIndex`
+                sidecar, persist
+        """
+        super().__init__(
+            LineIndex(path, quotechar='"', skip_blank=True, **kwargs),
+            encoding=encoding,
+            first=1,
+        )
+        self.delimiter = delimiter
+        header = self.index.read(0).decode(self.encoding) if len(self.index) else ""
+        self.fieldnames = next(
+            filter(None, csv_reader(StringIO(header), delimiter=delimiter)), []
+        )
+        self.convert = compile_converter(self.fieldnames, schema, usecols)
+
+    def _parse(self, text: str, /) -> List[RowDict]:
+        n_cols = len(self.fieldnames)
+        rows = []
+        for row in filter(None, csv_reader(StringIO(text), delimiter=self.delimiter)):
+            if len(row) < n_cols:
+                row += [None] * (n_cols - len(row))
+            rows.append(self.convert(row))
+        return rows
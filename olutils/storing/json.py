@@ -0,0 +1,206 @@
+"""Functions to read and write json files
+
+Elements of top-level arrays can be streamed, for reading and writing, with
+memory bounded by the size of one element (and of read / write buffers).
+"""
+import json
+from collections.abc import Iterator as IteratorABC
+from json.decoder import WHITESPACE
+from typing import Any, Iterable, Iterator
+
+from olutils.os import copen, sopen
+from olutils.params import read_params
+from olutils.sequencing import countiter
+
+DFT_DUMP_PARAMS = {"sort_keys": True, "indent": 4, "separators": (",", ": ")}
+DFT_READ_SIZE = 1024 * 1024  # Characters read at once when streaming
+DFT_WRITE_SIZE = 1024 * 1024  # Characters written at once
+
+
+def read_json(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    **kwargs,
+) -> Any:
+    """Return object stored in json file at path
+
+    Args:
+        path    : path to read from
+        mode    : mode to open file with (default is 'r')
+        encoding, compression, buffering: @see `~olutils.os.copen`
+        **kwargs: @see `json.load`
+    """
+    mode = "r" if mode is None else mode
+    with copen(
+        path, mode, encoding=encoding, compression=compression, buffering=buffering
+    ) as file:
+        return json.load(file, **kwargs)
+
+
+def iter_json(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    read_size: int = DFT_READ_SIZE,
+    **kwargs,
+) -> Iterable[Any]:
+    """Return iterator on elements of top-level array of json file at path
+
+    File is read by chunks, elements being decoded as soon as they are
+    complete (@see `json.JSONDecoder.raw_decode`): memory used is bounded by
+    size of read chunks and of largest element.
+
+    Args:
+        path        : path to input
+        mode        : mode to open file with (default is 'r')
+        encoding, compression, buffering: @see `~olutils.os.copen`
+        read_size   : number of characters read at once
+            doubled while an element is not complete
+        **kwargs    : @see `~olutils.countiter`
+            vbatch      nb of elements b/w progress displays (dft=0, no display)
+            start       first index of progress counter (dft=1)
+
+    Raise:
+        (json.JSONDecodeError): file is not a json array (when read)
+    """
+    mode = "r" if mode is None else mode
+    kwargs["vbatch"] = kwargs.pop("vbatch", 0)
+    kwargs["start"] = kwargs.pop("start", 1)
+    decode = json.JSONDecoder().raw_decode
+
+    def element_iterator() -> Iterator[Any]:
+        """Iterate elements of array in file at path"""
+        with copen(
+            path, mode, encoding=encoding, compression=compression, buffering=buffering
+        ) as file:
+            buffer, pos, size, eof = "", 0, read_size, False
+
+            def peek() -> str:
+                """Return next non-blank character ('' at end of file)"""
+                nonlocal buffer, pos, eof
+                pos = WHITESPACE.match(buffer, pos).end()
+                while pos == len(buffer) and not eof:
+                    buffer = file.read(size)
+                    eof = not buffer
+                    pos = WHITESPACE.match(buffer, 0).end()
+                return buffer[pos:pos + 1]
+
+            def fail(expected: str):
+                """Raise decoding error at current position"""
+                raise json.JSONDecodeError(f"Expecting {expected}", buffer, pos)
+
+            if peek() != "[":
+                fail("'[' (top-level array)")
+            pos += 1
+            if peek() == "]":
+                return
+            while True:
+                while True:
+                    # Element is complete once followed by a separator
+                    # (a number can be cut anywhere: 1.5e3 read as 1.)
+                    pos = WHITESPACE.match(buffer, pos).end()
+                    try:
+                        elem, end = decode(buffer, pos)
+                        after = WHITESPACE.match(buffer, end).end()
+                        if eof or buffer[after:after + 1] in [",", "]"]:
+                            break
+                    except json.JSONDecodeError:
+                        if eof:
+                            raise
+                    chunk = file.read(size)
+                    eof = not chunk
+                    buffer, pos = buffer[pos:] + chunk, 0
+                    size *= 2
+                size, pos = read_size, end
+                yield elem
+                char = peek()
+                if char == "]":
+                    return
+                if char != ",":
+                    fail("',' or ']'")
+                pos += 1
+
+    return countiter(element_iterator(), **kwargs)
+
+
+def write_json(
+    obj: Any,
+    path: str,
+    /,
+    *,
+    encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
+    write_size: int = DFT_WRITE_SIZE,
+    **params,
+):
+    """Write object in a (pretty) json file
+
+    Object is encoded incrementally (@see `json.JSONEncoder.iterencode`) and
+    written by batches of write_size characters.
+
+    Args:
+        obj     : json like object to write
+            iterators (generators, ...) are written as arrays, one element at
+            a time
+        path    : path to write to
+        encoding, compression, compresslevel, buffering: @see `~olutils.os.copen`
+        write_size: number of characters written at once
+        **params: @see `json.dump` (dft are sorted keys and indent of 4)
+            encoding issues can be avoid using ensure_ascii=False
+    """
+    params = read_params(params, DFT_DUMP_PARAMS, safe=False)
+    encoder = params.pop("cls", None) or json.JSONEncoder
+    encoder = encoder(**params)
+    if isinstance(obj, IteratorABC):
+        chunks = iterencode_array(obj, encoder)
+    else:
+        chunks = encoder.iterencode(obj)
+
+    with sopen(
+        path,
+        "w",
+        encoding=encoding,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
+        batch, length = [], 0
+        for chunk in chunks:
+            batch.append(chunk)
+            length += len(chunk)
+            if length >= write_size:
+                file.write("".join(batch))
+                batch, length = [], 0
+        file.write("".join(batch))
+
+
+def iterencode_array(
+    elements: Iterable[Any], encoder: json.JSONEncoder, /
+) -> Iterator[str]:
+    """Iterate chunks of json array of elements, as encoder.iterencode does"""
+    indent = encoder.indent
+    if isinstance(indent, int):
+        indent = " " * indent
+    newline = "" if indent is None else "\n" + indent
+    yield "["
+    empty = True
+    for elem in elements:
+        yield newline if empty else encoder.item_separator + newline
+        empty = False
+        for chunk in encoder.iterencode(elem):
+            # Strings are escaped: line breaks are the ones of indentation
+            yield chunk if indent is None else chunk.replace("\n", newline)
+    if indent is not None and not empty:
+        yield "\n"
+    yield "]"
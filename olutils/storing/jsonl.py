@@ -0,0 +1,97 @@
+"""JSON Lines file reading and writing
+
+Each line of a JSON Lines file is a compact json record, so that records can
+be read and written one at a time, in constant memory.
+
+@see https://jsonlines.org/
+"""
+import json
+from typing import Any, Iterable
+
+from olutils.os import copen, sopen
+from olutils.sequencing import chunkiter, countiter
+from .csv import DFT_BUFFERING, DFT_CHUNKSIZE
+
+SEPARATORS = (",", ":")  # Compact separators
+
+
+def read_jsonl(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    **kwargs,
+) -> Iterable[Any]:
+    """Return iterator on records of JSON Lines file at path (can display count)
+
+    Blank lines are skipped.
+
+    Args:
+        path        : path to input
+        mode        : mode to open file with (default is 'r')
+        encoding, compression, buffering: @see `~olutils.os.copen`
+        **kwargs    : @see `~olutils.countiter`
+            vbatch      nb of records b/w progress displays (dft=0, no display)
+            start       first index of progress counter (dft=1)
+
+    Raise:
+        (json.JSONDecodeError): a line is not a json document (when read)
+    """
+    mode = "r" if mode is None else mode
+    kwargs["vbatch"] = kwargs.pop("vbatch", 0)
+    kwargs["start"] = kwargs.pop("start", 1)
+    decode = json.JSONDecoder().decode
+
+    def record_iterator():
+        """Iterate records of file at path"""
+        with copen(
+            path, mode, encoding=encoding, compression=compression, buffering=buffering
+        ) as file:
+            records = (decode(line) for line in file if not line.isspace())
+            for record in countiter(records, **kwargs):
+                yield record
+
+    return record_iterator()
+
+
+def write_jsonl(
+    records: Iterable[Any],
+    path: str,
+    /,
+    *,
+    encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    chunksize: int = DFT_CHUNKSIZE,
+    buffering: int = DFT_BUFFERING,
+    **kwargs,
+):
+    """Write records (any iterable) to a JSON Lines file, one compact record per line
+
+    Records are consumed and written chunk by chunk : memory used does not
+    depend on number of records.
+
+    Args:
+        records     : json like objects to write
+        path        : path to output (path tree is auto-generated)
+        encoding    : encoding to open output
+        compression, compresslevel: @see `~olutils.os.copen`
+        chunksize   : number of records written at once
+        buffering   : size of file write buffer in bytes
+        **kwargs    : @see `json.JSONEncoder`
+            ensure_ascii, sort_keys, default, ...
+    """
+    encode = json.JSONEncoder(separators=SEPARATORS, **kwargs).encode
+    with sopen(
+        path,
+        "w",
+        encoding=encoding,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
+        for chunk in chunkiter(records, chunksize):
+            file.write("".join([encode(record) + "\n" for record in chunk]))
@@ -0,0 +1,339 @@
+"""Disk-backed memoization of functions
+
+Results of decorated function are saved in a directory, one file per distinct
+call (arguments are hashed in stable keys), and loaded back on next calls,
+from any process. An index of results (index.json) keeps their size, creation
+and last access times, used to evict results given a max number of entries, a
+max size and a time to live.
+
+Processes using the same directory share results : index is updated under a
+lock file, results are saved atomically.
+
+Example:
+    >> @memoize("cache/features", max_bytes=10 * 1024 ** 3, mthd="npy")
+    .. def compute_features(dataset, scale=1.0):
+    ..     ...
+    >> features = compute_features("train")  # Computed and saved
+    >> features = compute_features("train", scale=1.0)  # Loaded
+"""
+import hashlib
+import inspect
+import os
+import pickle
+from contextlib import contextmanager
+from copy import deepcopy
+from functools import wraps
+from operator import itemgetter
+from time import time
+from typing import Any, Callable, Dict, Iterator
+from uuid import uuid4
+
+import numpy as np
+
+from olutils.sequencing import wait_until
+from olutils.typing import Number
+from .functions import load, save
+from .registry import get_format
+
+INDEX_NAME = "index.json"
+LOCK_NAME = ".lock"
+DFT_LOCK_TIMEOUT = 30  # Seconds to wait for lock
+DFT_LOCK_STALE = 120  # Seconds after which a lock is considered abandoned
+
+
+# --------------------------------------------------------------------------- #
+# Keys
+
+def _feed(digest, obj: Any, /):
+    """Feed digest with a canonical encoding of object"""
+    if obj is None or isinstance(obj, (bool, int, float, complex, str, bytes)):
+        digest.update(type(obj).__name__.encode() + b":" + repr(obj).encode() + b";")
+    elif isinstance(obj, (list, tuple)):
+        digest.update(f"{type(obj).__name__}[{len(obj)}]".encode())
+        for elem in obj:
+            _feed(digest, elem)
+    elif isinstance(obj, dict):
+        digest.update(f"dict[{len(obj)}]".encode())
+        for key_digest, value in sorted(
+            ((hash_args(key), value) for key, value in obj.items()),
+            key=itemgetter(0),
+        ):
+            digest.update(key_digest.encode())
+            _feed(digest, value)
+    elif isinstance(obj, (set, frozenset)):
+        digest.update(f"set[{len(obj)}]".encode())
+        for elem_digest in sorted(hash_args(elem) for elem in obj):
+            digest.update(elem_digest.encode())
+    elif isinstance(obj, np.ndarray):
+        array = np.ascontiguousarray(obj)
+        digest.update(f"ndarray[{array.dtype.str}{array.shape}]".encode())
+        if array.dtype.hasobject:
+            for elem in array.flat:
+                _feed(digest, elem)
+        else:
+            digest.update(memoryview(array).cast("B"))
+    else:
+        digest.update(b"pickle:" + pickle.dumps(obj, protocol=4) + b";")
+    return digest
+
+
+def hash_args(obj: Any, /) -> str:
+    """Return stable hash of object (hex digest)
+
+    Hash does not depend on process (no use of builtin hash), dict ordering
+    or set ordering. Objects others than builtins containers, scalars and
+    numpy arrays are hashed from their pickle.
+    """
+    return _feed(hashlib.sha256(), obj).hexdigest()
+
+
+# --------------------------------------------------------------------------- #
+# Lock
+
+@contextmanager
+def file_lock(
+    path: str,
+    /,
+    *,
+    timeout: Number = DFT_LOCK_TIMEOUT,
+    stale: Number = DFT_LOCK_STALE,
+) -> Iterator[None]:
+    """Hold lock, between processes, materialized by a file at path
+
+    Lock file contains a token unique to holder: it is released (removed) by
+    its holder only, a lock broken as stale and taken by another process is
+    left as is.
+
+    Args:
+        path    : path of lock file
+        timeout : max number of seconds to wait for lock
+        stale   : number of seconds after which lock is broken (holder is
+            considered dead)
+
+    Raise:
+        (TimeoutError): lock not acquired before timeout
+    """
+    token = uuid4().hex
+
+    def acquire() -> bool:
+        """Return whether lock file could be created"""
+        try:
+            fd = os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            try:
+                if time() - os.path.getmtime(path) > stale:
+                    os.remove(path)
+            except FileNotFoundError:
+                pass
+            return False
+        try:
+            os.write(fd, token.encode())
+        finally:
+            os.close(fd)
+        return True
+
+    wait_until(acquire, freq=0.01, timeout=timeout)
+    try:
+        yield
+    finally:
+        try:
+            with open(path) as file:
+                holder = file.read()
+        except FileNotFoundError:  # Broken as stale
+            holder = None
+        if holder == token:
+            os.remove(path)
+
+
+# --------------------------------------------------------------------------- #
+# Memoization
+
+class _Store:
+    """Results of a memoized function in a directory"""
+
+    def __init__(
+        self,
+        directory: str,
+        /,
+        *,
+        mthd: str,
+        max_entries: int,
+        max_bytes: int,
+        ttl: Number,
+        lock_timeout: Number,
+    ):
+        self.directory = directory
+        self.mthd = mthd
+        self.extension = get_format(mthd).extensions[0]
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.lock_timeout = lock_timeout
+        self.index_path = os.path.join(directory, INDEX_NAME)
+
+    @contextmanager
+    def index(self) -> Iterator[Dict[str, dict]]:
+        """Yield index (locked), saved when leaving context if changed"""
+        os.makedirs(self.directory, exist_ok=True)  # Other processes may create it
+        with file_lock(
+            os.path.join(self.directory, LOCK_NAME), timeout=self.lock_timeout
+        ):
+            try:
+                index = load(self.index_path, "json")
+            except FileNotFoundError:
+                index = {}
+            initial = deepcopy(index)
+            yield index
+            if index != initial:
+                save(index, self.index_path, "json", indent=None, atomic=True)
+
+    def path(self, key: str, /) -> str:
+        """Return path of result of key"""
+        return os.path.join(self.directory, f"{key}.{self.extension}")
+
+    def lookup(self, key: str, /) -> bool:
+        """Return whether a valid result of key exists (and mark it accessed)
+
+        Access time is only used to evict least recently used results: it is
+        not updated without max_entries nor max_bytes, so that index is not
+        saved on each hit.
+        """
+        now = time()
+        with self.index() as index:
+            entry = index.get(key)
+            if entry is None:
+                return False
+            if self.ttl is not None and now - entry["created"] > self.ttl:
+                self._remove(index, key)
+                return False
+            if self.max_entries is not None or self.max_bytes is not None:
+                entry["accessed"] = now
+            return True
+
+    def add(self, key: str, /):
+        """Add result of key (already saved) to index and evict results"""
+        now = time()
+        with self.index() as index:
+            index[key] = {
+                "size": os.path.getsize(self.path(key)),
+                "created": now,
+                "accessed": now,
+            }
+            self._evict(index, now)
+
+    def _evict(self, index: Dict[str, dict], now: float, /):
+        """Remove expired results, then least recently used ones above limits"""
+        if self.ttl is not None:
+            for key in [
+                key for key, entry in index.items()
+                if now - entry["created"] > self.ttl
+            ]:
+                self._remove(index, key)
+        keys = sorted(index, key=lambda key: index[key]["accessed"])
+        nbytes = sum(entry["size"] for entry in index.values())
+        for key in keys:
+            if (self.max_entries is None or len(index) <= self.max_entries) and (
+                self.max_bytes is None or nbytes <= self.max_bytes
+            ):
+                break
+            nbytes -= index[key]["size"]
+            self._remove(index, key)
+
+    def _remove(self, index: Dict[str, dict], key: str, /):
+        """Remove result of key from index and disk"""
+        del index[key]
+        try:
+            os.remove(self.path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        """Remove all results"""
+        with self.index() as index:
+            for key in list(index):
+                self._remove(index, key)
+
+    def info(self) -> Dict[str, int]:
+        """Return number of results and their total size in bytes"""
+        with self.index() as index:
+            return {
+                "entries": len(index),
+                "nbytes": sum(entry["size"] for entry in index.values()),
+            }
+
+
+def memoize(
+    directory: str,
+    /,
+    *,
+    mthd: str = "pickle",
+    max_entries: int = None,
+    max_bytes: int = None,
+    ttl: Number = None,
+    lock_timeout: Number = DFT_LOCK_TIMEOUT,
+    **params,
+) -> Callable[[Callable], Callable]:
+    """Return decorator memoizing results of function on disk
+
+    Calls are identified by function (module and qualified name) and by its
+    arguments, bound to signature (defaults applied) and hashed with
+    `hash_args`: f(1) and f(x=1) share their result.
+
+    Decorated function has cache_info and cache_clear methods, and counters
+    of hits and misses of current process.
+
+    Args:
+        directory   : directory where results and index are stored
+        mthd        : storing method of results (pickle, json, npy, ...)
+            @see `~olutils.storing.save`
+        max_entries : max number of results stored (None for no limit)
+        max_bytes   : max size of results stored in bytes (None for no limit)
+            least recently used results are evicted first
+        ttl         : number of seconds a result is valid (None for ever)
+        lock_timeout: max number of seconds to wait for index lock
+        **params    : @see `~olutils.storing.save`, used to save results
+
+    Raise:
+        (ValueError): unknown mthd
+    """
+    store_kwargs = {
+        "mthd": mthd,
+        "max_entries": max_entries,
+        "max_bytes": max_bytes,
+        "ttl": ttl,
+        "lock_timeout": lock_timeout,
+    }
+    get_format(mthd)
+
+    def decorator(func: Callable) -> Callable:
+        """Return memoized function"""
+        store = _Store(directory, **store_kwargs)
+        signature = inspect.signature(func)
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = hash_args((name, bound.arguments))[:32]
+            path = store.path(key)
+            if store.lookup(key):
+                try:
+                    res = load(path, mthd)
+                    wrapper.hits += 1
+                    return res
+                except FileNotFoundError:  # Evicted by another process
+                    pass
+            wrapper.misses += 1
+            res = func(*args, **kwargs)
+            save(res, path, mthd, atomic=True, **params)
+            store.add(key)
+            return res
+
+        wrapper.hits = 0
+        wrapper.misses = 0
+        wrapper.cache_info = store.info
+        wrapper.cache_clear = store.clear
+        return wrapper
+
+    return decorator
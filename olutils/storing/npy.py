@@ -0,0 +1,296 @@
+"""Functions to read and write numpy (npy and npz) files
+
+Arrays are memory-mapped when loaded (dft mmap_mode is 'r'): data is read from
+disk on access only and pages are shared by processes mapping the same file.
+"""
+import io
+import struct
+import zipfile
+from collections.abc import Mapping
+from typing import Dict, Iterator, Sequence, Union
+
+import numpy as np
+from numpy.lib import format as npformat
+
+from olutils.os import copen, get_compression, sopen
+
+ZIP_HEADER_SIZE = 30  # Size of fixed part of zip local file header
+ZIP_HEADER = struct.Struct("<4s22xHH")  # Signature, name and extra sizes
+
+
+class StreamWriter:
+    """Write-only view of a file, hiding its (slow or partial) seek and tell"""
+
+    def __init__(self, file, /):
+        self.write = file.write
+        self.flush = file.flush
+
+    def read(self, *args):
+        """Raise as stream is write-only"""
+        raise io.UnsupportedOperation("read")
+
+
+def read_array_header(file, /) -> tuple:
+    """Return (shape, fortran_order, dtype) of npy data starting at file position"""
+    version = npformat.read_magic(file)
+    if version == (1, 0):
+        return npformat.read_array_header_1_0(file)
+    return npformat.read_array_header_2_0(file)
+
+
+def read_npy(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    mmap_mode: str = "r",
+    allow_pickle: bool = False,
+) -> np.ndarray:
+    """Return array stored in npy file at path
+
+    Args:
+        path        : path to read from
+        mode        : ignored, file is always read as binary
+        encoding    : ignored, file is always read as binary
+        compression: @see `~olutils.os.copen`
+            compressed files are read in memory (mmap_mode is ignored)
+        buffering   : ignored, numpy reads large chunks already
+        mmap_mode   : @see `numpy.load`
+            'r' (dft) > read-only memory map (no copy, pages loaded on access)
+            'r+', 'c' > writable memory map, changes saved to file or not
+            None      > array read in memory
+        allow_pickle: @see `numpy.load`
+    """
+    if compression == "infer":
+        compression = get_compression(path)
+    if compression is None:
+        return np.load(path, mmap_mode=mmap_mode, allow_pickle=allow_pickle)
+    # Buffered files are read by numpy through their descriptor: not buffered
+    with copen(path, "rb", compression=compression, buffering=0) as file:
+        return npformat.read_array(file, allow_pickle=allow_pickle)
+
+
+def write_npy(
+    array: np.ndarray,
+    path: str,
+    /,
+    *,
+    encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
+    allow_pickle: bool = False,
+):
+    """Write array in a npy file
+
+    Args:
+        array       : array (or array like) to write
+        path        : path to write to
+        encoding    : ignored, file is always written as binary
+        compression, compresslevel, buffering: @see `~olutils.os.copen`
+            buffering is ignored for compressed files, numpy writes large
+            chunks already
+        allow_pickle: @see `numpy.save`
+    """
+    if compression == "infer":
+        compression = get_compression(path)
+    if compression is not None:
+        # Buffered files are written by numpy through their descriptor
+        buffering = 0
+    with sopen(
+        path,
+        "wb",
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
+        npformat.write_array(file, np.asanyarray(array), allow_pickle=allow_pickle)
+
+
+class NpzArchive(Mapping):
+    """Lazy mapping of arrays stored in a npz file
+
+    Arrays are read on first access only (then kept). Arrays stored without
+    compression in archive (@see `numpy.savez`) are memory-mapped if mmap_mode
+    is given.
+
+    Example:
+        >> with read_npz("features.npz") as archive:
+        ..     train = archive["train"]  # Only this array is mapped
+    """
+
+    def __init__(
+        self,
+        path: str,
+        /,
+        *,
+        mmap_mode: str = "r",
+        allow_pickle: bool = False,
+        file=None,
+    ):
+        """Initialize instance
+
+        Args:
+            path        : path to npz file
+            mmap_mode   : @see `read_npy`
+            allow_pickle: @see `numpy.load`
+            file        : file object to read archive from, instead of path
+                arrays are then never memory-mapped
+        """
+        self.path = path
+        self.mmap_mode = None if file is not None else mmap_mode
+        self.allow_pickle = allow_pickle
+        self._file = file
+        self._zip = zipfile.ZipFile(path if file is None else file)
+        self._members = {}
+        for info in self._zip.infolist():
+            key = info.filename
+            if key.endswith(".npy"):
+                key = key[:-len(".npy")]
+            self._members[key] = info
+        self._arrays = {}
+
+    def _data_offset(self, info: zipfile.ZipInfo, /) -> int:
+        """Return offset of member data in archive file"""
+        with open(self.path, "rb") as file:
+            file.seek(info.header_offset)
+            signature, name_size, extra_size = ZIP_HEADER.unpack(
+                file.read(ZIP_HEADER_SIZE)
+            )
+        if signature != b"PK\x03\x04":
+            raise ValueError(f"Bad zip local header for '{info.filename}'")
+        return info.header_offset + ZIP_HEADER_SIZE + name_size + extra_size
+
+    def _map(self, info: zipfile.ZipInfo, /) -> np.ndarray:
+        """Return memory map on member stored without compression"""
+        offset = self._data_offset(info)
+        with open(self.path, "rb") as file:
+            file.seek(offset)
+            shape, fortran_order, dtype = read_array_header(file)
+            offset = file.tell()
+        if dtype.hasobject:
+            raise ValueError("Array of objects can't be memory-mapped")
+        return np.memmap(
+            self.path,
+            dtype=dtype,
+            mode=self.mmap_mode,
+            offset=offset,
+            shape=shape,
+            order="F" if fortran_order else "C",
+        )
+
+    def __getitem__(self, key: str) -> np.ndarray:
+        if key not in self._arrays:
+            info = self._members[key]
+            if (
+                self.mmap_mode is not None
+                and info.compress_type == zipfile.ZIP_STORED
+                and info.filename.endswith(".npy")
+            ):
+                self._arrays[key] = self._map(info)
+            else:
+                with self._zip.open(info) as file:
+                    if info.filename.endswith(".npy"):
+                        array = npformat.read_array(
+                            file, allow_pickle=self.allow_pickle
+                        )
+                    else:
+                        array = file.read()
+                self._arrays[key] = array
+        return self._arrays[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._members)
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.path!r}, keys={list(self)})"
+
+    def close(self):
+        """Close archive (memory-mapped arrays stay usable)"""
+        self._zip.close()
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self) -> "NpzArchive":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def read_npz(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    mmap_mode: str = "r",
+    allow_pickle: bool = False,
+) -> NpzArchive:
+    """Return lazy mapping of arrays stored in npz file at path
+
+    Args:
+        path        : path to read from
+        mode        : ignored, file is always read as binary
+        encoding    : ignored, file is always read as binary
+        compression, buffering: @see `~olutils.os.copen`
+            compressed files are read through decompressed stream (slow
+            random access) and arrays are not memory-mapped
+        mmap_mode   : @see `read_npy`
+            applies to arrays stored without compression in archive
+        allow_pickle: @see `numpy.load`
+
+    Returns:
+        @see `NpzArchive`
+    """
+    if compression == "infer":
+        compression = get_compression(path)
+    if compression is None:
+        return NpzArchive(path, mmap_mode=mmap_mode, allow_pickle=allow_pickle)
+    file = copen(path, "rb", compression=compression, buffering=buffering)
+    return NpzArchive(path, allow_pickle=allow_pickle, file=file)
+
+
+def write_npz(
+    arrays: Union[Dict[str, np.ndarray], Sequence[np.ndarray]],
+    path: str,
+    /,
+    *,
+    encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
+    compressed: bool = False,
+):
+    """Write arrays in a npz file
+
+    Args:
+        arrays      : arrays by key, or list of arrays (keys are arr_0, ...)
+        path        : path to write to
+        encoding    : ignored, file is always written as binary
+        compression, compresslevel, buffering: @see `~olutils.os.copen`
+        compressed  : compress arrays within archive (@see `numpy.savez_compressed`)
+            compressed arrays can't be memory-mapped when loaded
+    """
+    if not isinstance(arrays, Mapping):
+        arrays = {f"arr_{i}": array for i, array in enumerate(arrays)}
+    savez = np.savez_compressed if compressed else np.savez
+    if compression == "infer":
+        compression = get_compression(path)
+    with sopen(
+        path,
+        "wb",
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
+        # Zip entries are written in one pass to compressed streams
+        savez(file if compression is None else StreamWriter(file), **arrays)
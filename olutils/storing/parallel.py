@@ -0,0 +1,426 @@
+"""Parallel reading of csv files and of rows
+
+Files are split into byte ranges aligned on line boundaries, each range being
+parsed (and its rows read by a RowReader) in a pool of processes.
+
+Because ranges are aligned on lines, a quoted field containing a line
+terminator may be split b/w two ranges : such files are detected beforehand
+and read sequentially. Compressed files are read sequentially as well.
+
+Streams of rows (e.g. of read_csv) are read by a RowReader in a pool of
+processes as well, shipped by chunks of rows.
+"""
+import os
+import pickle
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Executor,
+    Future,
+    ProcessPoolExecutor,
+    wait,
+)
+from csv import DictReader, reader as csv_reader
+from io import StringIO, TextIOWrapper
+from itertools import chain
+from locale import getpreferredencoding
+from typing import Any, Callable, Iterable, List, NamedTuple, Tuple, Union
+
+from olutils.typing import RowDict
+from olutils.os import get_compression
+from olutils.sequencing import chunkiter, countiter
+from .csv import guess_delimiter, read_csv
+from .rowreader import RowReader
+
+DFT_RANGE_SIZE = 16 * 1024 * 1024  # Bytes
+DFT_ROWS_CHUNKSIZE = 1000  # Rows shipped to a worker at once
+ERRORS = ("forward", "raise", "skip")
+
+_WORKER_READER = None  # Reader of rows in worker processes
+
+
+class RowError(NamedTuple):
+    """Row that could not be read, in place of read row"""
+
+    index: int  # Index of row in stream (first is 0)
+    row: RowDict  # Initial row
+    error: Exception  # Error raised reading row
+
+
+def split_ranges(
+    path: str, /, size: int = DFT_RANGE_SIZE, *, start: int = 0
+) -> List[Tuple[int, int]]:
+    """Return (start, end) byte ranges of file, aligned on line boundaries
+
+    Args:
+        path    : path to file
+        size    : approximate size of ranges in bytes
+        start   : offset where first range starts
+
+    Raise:
+        (ValueError): size is not strictly positive
+    """
+    if size <= 0:
+        raise ValueError(f"size must be strictly positive, got {size}")
+    filesize = os.path.getsize(path)
+    bounds = [start]
+    with open(path, "rb") as file:
+        offset = start + size
+        while offset < filesize:
+            # Moving to the end of the line containing the byte before offset
+            file.seek(offset - 1)
+            file.readline()
+            offset = file.tell()
+            if offset >= filesize:
+                break
+            bounds.append(offset)
+            offset += size
+    bounds.append(max(filesize, start))
+    return [(beg, end) for beg, end in zip(bounds[:-1], bounds[1:]) if end > beg]
+
+
+def pool_map(
+    func: Callable,
+    iterable: Iterable,
+    /,
+    executor: Executor,
+    *,
+    ordered: bool = True,
+    max_pending: int = 8,
+    on_error: Callable[[Any, Exception], Any] = None,
+) -> Iterable[Any]:
+    """Iterate results of func over iterable computed by executor
+
+    Unlike Executor.map, items of iterable are submitted lazily so that at
+    most max_pending results are computed and not consumed yet.
+
+    Args:
+        func        : function to call on each item of iterable
+        iterable    : arguments to call func with
+        executor    : executor to submit calls to
+        ordered     : yield results in order of iterable
+            False means yield results as soon as they are computed
+        max_pending : max number of submitted calls not consumed yet
+        on_error    : function returning result of item from error raised
+            by its call, its submission or its result transfer (e.g. pickling
+            error in a process pool)
+            None means errors are raised
+    """
+    pending = []
+    items = {}  # future -> item (when on_error is given)
+
+    def submit(item: Any) -> Future:
+        """Return future of call of func on item"""
+        if on_error is None:
+            return executor.submit(func, item)
+        try:
+            future = executor.submit(func, item)
+        except Exception as error:  # pylint: disable=broad-except
+            future = Future()
+            future.set_exception(error)
+        items[future] = item
+        return future
+
+    def result(future: Future) -> Any:
+        """Return result of call, or of on_error if it failed"""
+        if on_error is None:
+            return future.result()
+        item = items.pop(future)
+        try:
+            return future.result()
+        except Exception as error:  # pylint: disable=broad-except
+            return on_error(item, error)
+
+    def pop_results():
+        """Yield results of pending calls (first one only or completed ones)"""
+        if ordered:
+            yield result(pending.pop(0))
+            return
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            pending.remove(future)
+            yield result(future)
+
+    try:
+        for item in iterable:
+            pending.append(submit(item))
+            if len(pending) >= max_pending:
+                yield from pop_results()
+        while pending:
+            yield from pop_results()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _is_safe(data: bytes, quotechar: bytes, /) -> bool:
+    """Return whether no line of data has an odd number of quotechar
+
+    If so, data does not start or end within a quoted field containing line
+    terminators (given it starts outside of one).
+    """
+    if quotechar not in data:
+        return True
+    return all(line.count(quotechar) % 2 == 0 for line in data.split(b"\n"))
+
+
+def _read_range(args: Tuple) -> Tuple[int, Union[List[RowDict], None]]:
+    """Return index of file range and its rows read by reader (if any)
+
+    Rows are None if quotechar is given and range is not safe to parse alone
+    (@see `_is_safe`).
+    """
+    i, path, start, end, fieldnames, delimiter, encoding, reader, quotechar = args
+    with open(path, "rb") as file:
+        file.seek(start)
+        data = file.read(end - start)
+    if quotechar is not None and not _is_safe(data, quotechar):
+        return i, None
+    rows = DictReader(
+        StringIO(data.decode(encoding)), fieldnames=fieldnames, delimiter=delimiter
+    )
+    if reader is None:
+        return i, list(rows)
+    return i, [reader.read(row) for row in rows]
+
+
+def _read_header(
+    path: str, /, *, delimiter: str, encoding: str
+) -> Tuple[List[str], int]:
+    """Return fieldnames of csv file and offset of its first record
+
+    Blank lines before header are skipped, header may contain quoted line
+    terminators. Fieldnames are empty if file has no header.
+    """
+    quotechar = '"'.encode(encoding)
+    with open(path, "rb") as file:
+        header = b""
+        while not header.strip():
+            header = file.readline()
+            if not header:
+                return [], file.tell()
+        while header.count(quotechar) % 2:
+            line = file.readline()
+            if not line:
+                break
+            header += line
+        offset = file.tell()
+    records = csv_reader(
+        StringIO(header.decode(encoding), newline=""), delimiter=delimiter
+    )
+    return next(records, []), offset
+
+
+def _iter_from(
+    path: str,
+    start: int,
+    /,
+    *,
+    fieldnames: List[str],
+    delimiter: str,
+    encoding: str,
+) -> Iterable[RowDict]:
+    """Iterate rows of file from offset, parsed sequentially"""
+    with open(path, "rb") as file:
+        file.seek(start)
+        buffer = TextIOWrapper(file, encoding=encoding, newline="")
+        yield from DictReader(buffer, fieldnames=fieldnames, delimiter=delimiter)
+
+
+def _set_reader(reader: RowReader, /):
+    """Set reader of rows of worker process"""
+    global _WORKER_READER  # pylint: disable=global-statement
+    _WORKER_READER = reader
+
+
+def _picklable(error: Exception, /) -> Exception:
+    """Return error if it can be sent back from a worker, else a RuntimeError
+
+    Exceptions with custom init arguments often can't be unpickled: they are
+    replaced by a RuntimeError giving their type and message.
+    """
+    try:
+        pickle.loads(pickle.dumps(error))
+        return error
+    except Exception:  # pylint: disable=broad-except
+        return RuntimeError(f"{type(error).__qualname__}: {error}")
+
+
+def _read_rows(args: Tuple[int, List[RowDict]]) -> List[Union[RowDict, RowError]]:
+    """Return rows read by worker reader, errors being caught per row"""
+    start, rows = args
+    read = _WORKER_READER.read
+    result = []
+    for i, row in enumerate(rows, start):
+        try:
+            result.append(read(row))
+        except Exception as error:  # pylint: disable=broad-except
+            result.append(RowError(i, row, _picklable(error)))
+    return result
+
+
+def read_rows_parallel(
+    rows: Iterable[RowDict],
+    reader: RowReader,
+    /,
+    *,
+    workers: int = None,
+    chunksize: int = DFT_ROWS_CHUNKSIZE,
+    errors: str = "forward",
+    **kwargs,
+) -> Iterable[Union[RowDict, RowError]]:
+    """Return iterator on rows read by reader in a pool of processes
+
+    Rows are consumed lazily and shipped to workers by chunks, at most twice
+    as many chunks as workers being read and not consumed at once. Read rows
+    are yielded in order of rows.
+
+    Args:
+        rows        : rows to read (e.g. rows of `~olutils.storing.read_csv`)
+            rows must be picklable
+        reader      : row reader to read each row with in workers
+            conversions and operations must be picklable (no lambda)
+        workers     : number of processes (dft is number of cpus)
+        chunksize   : number of rows shipped to a worker at once
+        errors      : what to do with rows whose reading raises an error
+            "forward"   > yield a `RowError` in place of row
+            "raise"     > raise error (once rows before are yielded)
+            "skip"      > ignore row
+            errors that can't be pickled are RuntimeError (@see `_picklable`)
+        **kwargs    : @see `~olutils.countiter`
+            vbatch      nb of rows b/w progress displays (dft=0, no display)
+            start       first index of progress counter (dft=1)
+
+    Raise:
+        (ValueError): unknown errors, chunksize is not strictly positive
+    """
+    if errors not in ERRORS:
+        raise ValueError(f"errors must be one of {ERRORS}, got {errors!r}")
+    chunks = chunkiter(rows, chunksize)
+    workers = os.cpu_count() if workers is None else workers
+    kwargs["vbatch"] = kwargs.pop("vbatch", 0)
+    kwargs["start"] = kwargs.pop("start", 1)
+
+    def row_iterator():
+        """Iterate rows read in a pool of processes"""
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_set_reader, initargs=(reader,)
+        ) as executor:
+            results = pool_map(
+                _read_rows,
+                ((i * chunksize, chunk) for i, chunk in enumerate(chunks)),
+                executor,
+                max_pending=2 * workers,
+            )
+            for row in chain.from_iterable(results):
+                if isinstance(row, RowError) and errors != "forward":
+                    if errors == "raise":
+                        raise row.error
+                    continue
+                yield row
+
+    return countiter(row_iterator(), **kwargs)
+
+
+def read_csv_parallel(
+    path: str,
+    /,
+    *,
+    delimiter: str = "smart",
+    encoding: str = None,
+    reader: RowReader = None,
+    workers: int = None,
+    range_size: int = DFT_RANGE_SIZE,
+    ordered: bool = True,
+    check_quotes: bool = True,
+    **kwargs,
+) -> Iterable[RowDict]:
+    """Return iterator on rows of csv file parsed by a pool of processes
+
+    Args:
+        path        : path to input
+        delimiter   : delimiter for columns
+            "smart" > @see `~olutils.storing.csv.guess_delimiter`
+        encoding    : encoding of file
+        reader      : row reader to read each row with in workers
+            conversions and operations must be picklable (no lambda)
+        workers     : number of processes (dft is number of cpus)
+        range_size  : approximate number of bytes parsed by a worker at once
+        ordered     : yield rows in file order
+            False means rows of a range are yielded as soon as it is parsed
+            (and previous ranges are checked, with check_quotes)
+        check_quotes: check ranges for quoted fields containing line
+            terminators while parsing them, from first range having some,
+            file is read sequentially to ensure correctness
+            disable it only if one knows fields have no line terminator
+        **kwargs    : @see `~olutils.countiter`
+            vbatch      nb of lines b/w progress displays (dft=0, no display)
+            start       first index of progress counter (dft=1)
+
+    Raise:
+        (ValueError): delimiter can't be guessed
+    """
+    encoding = getpreferredencoding(False) if encoding is None else encoding
+    if delimiter == "smart":
+        delimiter = guess_delimiter(path, encoding=encoding)
+    workers = os.cpu_count() if workers is None else workers
+    kwargs["vbatch"] = kwargs.pop("vbatch", 0)
+    kwargs["start"] = kwargs.pop("start", 1)
+
+    if get_compression(path) is not None:
+        rows = read_csv(path, delimiter=delimiter, encoding=encoding)
+        if reader is not None:
+            rows = map(reader.read, rows)
+        return countiter(rows, **kwargs)
+
+    fieldnames, offset = _read_header(path, delimiter=delimiter, encoding=encoding)
+    if not fieldnames:  # Empty file, no header
+        return countiter(
+            read_csv(path, delimiter=delimiter, encoding=encoding), **kwargs
+        )
+    ranges = split_ranges(path, range_size, start=offset)
+    quotechar = '"'.encode(encoding) if check_quotes else None
+
+    def row_iterator():
+        """Iterate rows of file parsed in a pool of processes
+
+        Rows of a range are yielded once all previous ranges are known safe.
+        From first unsafe range on, file is parsed sequentially.
+        """
+        unsafe = len(ranges)  # Index of first unsafe range
+        done = {}  # Index -> rows of parsed ranges not yielded yet
+        nxt = 0  # Index of next range to yield (ranges before are safe)
+        params = (fieldnames, delimiter, encoding, reader, quotechar)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            chunks = pool_map(
+                _read_range,
+                [(i, path, beg, end, *params) for i, (beg, end) in enumerate(ranges)],
+                executor,
+                ordered=ordered,
+                max_pending=2 * workers,
+            )
+            for i, rows in chunks:
+                if rows is None:
+                    unsafe = min(unsafe, i)
+                elif quotechar is None:
+                    yield from rows
+                    continue
+                elif i < unsafe:
+                    done[i] = rows
+                while nxt < unsafe and nxt in done:
+                    yield from done.pop(nxt)
+                    nxt += 1
+                if nxt == unsafe:
+                    break
+            chunks.close()
+
+        if unsafe < len(ranges):
+            rows = _iter_from(
+                path,
+                ranges[unsafe][0],
+                fieldnames=fieldnames,
+                delimiter=delimiter,
+                encoding=encoding,
+            )
+            yield from rows if reader is None else map(reader.read, rows)
+
+    return countiter(row_iterator(), **kwargs)
@@ -0,0 +1,244 @@
+"""Write rows to one csv file per partition key
+
+Files are kept open in a pool of bounded size (least recently used file is
+closed first, and reopened in append mode if needed), so that any number of
+partitions can be written in one pass over rows.
+
+With max_bytes, files of a partition are rolled: their index is counted by the
+writer from 1, no matter which files exist on disk (unlike
+`~olutils.path.get_next_path`). Writing again to the same template rewrites
+files from index 1, and files of higher index left by a previous run that
+rolled more are removed on close.
+
+Example:
+    >> with PartitionedWriter("out/{key}/events_{:03d}.csv", max_bytes=10 ** 8) as writer:
+    ..     writer.writerows(rows, key=lambda row: row["day"])
+    >> writer.paths
+    {'2021-01-01': ['out/2021-01-01/events_001.csv', ...], ...}
+"""
+import os
+import re
+from collections import OrderedDict
+from csv import DictWriter, writer as csv_writer
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Sequence, Union
+
+from olutils.os import sopen
+from olutils.typing import RowDict
+from .common import DFT_EOL
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+DFT_MAX_OPEN = 128
+INDEX_PATTERN = re.compile(r"\{(?::([^{}]*))?\}")  # "{}" or "{:spec}"
+
+
+def default_max_open() -> int:
+    """Return default max number of open files (quarter of fd soft limit)"""
+    if resource is None:
+        return DFT_MAX_OPEN
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return DFT_MAX_OPEN
+    return max(1, min(DFT_MAX_OPEN, soft // 4))
+
+
+class _Partition:
+    """File of a partition and its writer"""
+
+    def __init__(self, path: str, file, /, size: int = 0):
+        self.path = path
+        self.file = file
+        self.writer = None  # csv writer writing to instance
+        self.size = size  # Characters written in file
+
+    def write(self, data: str) -> int:
+        """Write data to file, counting characters"""
+        self.size += len(data)
+        return self.file.write(data)
+
+
+class PartitionedWriter:
+    """Writer of rows to one csv file per key, with a bounded pool of open files"""
+
+    def __init__(
+        self,
+        path_template: str,
+        /,
+        *,
+        fieldnames: List[str] = None,
+        max_open: int = None,
+        max_bytes: int = None,
+        encoding: str = None,
+        compression: str = "infer",
+        compresslevel: int = None,
+        delimiter: str = ",",
+        lineterminator: str = DFT_EOL,
+    ):
+        """Initialize instance
+
+        Args:
+            path_template: template of paths, "{key}" is replaced by key
+                with max_bytes, it also contains one positional placeholder
+                for the index of file, starting at 1 (e.g. "out/{key}_{:03d}.csv")
+                other characters (braces included) are kept as is
+                existing files are overwritten, @see module doc for rolls
+            fieldnames  : columns of files (dft is keys of first row)
+                required for tuple rows
+            max_open    : max number of files open at once
+                dft is a quarter of open files limit of process (max 128)
+            max_bytes   : roll partition files once they reach max_bytes
+                (uncompressed characters), None for no rolling
+            encoding, compression, compresslevel: @see `~olutils.os.copen`
+            delimiter, lineterminator: @see `csv.writer`
+
+        Raise:
+            (ValueError): max_bytes and not one index placeholder in template
+        """
+        if max_bytes is not None and len(INDEX_PATTERN.findall(path_template)) != 1:
+            raise ValueError(
+                "path_template must contain one positional placeholder (e.g."
+                f" '{{:03d}}') with max_bytes, got {path_template!r}"
+            )
+        self.path_template = path_template
+        self.fieldnames = fieldnames
+        self.max_open = default_max_open() if max_open is None else max_open
+        self.max_bytes = max_bytes
+        self.delimiter = delimiter
+        self.lineterminator = lineterminator
+        self.paths = {}  # key -> paths of files written, in order
+        self._o_kwargs = {
+            "encoding": encoding,
+            "compression": compression,
+            "compresslevel": compresslevel,
+            "newline": "",
+        }
+        self._open = OrderedDict()  # key -> _Partition (LRU first)
+        self._sizes = {}  # key -> size of last file of closed partitions
+        self._rolls = {}  # key -> index of last file of partition
+        self._dict_rows = None
+
+    def _format(self, key: Hashable, index: int = None, /) -> str:
+        """Return path of file of partition (given its index with max_bytes)"""
+        path = self.path_template
+        if index is not None:
+            path = INDEX_PATTERN.sub(
+                lambda match: format(index, match.group(1) or ""), path
+            )
+        return path.replace("{key}", str(key))
+
+    def _path(self, key: Hashable, /) -> str:
+        """Return path of new file of partition"""
+        if self.max_bytes is None:
+            return self._format(key)
+        index = self._rolls[key] = self._rolls.get(key, 0) + 1
+        return self._format(key, index)
+
+    def _partition(self, key: Hashable, /) -> _Partition:
+        """Return open partition of key (opened if needed)"""
+        partition = self._open.get(key)
+        size = self._sizes.get(key, 0) if partition is None else partition.size
+        new = key not in self.paths
+        if self.max_bytes is not None and size >= self.max_bytes:
+            new, size = True, 0
+        if partition is not None:
+            if not new:
+                self._open.move_to_end(key)
+                return partition
+            self._close(key)
+
+        if len(self._open) >= self.max_open:
+            self._close(next(iter(self._open)))
+        if new:
+            path = self._path(key)
+            self.paths.setdefault(key, []).append(path)
+        else:
+            path = self.paths[key][-1]
+        file = sopen(path, "w" if new else "a", **self._o_kwargs)
+        partition = _Partition(path, file, size)
+        w_kwargs = {"delimiter": self.delimiter, "lineterminator": self.lineterminator}
+        if self._dict_rows:
+            partition.writer = DictWriter(
+                partition, self.fieldnames, extrasaction="ignore", **w_kwargs
+            )
+        else:
+            partition.writer = csv_writer(partition, **w_kwargs)
+        if new:
+            if self._dict_rows:
+                partition.writer.writeheader()
+            else:
+                partition.writer.writerow(self.fieldnames)
+        self._open[key] = partition
+        return partition
+
+    def _close(self, key: Hashable, /):
+        """Close file of partition"""
+        partition = self._open.pop(key)
+        partition.file.close()
+        self._sizes[key] = partition.size
+
+    def writerow(self, row: Union[RowDict, Sequence], /, key: Hashable):
+        """Write row to file of partition key
+
+        Raise:
+            (ValueError): fieldnames unknown for first row being a tuple
+        """
+        if self._dict_rows is None:
+            self._dict_rows = not isinstance(row, (list, tuple))
+            if self.fieldnames is None:
+                if not self._dict_rows:
+                    raise ValueError("fieldnames required for tuple rows")
+                self.fieldnames = list(row.keys())
+        self._partition(key).writer.writerow(row)
+
+    def writerows(
+        self,
+        rows: Iterable[Union[RowDict, Sequence]],
+        /,
+        key: Callable[[Any], Hashable],
+    ):
+        """Write rows to file of their partition, given by key function"""
+        for row in rows:
+            self.writerow(row, key(row))
+
+    def close(self):
+        """Close all open files and remove stale rolls of previous runs"""
+        for key in list(self._open):
+            self._close(key)
+        for key, last in self._rolls.items():
+            index = last + 1
+            while os.path.exists(self._format(key, index)):
+                os.remove(self._format(key, index))
+                index += 1
+
+    def __enter__(self) -> "PartitionedWriter":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def write_partitioned(
+    rows: Iterable[Union[RowDict, Sequence]],
+    path_template: str,
+    /,
+    key: Callable[[Any], Hashable],
+    **kwargs,
+) -> Dict[Hashable, List[str]]:
+    """Write rows to one csv file per partition key
+
+    Args:
+        rows            : rows to write (dictionaries, or tuples with fieldnames)
+        path_template   : @see `PartitionedWriter`
+        key             : function returning partition key of a row
+        **kwargs        : @see `PartitionedWriter`
+            fieldnames, max_open, max_bytes, ...
+
+    Returns:
+        (dict) paths of files written by partition key
+    """
+    with PartitionedWriter(path_template, **kwargs) as writer:
+        writer.writerows(rows, key=key)
+    return writer.paths
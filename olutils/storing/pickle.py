@@ -0,0 +1,145 @@
+"""Functions to read and write pickle files
+
+Large buffers (numpy arrays, bytearrays, ...) can be stored out-of-band
+(pickle protocol 5) : they are written after the pickle stream, aligned, and
+reattached from a memory map on load, without being copied in memory.
+
+Layout of files with out-of-band buffers:
+    OOB_MAGIC | pickle stream | buffers (aligned) | trailer | OOB_MAGIC
+    trailer is made of (offset, size) of pickle stream and of each buffer,
+    followed by number of buffers (unsigned 64-bit integers)
+"""
+import pickle
+import struct
+from mmap import ACCESS_COPY, ACCESS_READ, mmap as memorymap
+from typing import Any
+
+from olutils.os import copen, get_compression, sopen
+
+OOB_MAGIC = b"OLPKOOB\n"
+OOB_ALIGNMENT = 64  # Buffers are aligned for vectorized access
+OOB_ACCESS = {'r': ACCESS_READ, 'c': ACCESS_COPY}
+UINT64 = struct.Struct("<Q")
+
+
+def _pad(file, /):
+    """Write zeros up to next aligned position of file"""
+    file.write(b"\0" * (-file.tell() % OOB_ALIGNMENT))
+
+
+def _read_oob(file, /, *, mmap_mode: str, **kwargs) -> Any:
+    """Return object of file with out-of-band buffers, reattached from a memory map"""
+    try:
+        access = OOB_ACCESS[mmap_mode]
+    except KeyError:
+        raise ValueError(
+            f"mmap_mode must be one of {list(OOB_ACCESS)}, got {mmap_mode!r}"
+        ) from None
+    view = memoryview(memorymap(file.fileno(), 0, access=access))
+    if view[-len(OOB_MAGIC):] != OOB_MAGIC:
+        raise pickle.UnpicklingError("Truncated file of out-of-band buffers")
+    end = len(view) - len(OOB_MAGIC)
+    (count,) = UINT64.unpack(view[end - UINT64.size:end])
+    start = end - UINT64.size * (2 * count + 3)
+    values = struct.unpack(f"<{2 * count + 2}Q", view[start:end - UINT64.size])
+    views = [
+        view[offset:offset + size]
+        for offset, size in zip(values[::2], values[1::2])
+    ]
+    return pickle.loads(views[0], buffers=views[1:], **kwargs)
+
+
+def read_pickle(
+    path: str,
+    /,
+    *,
+    mode: str = None,
+    encoding: str = None,
+    compression: str = "infer",
+    buffering: int = -1,
+    mmap_mode: str = "r",
+    **kwargs,
+) -> Any:
+    """Return object stored in pickle file at path
+
+    Args:
+        path    : path to read from
+        mode    : mode to open file with (default is 'rb')
+        encoding, compression, buffering: @see `~olutils.os.copen`
+        mmap_mode: access to memory map of out-of-band buffers, if any
+            'r' (dft)   > read-only (arrays built on buffers are read-only)
+            'c'         > copy-on-write (changes are not saved to file)
+        **kwargs: @see `pickle.load`
+    """
+    mode = "rb" if mode is None else mode
+    if compression == "infer":
+        compression = get_compression(path)
+    with copen(
+        path, mode, encoding=encoding, compression=compression, buffering=buffering
+    ) as file:
+        if compression is None and file.read(len(OOB_MAGIC)) == OOB_MAGIC:
+            return _read_oob(file, mmap_mode=mmap_mode, **kwargs)
+        if compression is None:
+            file.seek(0)
+        return pickle.load(file, **kwargs)
+
+
+def write_pickle(
+    obj: Any,
+    path: str,
+    /,
+    *,
+    encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
+    oob: bool = False,
+    **params,
+):
+    """Write object in a pickle file
+
+    Args:
+        obj     : object to write
+        path    : path to write to
+        encoding, compression, compresslevel, buffering: @see `~olutils.os.copen`
+        oob     : store large buffers out-of-band (protocol 5), to be loaded
+            from a memory map without copy
+            file is then readable with read_pickle only
+        **params: @see `pickle.dump`
+
+    Raise:
+        (ValueError): oob with compression or with protocol lower than 5
+    """
+    if compression == "infer":
+        compression = get_compression(path)
+    if oob:
+        if compression is not None:
+            raise ValueError("Out-of-band buffers can't be compressed")
+        if params.setdefault("protocol", 5) < 5:
+            raise ValueError("Out-of-band buffers require protocol 5 or higher")
+
+    with sopen(
+        path,
+        "wb",
+        encoding=encoding,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
+        if not oob:
+            pickle.dump(obj, file, **params)
+            return
+
+        buffers = []
+        file.write(OOB_MAGIC)
+        spans = [file.tell()]
+        pickle.dump(obj, file, buffer_callback=buffers.append, **params)
+        spans.append(file.tell() - spans[0])
+        for buffer in buffers:
+            _pad(file)
+            raw = buffer.raw()
+            spans += [file.tell(), raw.nbytes]
+            file.write(raw)
+        spans.append(len(buffers))
+        file.write(struct.pack(f"<{len(spans)}Q", *spans))
+        file.write(OOB_MAGIC)
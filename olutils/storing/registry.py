@@ -0,0 +1,217 @@
+"""Registry of storing formats (methods) used by load and save
+
+Each format registers hooks, given as functions or as "module:attribute"
+strings imported on first use only:
+- loader    (path, /, *, mode, encoding, compression, buffering, **kwargs)
+- saver     (obj, path, /, *, encoding, compression, compresslevel, **params)
+- streamer  (path, /, *, mode, encoding, compression, buffering, **kwargs)
+    iterate elements of stored object lazily
+
+Formats are resolved from path extensions (compression suffix excluded), that
+can have several parts (e.g. "tar.gz").
+
+Example:
+    >> register_format(
+    ..     "yaml",
+    ..     loader="mypackage.yaml:read_yaml",
+    ..     saver="mypackage.yaml:write_yaml",
+    ..     extensions=["yaml", "yml"],
+    .. )
+    >> save(obj, "config.yml")
+"""
+import os
+from importlib import import_module
+from typing import Callable, Dict, List, Union
+
+from olutils.os import strip_compression
+
+Hook = Union[Callable, str]
+
+_FORMATS = {}
+_EXTENSIONS = {}
+
+
+def import_hook(hook: Hook, /) -> Callable:
+    """Return function described by hook ("module:attribute" or function)"""
+    if not isinstance(hook, str):
+        return hook
+    module, _, attribute = hook.partition(":")
+    return getattr(import_module(module), attribute)
+
+
+class StoringFormat:
+    """Storing format with its (lazily imported) hooks"""
+
+    def __init__(
+        self,
+        name: str,
+        /,
+        *,
+        loader: Hook = None,
+        saver: Hook = None,
+        streamer: Hook = None,
+        extensions: List[str] = None,
+    ):
+        """Initialize instance
+
+        Args:
+            name        : name of format (mthd of load and save)
+            loader      : function loading object from path
+            saver       : function saving object to path
+            streamer    : function iterating elements of object at path
+            extensions  : path extensions of format (dft is [name])
+        """
+        self.name = name
+        self.extensions = [name] if extensions is None else list(extensions)
+        self._hooks = {'loader': loader, 'saver': saver, 'streamer': streamer}
+
+    def hook(self, kind: str, /) -> Callable:
+        """Return hook of given kind, importing it if needed
+
+        Raise:
+            (ValueError): format has no such hook
+        """
+        hook = self._hooks[kind]
+        if hook is None:
+            raise ValueError(f"Storing format '{self.name}' has no {kind}")
+        if isinstance(hook, str):
+            hook = self._hooks[kind] = import_hook(hook)
+        return hook
+
+    @property
+    def loader(self) -> Callable:
+        """Function loading object from path"""
+        return self.hook("loader")
+
+    @property
+    def saver(self) -> Callable:
+        """Function saving object to path"""
+        return self.hook("saver")
+
+    @property
+    def streamer(self) -> Callable:
+        """Function iterating elements of object at path"""
+        return self.hook("streamer")
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r})"
+
+
+def register_format(
+    name: str,
+    /,
+    *,
+    loader: Hook = None,
+    saver: Hook = None,
+    streamer: Hook = None,
+    extensions: List[str] = None,
+    replace: bool = False,
+) -> StoringFormat:
+    """Register a storing format, @see `StoringFormat`
+
+    Args:
+        name, loader, saver, streamer, extensions: @see `StoringFormat`
+        replace     : replace format if already registered
+
+    Raise:
+        (ValueError): format or extension already registered (and not replace)
+    """
+    fmt = StoringFormat(
+        name, loader=loader, saver=saver, streamer=streamer, extensions=extensions
+    )
+    if not replace:
+        if name in _FORMATS:
+            raise ValueError(f"Storing format '{name}' already registered")
+        taken = [ext for ext in fmt.extensions if ext in _EXTENSIONS]
+        if taken:
+            raise ValueError(f"Extensions already registered: {', '.join(taken)}")
+    elif name in _FORMATS:
+        unregister_format(name)
+    _FORMATS[name] = fmt
+    for extension in fmt.extensions:
+        _EXTENSIONS[extension] = name
+    return fmt
+
+
+def unregister_format(name: str, /):
+    """Remove format from registry (with its extensions)"""
+    fmt = _FORMATS.pop(name)
+    for extension in fmt.extensions:
+        if _EXTENSIONS.get(extension) == name:
+            del _EXTENSIONS[extension]
+
+
+def get_format(name: str, /) -> StoringFormat:
+    """Return registered storing format
+
+    Raise:
+        (ValueError): unknown format
+    """
+    try:
+        return _FORMATS[name]
+    except KeyError:
+        raise ValueError(f"Unknown mthd '{name}'") from None
+
+
+def path2format(path: str, /) -> StoringFormat:
+    """Return storing format of path given its (longest) registered extension
+
+    Compression suffix is ignored : data.csv.gz is a csv file
+
+    Raise:
+        (ValueError): no format registered for path extension
+    """
+    parts = os.path.basename(strip_compression(path)).split(".")
+    for i in range(1, len(parts)):
+        try:
+            return _FORMATS[_EXTENSIONS[".".join(parts[i:])]]
+        except KeyError:
+            continue
+    raise ValueError(f"Unknown mthd '{parts[-1]}'")
+
+
+def formats() -> Dict[str, StoringFormat]:
+    """Return registered formats by name"""
+    return dict(_FORMATS)
+
+
+register_format(
+    "csv",
+    loader="olutils.storing.csv:read_csv",
+    saver="olutils.storing.csv:write_csv",
+    streamer="olutils.storing.csv:read_csv",
+)
+register_format(
+    "json",
+    loader="olutils.storing.json:read_json",
+    saver="olutils.storing.json:write_json",
+    streamer="olutils.storing.json:iter_json",
+)
+register_format(
+    "jsonl",
+    loader="olutils.storing.jsonl:read_jsonl",
+    saver="olutils.storing.jsonl:write_jsonl",
+    streamer="olutils.storing.jsonl:read_jsonl",
+    extensions=["jsonl", "ndjson"],
+)
+register_format(
+    "npy",
+    loader="olutils.storing.npy:read_npy",
+    saver="olutils.storing.npy:write_npy",
+)
+register_format(
+    "npz",
+    loader="olutils.storing.npy:read_npz",
+    saver="olutils.storing.npy:write_npz",
+)
+register_format(
+    "pickle",
+    loader="olutils.storing.pickle:read_pickle",
+    saver="olutils.storing.pickle:write_pickle",
+)
+register_format(
+    "txt",
+    loader="olutils.storing.txt:read_txt",
+    saver="olutils.storing.txt:write_txt",
+    streamer="olutils.storing.txt:iter_txt",
+)
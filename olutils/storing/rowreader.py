@@ -1,9 +1,294 @@
 """Convenient tools to read and encapsulate rows (dictionaries)"""
+import heapq
+import keyword
+import warnings
 from collections import OrderedDict
-from typing import Callable, Dict, List
+from collections.abc import Mapping
+from datetime import datetime
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple, Union
+)
 
-from olutils.typing import RowDict
+import numpy as np
+
+from olutils.typing import ColumnDict, RowDict
 from olutils.comparison import content_diff
+from .schema import str2datetime
+
+# Conversions applied to whole columns as numpy casts (dtype of result)
+# Columns are converted value by value when cast fails or differs from
+# conversion (@see `_is_iso_date`), to raise or convert as conversion
+VECTOR_CONVERSIONS = {
+    int: np.int64,
+    float: np.float64,
+    str2datetime: "datetime64[us]",
+    datetime.fromisoformat: "datetime64[us]",
+}
+OUTPUTS = ("rows", "columns")
+
+_RECORD_CLASSES = {}
+
+
+def vectorized(func: Callable[[ColumnDict], Sequence], /) -> Callable:
+    """Mark operation as computing a whole column from a table of columns
+
+    Marked operations are called once by `RowReader.read_many` and
+    `RowReader.read_columns` with a dict of numpy columns, and must return a
+    column of same length. `RowReader.read` raises ValueError when reader has
+    vectorized operations.
+
+    Example:
+        >> @vectorized
+        .. def total(table):
+        ..     return table['price'] * table['quantity']
+    """
+    func.vectorized = True
+    return func
+
+
+def requires(*attrs: str) -> Callable[[Callable], Callable]:
+    """Return decorator declaring attributes an operation depends on
+
+    Operations are run after the ones building attributes they require, and
+    dependencies are checked when building RowReader (unknown attributes and
+    cycles).
+
+    Example:
+        >> @requires('first_name', 'last_name')
+        .. def full_name(row):
+        ..     return row['first_name'] + " " + row['last_name']
+    """
+
+    def decorator(func: Callable) -> Callable:
+        func.requires = attrs
+        return func
+
+    return decorator
+
+
+def _as_array(values: Sequence, /) -> np.ndarray:
+    """Return values as a one dimensional numpy array (object if needed)"""
+    if isinstance(values, np.ndarray):
+        return values
+    try:
+        array = np.array(values)
+        if array.ndim == 1 and len(array) == len(values):
+            return array
+    except ValueError:  # Inhomogeneous sequences
+        pass
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _as_list(values: Sequence, /) -> List:
+    """Return values as a list of python objects"""
+    return values.tolist() if isinstance(values, np.ndarray) else list(values)
+
+
+def _is_iso_date(values: np.ndarray, column: np.ndarray, /) -> bool:
+    """Return whether values cast to datetime column all start with their date
+
+    numpy also parses "2020", "2020-01", "now", "today", "NaT", years out of
+    0001-9999 or integers ("20200102" is a count of units since epoch), which
+    ISO conversion of datetime does not (or not to the same datetime).
+    """
+    if np.isnat(column).any():
+        return False
+    dates = column.astype("datetime64[D]").astype(str)
+    return bool(
+        (np.char.str_len(dates) == 10).all()
+        and np.char.startswith(values.astype(str), dates).all()
+    )
+
+
+def convert_column(func: Callable, values: Sequence, /) -> Sequence:
+    """Return column of values converted by func
+
+    Known conversions (@see `VECTOR_CONVERSIONS`) are numpy casts: an array is
+    returned. Other conversions are applied value by value: a list is returned.
+    """
+    dtype = VECTOR_CONVERSIONS.get(func)
+    if dtype is not None:
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")  # e.g. timezones
+                array = np.asarray(values)
+                column = array.astype(dtype)
+                if column.dtype.kind != "M" or _is_iso_date(array, column):
+                    return column
+        except (ValueError, TypeError, OverflowError, RuntimeError, Warning):
+            pass
+    return [func(value) for value in _as_list(values)]
+
+
+class Record(Mapping):
+    """Row with a fixed set of attributes, stored in slots
+
+    Attributes are read as attributes (row.id) or items (row['id']). Records
+    are equal to mappings with same items.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._fields:
+            raise KeyError(key)
+        try:
+            return getattr(self, key)
+        except AttributeError:  # Not set yet
+            raise KeyError(key) from None
+
+    def __setitem__(self, key: str, value: Any):
+        if key not in self._fields:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self) -> Iterator[str]:
+        return (field for field in self._fields if hasattr(self, field))
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        items = ", ".join(f"{key}={value!r}" for key, value in self.items())
+        return f"{self.__class__.__name__}({items})"
+
+    def __reduce__(self):
+        return make_record, (self._fields, dict(self))
+
+
+class LazyRow(Mapping):
+    """Row whose attributes built by operations are computed on first access
+
+    Computed values are kept, so that each operation runs at most once per
+    row. Attributes are read as items (row['id']) or attributes (row.id).
+    Pickling a lazy row computes all its attributes (it is unpickled as an
+    OrderedDict).
+    """
+
+    __slots__ = (
+        "_values", "_operations", "_keys", "_hidden", "_pending", "_computing",
+        "_scope",
+    )
+
+    def __init__(
+        self,
+        values: Dict[str, Any],
+        operations: Dict[str, Callable],
+        keys: Tuple[str, ...],
+        /,
+        hidden: Iterable[str] = (),
+    ):
+        """Initialize instance
+
+        Args:
+            values      : (attribute, value) items of attributes already built
+            operations  : (attribute, func) items to build attributes with
+            keys        : all attributes of row, in order
+            hidden      : attributes only visible from operations (deleted)
+        """
+        self._values = values
+        self._operations = operations
+        self._keys = keys
+        self._hidden = frozenset(hidden)
+        self._pending = set(operations)
+        self._computing = set()
+        self._scope = None if self._hidden else self
+
+    def _operations_scope(self) -> "LazyRow":
+        """Return row given to operations (sharing values, nothing hidden)"""
+        if self._scope is None:
+            scope = object.__new__(LazyRow)
+            for name in ("_values", "_operations", "_keys", "_pending", "_computing"):
+                setattr(scope, name, getattr(self, name))
+            scope._hidden = frozenset()  # pylint: disable=protected-access
+            scope._scope = scope  # pylint: disable=protected-access
+            self._scope = scope
+        return self._scope
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._hidden:
+            raise KeyError(key)
+        if key in self._pending and key not in self._computing:
+            self._computing.add(key)
+            try:
+                value = self._operations[key](self._operations_scope())
+            finally:
+                self._computing.discard(key)
+            self._values[key] = value
+            self._pending.discard(key)
+            return value
+        try:
+            return self._values[key]
+        except KeyError:
+            if key in self._computing:
+                raise ValueError(f"Cyclic dependency on attribute {key!r}") from None
+            raise
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __iter__(self) -> Iterator[str]:
+        return (key for key in self._keys if key not in self._hidden)
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        items = ", ".join(
+            f"{key}={'<pending>' if key in self._pending else repr(self._values[key])}"
+            for key in self
+        )
+        return f"LazyRow({items})"
+
+    def __reduce__(self):
+        return OrderedDict, (list(self.items()),)
+
+
+def record_class(fields: Tuple[str, ...], /) -> type:
+    """Return subclass of Record with given fields (one class per fields)
+
+    Raise:
+        (ValueError): a field is not an identifier, or is a Record attribute
+            (e.g. 'keys', 'items')
+    """
+    fields = tuple(fields)
+    cls = _RECORD_CLASSES.get(fields)
+    if cls is not None:
+        return cls
+    invalid = [
+        field for field in fields
+        if not field.isidentifier() or keyword.iskeyword(field)
+        or hasattr(Record, field)
+    ]
+    if invalid:
+        raise ValueError(
+            f"Invalid record fields: {', '.join(map(repr, invalid))}"
+        )
+    body = "".join(f"\n    self.{field} = {field}" for field in fields)
+    source = f"def __init__(self, {', '.join(fields)}):{body or ' pass'}\n"
+    namespace = {}
+    exec(source, namespace)  # pylint: disable=exec-used
+    cls = type("Record", (Record,), {
+        "__slots__": fields,
+        "_fields": fields,
+        "__init__": namespace["__init__"],
+    })
+    _RECORD_CLASSES[fields] = cls
+    return cls
+
+
+def make_record(fields: Tuple[str, ...], values: Dict[str, Any], /) -> Record:
+    """Return record with given fields, set with values (unpickling)"""
+    record = object.__new__(record_class(fields))
+    for key, value in values.items():
+        setattr(record, key, value)
+    return record
 
 
 class RowReader:
@@ -15,6 +300,8 @@ class RowReader:
         conversions: Dict[str, Callable] = None,
         operations: Dict[str, Callable] = None,
         delete: List[str] = None,
+        compiled: bool = False,
+        lazy: bool = False,
     ):
         """Initialize a row reader instance
 
@@ -25,16 +312,36 @@ class RowReader:
                 attributes read from rows
             operations (dict)   : (attribute, func) to build new attributes
                 from instance built with read and converted attributes
-                One should use OrderedDict if operation order matters
+                operations run in order, unless they declare attributes they
+                depend on (@see `requires`): they then run after operations
+                building these attributes
             delete (list)       : attributes to delete ones building is over
+            compiled (bool)     : generate one function reading rows at once
+                rows are records (@see `Record`) instead of OrderedDict
+                attributes must be identifiers
+                deleted attributes are not stored in records
+            lazy (bool)         : operations run on first access to their
+                attribute (@see `LazyRow`), only by read
+                errors of operations are raised on access
+
+        Raise:
+            (ValueError): conversions of attributes that are not fields,
+                deletion of unknown attributes, operations requiring unknown
+                attributes or having cyclic dependencies, both compiled and
+                lazy, compiled and an attribute is not a valid record field
+                (@see `record_class`)
+
+        Operations marked with `vectorized` are only supported by read_many
+        and read_columns.
 
         Example:
             >> reader = RowReader(
                 fields={'id': "ID", 'name': "Name"},
                 conversions={'id': int},
-                operations={'label': lambda r: str(r.id) + "." + r.name}
+                operations={'label': lambda r: str(r.id) + "." + r.name},
+                compiled=True,
             )
-            >> row = reader.read({'ID': "8", 'name': "Name"})
+            >> row = reader.read({'ID': "8", 'Name': "Octave"})
             >> assert row.id == 8
             >> assert row.name == "Octave"
             >> assert row.label == "8.Octave"
@@ -43,8 +350,144 @@ class RowReader:
         self.conversions = conversions if conversions else {}
         self.operations = operations if operations else {}
         self.delete = delete if delete else []
+        self.compiled = compiled
+        self.lazy = lazy
+        if compiled and lazy:
+            raise ValueError("RowReader can't be both compiled and lazy")
+        unknown = [key for key in self.conversions if key not in fields]
+        if unknown:
+            raise ValueError(
+                "Conversions of attributes that are not fields:"
+                f" {', '.join(map(repr, unknown))}"
+            )
+        self._order = self._sort_operations()
+        self._keys = (
+            *fields, *[key for key in self._order if key not in fields]
+        )
+        unknown = [key for key in self.delete if key not in self._keys]
+        if unknown:
+            raise ValueError(
+                f"Deletion of unknown attributes: {', '.join(map(repr, unknown))}"
+            )
+        self._vectorized = [
+            key for key in self._order
+            if getattr(self.operations[key], "vectorized", False)
+        ]
+        if compiled:
+            self.read = self._compile()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = dict(self.__dict__)
+        state.pop("read", None)  # Generated functions are not picklable
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]):
+        self.__dict__.update(state)
+        if self.compiled:
+            self.read = self._compile()
+
+    def _missing(self, irow: RowDict, /):
+        """Raise error listing fields missing in row"""
+        diff = content_diff(irow.keys(), self.fields.values())
+        raise KeyError(
+            f"Row is missing keys: {', '.join(map(repr, diff['plus']))}"
+        ) from None
+
+    def _vectorized_error(self, irow: RowDict = None, /):
+        """Raise error of reading one row with vectorized operations"""
+        raise ValueError(
+            "Vectorized operations can't read a single row (use read_many):"
+            f" {', '.join(map(repr, self._vectorized))}"
+        )
+
+    def _sort_operations(self) -> List[str]:
+        """Return attributes built by operations, in order of execution
+
+        Operations run in order of operations, except when they require an
+        attribute built by a following operation.
+
+        Raise:
+            (ValueError): unknown required attributes, cyclic dependencies
+        """
+        known = set(self.fields) | set(self.operations)
+        keys = list(self.operations)
+        remaining = {}  # Operation -> operations it waits for
+        for key, func in self.operations.items():
+            required = getattr(func, "requires", ())
+            unknown = [attr for attr in required if attr not in known]
+            if unknown:
+                raise ValueError(
+                    f"Operation {key!r} requires unknown attributes:"
+                    f" {', '.join(map(repr, unknown))}"
+                )
+            # Operation replacing a field depends on the field itself
+            remaining[key] = {
+                attr for attr in required if attr in self.operations and attr != key
+            }
+
+        ready = [i for i, key in enumerate(keys) if not remaining[key]]
+        order = []
+        while ready:
+            key = keys[heapq.heappop(ready)]
+            order.append(key)
+            for i, other in enumerate(keys):
+                if key in remaining[other]:
+                    remaining[other].discard(key)
+                    if not remaining[other]:
+                        heapq.heappush(ready, i)
+        if len(order) < len(keys):
+            cycle = [key for key in keys if remaining[key]]
+            raise ValueError(
+                f"Cyclic dependencies b/w operations: {', '.join(map(repr, cycle))}"
+            )
+        return order
+
+    def _compile(self) -> Callable[[RowDict], Record]:
+        """Return function reading a row, generated for reader attributes
+
+        Values are kept in local variables: only final attributes are stored
+        in record, built once. Operations are called with record being built
+        (or with a scratch record of all attributes if some are deleted).
+        """
+        if self._vectorized:
+            return self._vectorized_error
+        attrs = list(self._keys)
+        final = [attr for attr in attrs if attr not in self.delete]
+        namespace = {"_missing": self._missing, "_Record": record_class(final)}
+        var = {attr: f"_v{i}" for i, attr in enumerate(attrs)}
+
+        lines = ["try:"]
+        lines += [
+            f"    {var[attr]} = irow[{field!r}]"
+            for attr, field in self.fields.items()
+        ]
+        lines += ["except KeyError:", "    _missing(irow)"]
+        for i, (attr, func) in enumerate(self.conversions.items()):
+            namespace[f"_conv{i}"] = func
+            lines.append(f"{var[attr]} = _conv{i}({var[attr]})")
 
-    def read(self, irow: RowDict) -> RowDict:
+        values = lambda keys, obj=None: ", ".join(  # noqa: E731
+            f"{obj}.{key}" if obj else var[key] for key in keys
+        )
+        if not self.operations:
+            lines.append(f"return _Record({values(final)})")
+        else:
+            scratch = "_Record" if len(final) == len(attrs) else "_Scratch"
+            namespace["_Scratch"] = record_class(attrs)
+            lines.append(f"row = object.__new__({scratch})")
+            lines += [f"row.{attr} = {var[attr]}" for attr in self.fields]
+            for i, attr in enumerate(self._order):
+                namespace[f"_op{i}"] = self.operations[attr]
+                lines.append(f"row.{attr} = _op{i}(row)")
+            if scratch == "_Record":
+                lines.append("return row")
+            else:
+                lines.append(f"return _Record({values(final, 'row')})")
+        source = "def read(irow):\n" + "".join(f"    {line}\n" for line in lines)
+        exec(source, namespace)  # pylint: disable=exec-used
+        return namespace["read"]
+
+    def read(self, irow: RowDict) -> Union[RowDict, Record, LazyRow]:
         """Build an instance from initial row with required attributes
 
         Args:
@@ -52,27 +495,140 @@ class RowReader:
 
         Raises:
             (KeyError) if a field is missing in row
+            (ValueError) if reader has vectorized operations (@see `vectorized`)
 
         Returns:
-            (OrderedDict)
+            (OrderedDict), or (Record) if compiled, or (LazyRow) if lazy
         """
+        if self._vectorized:
+            self._vectorized_error()
         try:
             row = OrderedDict(
                 [(attr, irow[field]) for attr, field in self.fields.items()]
             )
         except KeyError:
-            diff = content_diff(irow.keys(), self.fields.values())
-            raise KeyError(
-                f"Row is missing keys: {', '.join(map(repr, diff['plus']))}"
-            ) from None
+            self._missing(irow)
 
         for key, func in self.conversions.items():
             row[key] = func(row[key])
 
-        for key, func in self.operations.items():
-            row[key] = func(row)
+        if self.lazy:
+            return LazyRow(row, self.operations, self._keys, hidden=self.delete)
+
+        for key in self._order:
+            row[key] = self.operations[key](row)
 
         for key in self.delete:
             del row[key]
 
         return row
+
+    def read_many(
+        self, rows: Iterable[RowDict], /, *, output: str = "rows"
+    ) -> Union[List[Union[RowDict, Record]], ColumnDict]:
+        """Build instances from initial rows, converting them column by column
+
+        Args:
+            rows    : rows to read (e.g. rows of `~olutils.storing.read_csv`)
+            output  : what to return
+                "rows"      > list of rows, as returned by read
+                "columns"   > dict of numpy columns by attribute
+
+        Raise:
+            (KeyError): a field is missing in a row
+            (ValueError): unknown output, or vectorized operation returning a
+                column of wrong length
+
+        Returns:
+            @see output
+        """
+        rows = rows if isinstance(rows, list) else list(rows)
+        table = OrderedDict()
+        for attr, field in self.fields.items():
+            try:
+                table[attr] = [row[field] for row in rows]
+            except KeyError:
+                self._missing(next(row for row in rows if field not in row))
+        return self._read_table(table, len(rows), output)
+
+    def read_columns(
+        self, columns: Dict[str, Sequence], /, *, output: str = "columns"
+    ) -> Union[List[Union[RowDict, Record]], ColumnDict]:
+        """Build instances from columns of initial rows
+
+        Args:
+            columns : (column name, values) items, numpy arrays or lists
+                e.g. chunks of `~olutils.storing.read_csv` with chunksize
+            output  : @see `read_many` (dft is "columns")
+
+        Raise:
+            (KeyError): a field is missing in columns
+            (ValueError): unknown output, columns of different lengths, or
+                vectorized operation returning a column of wrong length
+
+        Returns:
+            @see output
+        """
+        try:
+            table = OrderedDict(
+                [(attr, columns[field]) for attr, field in self.fields.items()]
+            )
+        except KeyError:
+            self._missing(columns)
+        sizes = {len(values) for values in table.values()}
+        if len(sizes) > 1:
+            raise ValueError("Columns must have same length")
+        return self._read_table(table, sizes.pop() if sizes else 0, output)
+
+    def _rows(self, table: Dict[str, Sequence], /, extra: List[str] = ()) -> List:
+        """Return rows of table, as rows of read (extra attributes are None)"""
+        keys = [*table, *[key for key in extra if key not in table]]
+        columns = [_as_list(values) for values in table.values()]
+        if self.compiled:
+            build = record_class(keys)
+            pad = (None,) * (len(keys) - len(table))
+            return [build(*values, *pad) for values in zip(*columns)]
+        return [OrderedDict(zip(keys, values)) for values in zip(*columns)]
+
+    def _read_table(
+        self, table: Dict[str, Sequence], size: int, output: str, /
+    ) -> Union[List[Union[RowDict, Record]], ColumnDict]:
+        """Convert, build and delete columns of table, return output"""
+        if output not in OUTPUTS:
+            raise ValueError(f"output must be one of {OUTPUTS}, got {output!r}")
+        for key, func in self.conversions.items():
+            table[key] = convert_column(func, table[key])
+
+        operations = [(key, self.operations[key]) for key in self._order]
+        while operations:
+            key, func = operations[0]
+            if getattr(func, "vectorized", False):
+                for col, values in table.items():
+                    table[col] = _as_array(values)
+                column = _as_array(func(table))
+                if len(column) != size:
+                    raise ValueError(
+                        f"Operation {key!r} returned {len(column)} values"
+                        f" for {size} rows"
+                    )
+                table[key] = column
+                operations.pop(0)
+                continue
+            # Consecutive row operations are applied to same rows
+            batch = []
+            while operations and not getattr(operations[0][1], "vectorized", False):
+                batch.append(operations.pop(0))
+            rows = self._rows(table, [key for key, _ in batch])
+            for row in rows:
+                for key, func in batch:
+                    row[key] = func(row)
+            for key, _ in batch:
+                table[key] = [row[key] for row in rows]
+
+        for key in self.delete:
+            table.pop(key, None)
+        if output == "columns":
+            return OrderedDict(
+                (key, _as_array(values)) for key, values in table.items()
+            )
+        return self._rows(table)
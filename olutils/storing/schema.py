@@ -0,0 +1,170 @@
+"""Typed reading of csv rows
+
+A schema is a dictionary of (column, type) items where type is one of
+SCHEMA_TYPES. It is compiled into one function converting raw rows (lists of
+strings) to typed dictionaries, or into numpy parsers for columnar reading.
+
+Empty values (and missing ones) are converted to None in rows, to NaN / NaT
+in numpy columns.
+"""
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List
+
+import numpy as np
+
+from olutils.conversion import str2dt
+from olutils.typing import RowDict
+
+Schema = Dict[str, type]
+
+TRUE_STRINGS = {"true", "t", "yes", "y", "1"}
+FALSE_STRINGS = {"false", "f", "no", "n", "0"}
+
+
+def str2bool(value: str, /) -> bool:
+    """Return boolean described by string
+
+    Raise:
+        (ValueError): string does not describe a boolean
+    """
+    lvalue = value.strip().lower()
+    if lvalue in TRUE_STRINGS:
+        return True
+    if lvalue in FALSE_STRINGS:
+        return False
+    raise ValueError(f"Can't convert {value!r} to bool")
+
+
+def str2datetime(value: str, /) -> datetime:
+    """Return datetime from string (faster than str2dt with ISO formats)"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return str2dt(value)
+
+
+SCHEMA_TYPES = {
+    int: int,
+    float: float,
+    bool: str2bool,
+    datetime: str2datetime,
+    str: None,
+}
+
+
+def compile_converter(
+    fieldnames: List[str],
+    schema: Schema = None,
+    /,
+    usecols: List[str] = None,
+) -> Callable[[List[str]], RowDict]:
+    """Return function converting a raw row into a typed dictionary
+
+    The function is generated once for given columns, so that each row is
+    converted in one call without looking up converters of columns.
+
+    Args:
+        fieldnames  : name of each column of raw rows
+        schema      : (column, type) items to convert values with
+            columns not in schema are kept as str
+        usecols     : columns to keep in dictionary (dft is all columns)
+
+    Raise:
+        (ValueError): unknown column or type
+
+    Example:
+        >>> convert = compile_converter(["a", "b"], {'a': int})
+        >>> convert(["1", "x"])
+        {'a': 1, 'b': 'x'}
+    """
+    schema = {} if schema is None else schema
+    usecols = fieldnames if usecols is None else usecols
+    missing = [col for col in [*schema, *usecols] if col not in fieldnames]
+    if missing:
+        raise ValueError(f"Unknown columns: {', '.join(map(repr, missing))}")
+
+    namespace = {}
+    items = []
+    for col in usecols:
+        value = f"row[{fieldnames.index(col)}]"
+        ctype = schema.get(col, str)
+        try:
+            func = SCHEMA_TYPES[ctype]
+        except KeyError:
+            raise ValueError(f"Unknown type for column {col!r}: {ctype}") from None
+        if func is not None:
+            name = f"_conv{len(namespace)}"
+            namespace[name] = func
+            value = f"{name}({value}) if {value} else None"
+        items.append(f"{col!r}: {value}")
+    source = f"def convert(row):\n    return {{{', '.join(items)}}}\n"
+    exec(source, namespace)  # pylint: disable=exec-used
+    return namespace["convert"]
+
+
+def parse_column(values: np.ndarray, ctype: type, /) -> np.ndarray:
+    """Return numpy column of strings converted to type
+
+    Empty strings are converted to NaN for numbers (int columns with empty
+    values are float columns), to NaT for datetimes and to False for bools.
+    """
+    if ctype is str:
+        return values
+    empty = values == ""
+    if ctype is int:
+        if empty.any():
+            return parse_column(values, float)
+        return values.astype(np.int64)
+    if ctype is float:
+        return np.where(empty, "nan", values).astype(np.float64)
+    if ctype is bool:
+        lvalues = np.char.lower(np.char.strip(values))
+        unknown = ~(np.isin(lvalues, list(TRUE_STRINGS | FALSE_STRINGS)) | empty)
+        if unknown.any():
+            raise ValueError(f"Can't convert {values[unknown][0]!r} to bool")
+        return np.isin(lvalues, list(TRUE_STRINGS))
+    if ctype is datetime:
+        return values.astype("datetime64[us]")
+    raise ValueError(f"Unknown type: {ctype}")
+
+
+def infer_schema(rows: Iterable[RowDict], /) -> Schema:
+    """Return schema of rows, guessing type of each column from its values
+
+    A column is of the first type among int, float, bool and datetime (ISO
+    format) that can convert all its non-empty values, else it is of type str.
+    """
+    values = {}
+    for row in rows:
+        for col, value in row.items():
+            if col is None:
+                continue
+            values.setdefault(col, [])
+            if value:
+                values[col].append(value)
+
+    inference_funcs = {
+        int: int,
+        float: float,
+        bool: str2bool,
+        datetime: datetime.fromisoformat,
+    }
+
+    def convertible(func, col_values):
+        try:
+            for value in col_values:
+                func(value)
+        except (ValueError, OverflowError):
+            return False
+        return True
+
+    schema = {}
+    for col, col_values in values.items():
+        schema[col] = str
+        if not col_values:
+            continue
+        for ctype, func in inference_funcs.items():
+            if convertible(func, col_values):
+                schema[col] = ctype
+                break
+    return schema
@@ -0,0 +1,214 @@
+"""External merge sort of csv files larger than memory
+
+Rows are read by runs fitting a memory budget, each run being sorted and
+spilled to a temporary file (by a pool of processes if workers > 1). Runs are
+then merged with a heap (@see `heapq.merge`), at most fan_in at once.
+
+Values are compared as strings unless converted (e.g. {'age': int}). Empty
+values are compared as smaller than any other value. Sort is stable.
+"""
+import heapq
+import os
+import shutil
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from csv import reader as csv_reader, writer as csv_writer
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple, Union
+
+from olutils.os import copen
+from .csv import DFT_CHUNKSIZE, guess_delimiter, write_csv
+from .parallel import pool_map
+
+DFT_MEMORY = 256 * 1024 * 1024  # Bytes
+DFT_FAN_IN = 128  # Max number of runs merged at once
+ROW_OVERHEAD = sys.getsizeof([]) + sys.getsizeof("")  # Estimate, bytes by row
+VALUE_OVERHEAD = sys.getsizeof("") + 8  # Estimate, bytes by value
+
+
+class SortKey:
+    """Picklable key function of rows (lists of strings)"""
+
+    def __init__(
+        self,
+        fieldnames: List[str],
+        by: List[str],
+        converters: Dict[str, Callable[[str], object]],
+        /,
+    ):
+        """Initialize instance
+
+        Raise:
+            (ValueError): unknown column in by
+        """
+        unknown = [col for col in by if col not in fieldnames]
+        if unknown:
+            raise ValueError(f"Unknown columns to sort by: {', '.join(unknown)}")
+        self.spec = [
+            (fieldnames.index(col), converters.get(col)) for col in by
+        ]
+
+    def __call__(self, row: List[str]) -> Tuple:
+        key = []
+        for i, conv in self.spec:
+            value = row[i] if i < len(row) else ""
+            if value == "":
+                key.append((False, None))
+            else:
+                key.append((True, value if conv is None else conv(value)))
+        return tuple(key)
+
+
+def _write_run(args: Tuple) -> str:
+    """Sort rows and write them in a run file, return its path"""
+    rows, key, reverse, path = args
+    rows.sort(key=key, reverse=reverse)
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        csv_writer(file).writerows(rows)
+    return path
+
+
+def _iter_run(path: str, /) -> Iterator[List[str]]:
+    """Iterate rows of run file"""
+    with open(path, newline="", encoding="utf-8") as file:
+        yield from csv_reader(file)
+
+
+def _merge_runs(
+    paths: List[str], key: SortKey, reverse: bool, path: str, /
+) -> str:
+    """Merge run files in a new run file, return its path"""
+    with open(path, "w", newline="", encoding="utf-8") as file:
+        writer = csv_writer(file)
+        merged = heapq.merge(*map(_iter_run, paths), key=key, reverse=reverse)
+        while True:
+            chunk = list(islice(merged, DFT_CHUNKSIZE))
+            if not chunk:
+                break
+            writer.writerows(chunk)
+    for run in paths:
+        os.remove(run)
+    return path
+
+
+def iter_runs(rows: Iterable[List[str]], /, max_bytes: int) -> Iterator[List]:
+    """Iterate lists of consecutive rows weighing at most max_bytes (estimate)"""
+    run, nbytes = [], 0
+    for row in rows:
+        run.append(row)
+        nbytes += ROW_OVERHEAD + sum(len(value) + VALUE_OVERHEAD for value in row)
+        if nbytes >= max_bytes:
+            yield run
+            run, nbytes = [], 0
+    if run:
+        yield run
+
+
+def sort_csv(
+    path: str,
+    output: str,
+    /,
+    by: Union[str, List[str]],
+    *,
+    converters: Dict[str, Callable[[str], object]] = None,
+    reverse: bool = False,
+    delimiter: str = "smart",
+    encoding: str = None,
+    memory: int = DFT_MEMORY,
+    workers: int = 1,
+    fan_in: int = DFT_FAN_IN,
+    tmp_dir: str = None,
+    **kwargs,
+):
+    """Sort rows of csv file at path by columns, with bounded memory
+
+    Args:
+        path        : path to input (compressed files are decompressed)
+        output      : path to output (compression given suffix)
+        by          : column(s) to sort rows by
+        converters  : (column, conversion func) items to convert values of
+            columns compared, as conversions of RowReader (e.g. {'age': int})
+            output values are not converted
+        reverse     : sort in descending order
+        delimiter   : delimiter for columns of input (and output)
+            "smart" > @see `~olutils.storing.csv.guess_delimiter`
+        encoding    : encoding of input (and output)
+        memory      : approximate memory budget in bytes for rows held
+            shared by runs being sorted by workers and run being read
+        workers     : number of processes sorting and spilling runs
+            converters must be picklable (no lambda) if workers > 1
+        fan_in      : max number of runs merged at once (and of files open)
+        tmp_dir     : directory where runs are spilled (dft is system one)
+        **kwargs    : @see `~olutils.storing.write_csv`
+            compresslevel, buffering, ...
+
+    Raise:
+        (ValueError): delimiter can't be guessed, unknown column in by
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    converters = converters if converters else {}
+    if delimiter == "smart":
+        delimiter = guess_delimiter(path, encoding=encoding)
+    run_bytes = memory if workers <= 1 else memory // (workers + 1)
+
+    with copen(path, "r", encoding=encoding, newline="") as file:
+        records = csv_reader(file, delimiter=delimiter)
+        fieldnames = next(records, [])
+        key = SortKey(fieldnames, by, converters)
+        runs = iter_runs(records, run_bytes)
+        fstrun = next(runs, [])
+        sndrun = next(runs, None)
+        if sndrun is None:  # Fits in memory
+            fstrun.sort(key=key, reverse=reverse)
+            write_csv(
+                fstrun,
+                output,
+                fieldnames=fieldnames,
+                delimiter=delimiter,
+                encoding=encoding,
+                **kwargs,
+            )
+            return
+
+        run_dir = tempfile.mkdtemp(prefix="sort_csv_", dir=tmp_dir)
+        try:
+            tasks = (
+                (run, key, reverse, os.path.join(run_dir, f"run_{i}.csv"))
+                for i, run in enumerate(chain([fstrun, sndrun], runs))
+            )
+            del fstrun, sndrun
+            if workers > 1:
+                with ProcessPoolExecutor(workers) as executor:
+                    paths = list(pool_map(
+                        _write_run, tasks, executor, max_pending=workers
+                    ))
+            else:
+                paths = list(map(_write_run, tasks))
+        except BaseException:
+            shutil.rmtree(run_dir)
+            raise
+
+    try:
+        level = 0
+        while len(paths) > fan_in:  # Merge groups of consecutive runs
+            paths = [
+                _merge_runs(
+                    paths[i:i + fan_in],
+                    key,
+                    reverse,
+                    os.path.join(run_dir, f"merged_{level}_{i}.csv"),
+                )
+                for i in range(0, len(paths), fan_in)
+            ]
+            level += 1
+        write_csv(
+            heapq.merge(*map(_iter_run, paths), key=key, reverse=reverse),
+            output,
+            fieldnames=fieldnames,
+            delimiter=delimiter,
+            encoding=encoding,
+            **kwargs,
+        )
+    finally:
+        shutil.rmtree(run_dir)
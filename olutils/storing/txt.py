@@ -1,10 +1,17 @@
 """Functions to read and write text files."""
+import re
 from collections.abc import Iterable as IterableABC
-from typing import Iterable, List, Union
+from locale import getpreferredencoding
+from mmap import ACCESS_READ, mmap as memorymap
+from typing import Callable, Iterable, List, Pattern, Tuple, Union
 
 from olutils.collection import identity
-from olutils.os import sopen
+from olutils.os import copen, get_compression, sopen
 from .common import DFT_EOL
+from .index import IndexedTxt
+
+EOL_BYTES = b"\r\n"
+EOL_PATTERN = re.compile(b"\r\n?|\n")
 
 
 def rm_eol(line, /):
@@ -12,6 +19,57 @@ def rm_eol(line, /):
     return line.rstrip("\n\r")
 
 
+def _line_end(line: bytes, /) -> bytes:
+    """Return line with terminator normalized to b'\\n' (as in text mode)"""
+    if line.endswith(b"\r\n"):
+        return line[:-2] + b"\n"
+    if line.endswith(b"\r"):
+        return line[:-1] + b"\n"
+    return line
+
+
+def iter_spans(
+    buffer: Union[bytes, memorymap], /, pattern: Pattern[bytes] = None
+) -> Iterable[Tuple[int, int]]:
+    """Iterate (start, end) positions of lines in buffer (terminator included)
+
+    Lines end with b'\\n', b'\\r\\n' or b'\\r', as in text mode.
+
+    Args:
+        buffer  : bytes-like object to search lines in
+        pattern : if given, only lines where pattern matches (re.search) are
+            iterated, each line being searched with terminator normalized to
+            b'\\n', as lines read in text mode
+            if buffer has no b'\\r', whole buffer is searched at once (in
+            multiline mode), matches spanning several lines being ignored
+    """
+    size = len(buffer)
+    if pattern is None:
+        start = 0
+        for eol in EOL_PATTERN.finditer(buffer):
+            yield start, eol.end()
+            start = eol.end()
+        if start < size:
+            yield start, size
+        return
+    if buffer.find(b"\r") != -1:
+        for start, end in iter_spans(buffer):
+            if pattern.search(_line_end(buffer[start:end])):
+                yield start, end
+        return
+    multiline = re.compile(pattern.pattern, pattern.flags | re.MULTILINE)
+    pos = 0
+    while pos < size:
+        match = multiline.search(buffer, pos)
+        if match is None or match.start() >= size:
+            return
+        start = buffer.rfind(b"\n", 0, match.start()) + 1
+        end = buffer.find(b"\n", match.start()) + 1 or size
+        if match.end() <= end or pattern.search(buffer[start:end]):
+            yield start, end
+        pos = end
+
+
 def read_txt(
     path: str,
     /,
@@ -21,7 +79,12 @@ def read_txt(
     f_eol: str = None,
     mode: str = None,
     encoding: str = None,
-) -> Union[List[str], str, Iterable[str]]:
+    compression: str = "infer",
+    buffering: int = -1,
+    index: bool = False,
+    mmap: bool = False,
+    pattern: Union[str, bytes, Pattern] = None,
+) -> Union[List[str], str, Iterable[str], Iterable[memoryview], IndexedTxt]:
     """Return content of text file at path
 
     Args:
@@ -30,14 +93,30 @@ def read_txt(
             Iterable, "iter", "iterable"        -> Iterable on rows
             list, "list"                        -> list of strings
             str, "str", "string"                -> rows joined with ''
+            memoryview, "view"                  -> Iterable on memoryviews of
+                undecoded rows (requires mmap)
         w_eol   : return lines with line terminators
         f_eol   : force line terminators to a given string
         mode    : mode to open file with (default is 'r')
         encoding: encoding used to read file
+        compression: @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are decompressed given suffix
+        buffering: @see `~olutils.os.copen`
+        index   : return sequence of lines with random access (rtype is ignored)
+            @see `~olutils.storing.index.IndexedTxt`
+            index of lines is stored next to file (built if not up-to-date)
+        mmap    : read file through a memory map
+            list and str are decoded and split in bulk
+            lines are iterated as views on map with memoryview rtype
+            line terminators are normalized to '\\n' as in text mode (they are
+            kept in memoryviews)
+        pattern : regular expression lines must match (re.search) to be read
+            with mmap, it is encoded and searched in bytes (@see `iter_spans`)
 
     Raise:
         (TypeError) : f_eol-type not handled
-        (ValueError): rtype not handled
+        (ValueError): rtype not handled, or compressed file is indexed or
+            memory-mapped, or memoryview rtype without mmap
     """
     mode = "r" if mode is None else mode
 
@@ -52,17 +131,36 @@ def read_txt(
     else:
         raise TypeError(f"f_eol must be str or NoneType, got {type(f_eol)}")
 
+    if index:
+        return IndexedTxt(path, line_conv=line_conv, encoding=encoding)
+    if mmap:
+        return _read_mmap(
+            path, rtype=rtype, line_conv=line_conv, encoding=encoding, pattern=pattern
+        )
+    if rtype in [memoryview, "view"]:
+        raise ValueError("memoryview rtype requires mmap")
+
+    if isinstance(pattern, (str, bytes)):
+        pattern = re.compile(pattern)
+
     # Create row iterator
     def line_iterator() -> Iterable[str]:
         """Iterate lines of file at path"""
-        with open(path, mode, encoding=encoding) as file:
-            for line in file:
+        with copen(
+            path,
+            mode,
+            encoding=encoding,
+            compression=compression,
+            buffering=buffering,
+        ) as file:
+            lines = file if pattern is None else filter(pattern.search, file)
+            for line in lines:
                 yield line_conv(line)
 
     # Return
     line_iter = line_iterator()
     if rtype in [list, "list"]:
-        return [line_conv(line) for line in line_iter]
+        return list(line_iter)
     if rtype in [Iterable, "iter", "iterable"]:
         return line_iter
     if rtype in [str, "str", "string"]:
@@ -70,6 +168,103 @@ def read_txt(
     raise ValueError(f"Unexpected value for rtype param: {rtype}")
 
 
+def _read_mmap(
+    path: str,
+    /,
+    *,
+    rtype: type,
+    line_conv: Callable[[str], str],
+    encoding: str,
+    pattern: Union[str, bytes, Pattern],
+) -> Union[List[str], str, Iterable[str], Iterable[memoryview]]:
+    """Return content of text file at path, read through a memory map
+
+    @see `read_txt`
+    """
+    if get_compression(path) is not None:
+        raise ValueError(f"Can't memory-map compressed file '{path}'")
+    encoding = getpreferredencoding(False) if encoding is None else encoding
+    if isinstance(pattern, str):
+        pattern = pattern.encode(encoding)
+    if isinstance(pattern, bytes):
+        pattern = re.compile(pattern)
+    elif isinstance(pattern, Pattern) and isinstance(pattern.pattern, str):
+        pattern = re.compile(pattern.pattern.encode(encoding), pattern.flags & ~re.U)
+
+    with open(path, "rb") as file:
+        try:
+            buffer = memorymap(file.fileno(), 0, access=ACCESS_READ)
+        except ValueError:  # Empty file
+            buffer = b""
+
+    def close():
+        """Close memory map (left to garbage collection if views remain)"""
+        if isinstance(buffer, memorymap):
+            try:
+                buffer.close()
+            except BufferError:
+                pass
+
+    def decode(start, end):
+        """Return decoded lines b/w positions (with normalized terminators)"""
+        text = buffer[start:end].decode(encoding)
+        if "\r" in text:
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return text
+
+    def split(text):
+        """Return lines of text, converted"""
+        lines = text.split("\n")
+        last = [lines[-1]] if lines[-1] else []
+        lines = [line + "\n" for line in lines[:-1]] + last
+        if line_conv is identity:
+            return lines
+        return [line_conv(line) for line in lines]
+
+    def line_iterator():
+        """Iterate lines of buffer, decoded"""
+        try:
+            for start, end in iter_spans(buffer, pattern):
+                yield line_conv(decode(start, end))
+        finally:
+            close()
+
+    def view_iterator():
+        """Iterate lines of buffer as memoryviews"""
+        view = memoryview(buffer)
+        try:
+            for start, end in iter_spans(buffer, pattern):
+                if line_conv is rm_eol:
+                    while end > start and buffer[end - 1] in EOL_BYTES:
+                        end -= 1
+                yield view[start:end]
+        finally:
+            view.release()
+            close()
+
+    if rtype in [memoryview, "view"]:
+        if line_conv not in [identity, rm_eol]:
+            close()
+            raise ValueError("f_eol can't be used with memoryview rtype")
+        return view_iterator()
+    if rtype in [Iterable, "iter", "iterable"]:
+        return line_iterator()
+    try:
+        if rtype in [list, "list"]:
+            if pattern is None:
+                return split(decode(0, len(buffer)))
+            return list(line_iterator())
+        if rtype in [str, "str", "string"]:
+            if pattern is None and line_conv is identity:
+                return decode(0, len(buffer))
+            if pattern is None:
+                return "".join(split(decode(0, len(buffer))))
+            return "".join(line_iterator())
+    finally:
+        close()
+    raise ValueError(f"Unexpected value for rtype param: {rtype}")
+
+
 def write_txt(
     content: Union[str, Iterable[str]],
     path: str,
@@ -78,6 +273,9 @@ def write_txt(
     has_eol: bool = True,
     eol: str = DFT_EOL,
     encoding: str = None,
+    compression: str = "infer",
+    compresslevel: int = None,
+    buffering: int = -1,
 ):
     """Write content in a text file
 
@@ -88,8 +286,18 @@ def write_txt(
             used only if content is an iterator
         eol     : line terminator to use if lines have None
         encoding: encoding of file
+        compression: @see `~olutils.os.copen`
+            "infer" > gz, bz2 and xz files are compressed given suffix
+        compresslevel, buffering: @see `~olutils.os.copen`
     """
-    with sopen(path, "w+", encoding=encoding) as file:
+    with sopen(
+        path,
+        "w+",
+        encoding=encoding,
+        compression=compression,
+        compresslevel=compresslevel,
+        buffering=buffering,
+    ) as file:
         if isinstance(content, str):
             file.write(content)
         elif isinstance(content, IterableABC):
@@ -98,3 +306,8 @@ def write_txt(
             file.writelines(content)
         else:
             file.write(str(content))
+
+
+def iter_txt(path: str, /, **kwargs) -> Iterable[str]:
+    """Iterate lines of text file at path, @see `read_txt`"""
+    return read_txt(path, **{**kwargs, "rtype": "iter"})
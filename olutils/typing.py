@@ -3,6 +3,7 @@ from typing import Any, Callable, Dict, TypeVar, Union
 
 import numpy as np
 
+ColumnDict = Dict[str, np.ndarray]
 RowDict = Dict[str, Any]
 Factory = Callable[[], Any]  # Used by defaultdict
 Number = Union[int, float, np.number]
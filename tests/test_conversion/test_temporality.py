@@ -44,8 +44,18 @@ def test_secs2unit():
         assert list(res) == list(out)
 
         res = lib.secs2unit(np.array(inp), unit)
-        assert isinstance(res, map if unit in ['td', 'dt'] else np.ndarray)
-        assert list(res) == list(out)
+        assert isinstance(res, np.ndarray)
+        assert res.tolist() == list(out)
+
+    # Numpy arrays are converted to datetime64 / timedelta64 arrays
+    res = lib.secs2unit(np.array([1.5, np.nan]), "dt")
+    assert res.dtype == np.dtype("datetime64[us]")
+    assert res[0] == np.datetime64("1970-01-01T00:00:01.5") and np.isnat(res[1])
+    res = lib.secs2unit(np.array([90]), "td")
+    assert res.dtype == np.dtype("timedelta64[us]")
+    tds = np.array([90, 7200], dtype="timedelta64[s]")
+    assert lib.secs2unit(tds, "min").tolist() == [1.5, 120]
+    assert lib.secs2unit(tds, "td").tolist() == [timedelta(0, 90), timedelta(0, 7200)]
 
     with pytest.raises(ValueError):
         lib.secs2unit(10,"unknown")
@@ -57,10 +67,22 @@ def test_secs2unit():
 def test_dt2ts():
     assert lib.dt2ts(datetime(1970, 1, 2)) == DAY
 
+    dts = np.array(
+        ["1970-01-02", "1970-01-01T00:00:01.5", "NaT"], dtype="datetime64[ms]"
+    )
+    res = lib.dt2ts(dts)
+    assert res[:2].tolist() == [DAY, 1.5] and np.isnan(res[2])
+    assert lib.dt2ts(np.array([datetime(1970, 1, 2)])).tolist() == [DAY]
+
 
 def test_ts2dt():
     assert lib.ts2dt(DAY) == datetime(1970, 1, 2)
 
+    ts = np.array([DAY, 1.5, 1e-6])
+    res = lib.ts2dt(ts)
+    assert res.tolist() == [lib.ts2dt(t) for t in ts]
+    assert np.array_equal(lib.dt2ts(res), ts)
+
 
 def test_str2dt():
     assert lib.str2dt("19700104") == datetime(1970, 1, 4)
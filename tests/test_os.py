@@ -1,4 +1,5 @@
 import os
+import pytest
 import shutil
 
 import olutils as lib
@@ -85,3 +86,44 @@ def test_sopen():
         file.write("this is a new test")
     with open(filepath) as file:
         assert file.read() == "this is a new test"
+
+
+def test_get_compression():
+    assert lib.os.get_compression("data.csv.gz") == "gz"
+    assert lib.os.get_compression("dir.gz/data.jsonl.bz2") == "bz2"
+    assert lib.os.get_compression("data.txt.xz") == "xz"
+    assert lib.os.get_compression("data.csv") is None
+    assert lib.os.get_compression(os.path.join("dir.gz", "gz")) is None
+    assert lib.os.strip_compression("data.csv.gz") == "data.csv"
+    assert lib.os.strip_compression("data.csv") == "data.csv"
+
+
+def test_copen():
+    content = "this is a test\nwith two lines\n"
+    for suffix in ["gz", "bz2", "xz"]:
+        filepath = os.path.join(LNG_DIR, f"file.txt.{suffix}")
+        with lib.sopen(filepath, compresslevel=1) as file:
+            file.write(content)
+        with open(filepath, "rb") as file:
+            assert file.read() != content.encode()
+        with lib.copen(filepath) as file:
+            assert list(file) == content.splitlines(keepends=True)
+        with lib.copen(filepath, "rb", buffering=0) as file:
+            assert file.read() == content.encode()
+        with lib.copen(filepath, compression=None, encoding="latin-1") as file:
+            assert file.read() != content
+        with lib.sopen(filepath, "a") as file:
+            file.write("appended\n")
+        with lib.copen(filepath, "rt", encoding="utf-8") as file:
+            assert file.read() == content + "appended\n"
+
+    filepath = os.path.join(TMP_DIR, "file.txt")
+    with lib.sopen(filepath, compression="gz") as file:
+        file.write(content)
+    with lib.copen(filepath, compression="gz") as file:
+        assert file.read() == content
+
+    with pytest.raises(ValueError):
+        lib.copen(filepath, compression="zip")
+    with pytest.raises(ValueError):
+        lib.copen(filepath, "rb", compression="gz", encoding="utf-8")
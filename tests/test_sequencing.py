@@ -105,3 +105,11 @@ def test_sequencing():
     with pytest.raises(TimeoutError):
         lib.wait_until(lambda: False, timeout=0.01, freq=0.001)
     assert not lib.wait_until(lambda: False, timeout=0.01, raise_err=False)
+
+
+def test_chunkiter():
+    assert list(lib.chunkiter(range(5), 2)) == [[0, 1], [2, 3], [4]]
+    assert list(lib.chunkiter(iter(range(4)), 2)) == [[0, 1], [2, 3]]
+    assert list(lib.chunkiter([], 3)) == []
+    with pytest.raises(ValueError):
+        lib.chunkiter([1], 0)
@@ -0,0 +1,11 @@
+"""Storing format registered lazily in test_registry (must not be imported)"""
+
+
+def read_lazy(path, /, **kwargs):
+    with open(path) as file:
+        return file.read()[::-1]
+
+
+def write_lazy(content, path, /, **kwargs):
+    with open(path, "w") as file:
+        file.write(content[::-1])
@@ -0,0 +1,163 @@
+import asyncio
+import os
+import pytest
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import olutils.storing as lib
+from olutils.storing import aio
+
+TMP_DIR = "tmp"
+MOCK_DIR = os.path.join("tests", "mockups")
+
+
+async def collect(aiterator):
+    return [elem async for elem in aiterator]
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_aiterate():
+    consumed = []
+
+    def elements():
+        for i in range(10):
+            consumed.append(i)
+            yield i
+
+    async def main():
+        aiterator = aio.aiterate(elements(), batchsize=2, readahead=1)
+        assert await aiterator.__anext__() == 0
+        await asyncio.sleep(0.05)
+        assert len(consumed) <= 6  # 1 batch consumed, 1 queued, 1 being read
+        assert await collect(aiterator) == list(range(1, 10))
+
+    asyncio.run(main())
+
+    def failing():
+        yield 1
+        raise KeyError("failure")
+
+    async def main_error():
+        with pytest.raises(KeyError):
+            await collect(aio.aiterate(failing(), batchsize=1))
+
+    asyncio.run(main_error())
+
+
+def test_aiterate_close():
+    closed = []
+
+    def elements():
+        try:
+            yield from range(100)
+        finally:
+            closed.append(True)
+
+    async def main_early_exit():
+        aiterator = aio.aiterate(elements(), batchsize=2)
+        async for elem in aiterator:
+            if elem == 3:
+                break
+        await aiterator.aclose()
+        assert closed == [True]
+
+    asyncio.run(main_early_exit())
+
+    def slow_elements():
+        try:
+            for i in range(100):
+                time.sleep(0.01)
+                yield i
+        finally:
+            closed.append(True)
+
+    async def main_cancel():
+        started = asyncio.Event()
+
+        async def consume():
+            async for _ in aio.aiterate(slow_elements(), batchsize=5, readahead=1):
+                started.set()
+
+        task = asyncio.ensure_future(consume())
+        await started.wait()
+        await asyncio.sleep(0.02)  # Waiting for next batch being taken
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert closed == [True, True]
+
+    asyncio.run(main_cancel())
+
+    async def main_process():
+        with ProcessPoolExecutor(1) as executor:
+            with pytest.raises(ValueError):
+                await collect(aio.aiterate(range(3), executor=executor))
+            with pytest.raises(ValueError):
+                await collect(lib.aread_csv("file.csv", executor=executor))
+            filepath = os.path.join(MOCK_DIR, "base_comma.csv")
+            with pytest.raises(ValueError, match="ThreadPoolExecutor"):
+                await lib.aload(filepath, executor=executor)
+            assert await lib.aload(filepath, "txt", executor=executor) == (
+                lib.read_txt(filepath)
+            )
+
+    asyncio.run(main_process())
+
+
+def test_aload_asave():
+    obj = [{"1": 1, "2": 2}, {"1": 10, "2": 20}]
+
+    async def main():
+        paths = [
+            os.path.join(TMP_DIR, f"obj_{i}.{mthd}")
+            for i in range(5)
+            for mthd in ["json", "csv"]
+        ]
+        with ThreadPoolExecutor(4) as executor:
+            await asyncio.gather(*[
+                lib.asave(obj, path, executor=executor) for path in paths
+            ])
+            results = await asyncio.gather(*[
+                lib.aload(path, executor=executor) for path in paths
+            ])
+            for path, res in zip(paths, results):
+                if path.endswith("json"):
+                    assert res == obj
+                else:
+                    assert await collect(res) == [
+                        {key: str(val) for key, val in row.items()} for row in obj
+                    ]
+
+    asyncio.run(main())
+
+
+def test_aread_csv():
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+
+    async def main():
+        rows = await collect(lib.aread_csv(filepath, batchsize=2))
+        assert rows == list(lib.read_csv(filepath))
+
+        rows = await collect(lib.aread_csv(filepath, usecols=["index"], nrows=3))
+        assert rows == [{'index': "1"}, {'index': "2"}, {'index': "3"}]
+
+        with pytest.raises(ValueError):
+            await collect(lib.aread_csv(os.path.join(MOCK_DIR, "base_dash.csv")))
+
+    asyncio.run(main())
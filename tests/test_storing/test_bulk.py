@@ -0,0 +1,119 @@
+import json
+import os
+import shutil
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
+
+import pytest
+
+import olutils.storing as lib
+from olutils.storing.bulk import expand_paths
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_expand_paths():
+    for name in ["b.json", "a.json", "sub/c.json", "d.txt"]:
+        lib.write_txt("{}", os.path.join(TMP_DIR, name))
+    assert expand_paths(os.path.join(TMP_DIR, "*.json")) == [
+        os.path.join(TMP_DIR, "a.json"), os.path.join(TMP_DIR, "b.json"),
+    ]
+    assert len(expand_paths(os.path.join(TMP_DIR, "**", "*.json"))) == 3
+    assert expand_paths(["x.json", os.path.join(TMP_DIR, "*.txt")]) == [
+        "x.json", os.path.join(TMP_DIR, "d.txt"),
+    ]
+    assert expand_paths(os.path.join(TMP_DIR, "*.csv")) == [
+        os.path.join(TMP_DIR, "*.csv")
+    ]
+
+
+@pytest.mark.parametrize("executor", ["thread", "process"])
+def test_save_load_many(executor):
+    objects = {os.path.join(TMP_DIR, f"obj_{i:02d}.json"): {'i': i} for i in range(20)}
+    results = lib.save_many(objects, executor=executor, workers=3)
+    assert [res.path for res in results] == list(objects)
+    assert all(res.error is None and res.value is None for res in results)
+
+    results = lib.load_many(os.path.join(TMP_DIR, "*.json"), executor=executor)
+    assert [(res.path, res.value) for res in results] == list(objects.items())
+
+    paths = list(objects) + [os.path.join(TMP_DIR, "unknown.json")]
+    results = lib.load_many(paths, executor=executor, ordered=False, workers=2)
+    assert not isinstance(results, list)
+    results = list(results)
+    assert sorted(res.path for res in results) == sorted(paths)
+    errors = [res for res in results if res.error is not None]
+    assert len(errors) == 1
+    assert isinstance(errors[0].error, FileNotFoundError)
+
+
+def test_load_many_iterators():
+    path = os.path.join(TMP_DIR, "data.jsonl")
+    lib.save([1, 2], path)
+    lib.write_txt("[1, 2", os.path.join(TMP_DIR, "broken.json"))
+    with ThreadPoolExecutor(2) as executor:
+        results = lib.load_many(
+            [path, os.path.join(TMP_DIR, "broken.json")], executor=executor
+        )
+    assert results[0].value == [1, 2]
+    assert isinstance(results[1].error, json.JSONDecodeError)
+
+    results = lib.save_many([(os.path.join(TMP_DIR, "x.unk"), 1)])
+    assert isinstance(results[0].error, ValueError)
+    with pytest.raises(ValueError):
+        lib.load_many([path], executor="unknown")
+
+
+class InlineExecutor(Executor):
+    """Executor running calls at submission, with no known number of workers"""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        future.set_result(fn(*args, **kwargs))
+        return future
+
+
+def test_bulk_errors():
+    # Patterns matching no file
+    pattern = os.path.join(TMP_DIR, "*.json")
+    results = lib.load_many(pattern)
+    assert [res.path for res in results] == [pattern]
+    assert isinstance(results[0].error, FileNotFoundError)
+
+    # Errors of pool (unpicklable object sent to processes)
+    objects = [
+        (os.path.join(TMP_DIR, "a.pickle"), 1),
+        (os.path.join(TMP_DIR, "b.pickle"), lambda: 1),
+        (os.path.join(TMP_DIR, "c.pickle"), 3),
+    ]
+    results = lib.save_many(objects, executor="process", workers=2)
+    assert [res.path for res in results] == [path for path, _ in objects]
+    assert [res.error is None for res in results] == [True, False, True]
+    results = lib.load_many(
+        [path for path, _ in objects], executor="process", workers=2
+    )
+    assert [res.value for res in results] == [1, None, 3]
+
+    # Workers of executor
+    with ThreadPoolExecutor(2) as executor:
+        results = lib.load_many(pattern, executor=executor)
+    assert isinstance(results[0].error, FileNotFoundError)
+    with pytest.raises(ValueError):
+        lib.load_many(pattern, executor=InlineExecutor())
+    results = lib.load_many(pattern, executor=InlineExecutor(), workers=1)
+    assert isinstance(results[0].error, FileNotFoundError)
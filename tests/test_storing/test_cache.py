@@ -0,0 +1,140 @@
+import os
+import pytest
+import shutil
+
+import numpy as np
+
+import olutils.storing as lib
+from olutils.storing.cache import LOAD_CACHE, freeze, is_resource, sizeof
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+    LOAD_CACHE.clear()
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_sizeof_freeze():
+    array = np.zeros(1000)
+    assert sizeof(array) > 8000
+    assert sizeof({'a': [array, array]}) > 16000
+    assert sizeof([1, 2]) > sizeof([])
+
+    obj = freeze({'a': [1, {'b': array}], 'c': {1}})
+    assert obj['a'][0] == 1 and obj['c'] == {1}
+    assert np.array_equal(obj['a'][1]['b'], array)
+    with pytest.raises(TypeError):
+        obj['a'] = 1
+    with pytest.raises(ValueError):
+        obj['a'][1]['b'][0] = 1
+    array[0] = 1
+
+
+def test_is_resource():
+    assert is_resource(iter([1]))
+    with open(__file__) as file:
+        assert is_resource(file)
+    assert not is_resource(np.arange(3))
+    assert not is_resource({'close': 1})
+
+
+def test_load_cache():
+    path = os.path.join(TMP_DIR, "config.json")
+    lib.save({'a': [1, 2]}, path)
+    cache = lib.LoadCache()
+
+    res = lib.load(path, cache=cache)
+    assert res == {'a': [1, 2]}
+    assert lib.load(path, cache=cache) is res
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+    assert cache.nbytes == sizeof(res)
+
+    # Other parameters are other entries
+    assert lib.load(path, "txt", rtype=str, cache=cache) == lib.read_txt(path, rtype=str)
+    assert (cache.hits, cache.misses, len(cache)) == (1, 2, 2)
+
+    # File changes are detected
+    lib.save({'a': [1, 2, 3]}, path)
+    assert lib.load(path, cache=cache) == {'a': [1, 2, 3]}
+    assert (cache.hits, cache.misses, len(cache)) == (1, 3, 2)
+
+    # Iterators are not cached
+    path = os.path.join(TMP_DIR, "data.jsonl")
+    lib.save([1, 2], path)
+    assert list(lib.load(path, cache=cache)) == [1, 2]
+    assert list(lib.load(path, cache=cache)) == [1, 2]
+    assert len(cache) == 2
+
+    # Closeable objects are not cached
+    path = os.path.join(TMP_DIR, "data.npz")
+    lib.save({'x': np.arange(3)}, path)
+    with lib.load(path, cache=cache) as archive:
+        assert archive['x'].tolist() == [0, 1, 2]
+    with lib.load(path, cache=cache) as other:
+        assert other is not archive
+        assert other['x'].tolist() == [0, 1, 2]
+    assert len(cache) == 2
+
+    cache.clear()
+    assert (len(cache), cache.nbytes) == (0, 0)
+    with pytest.raises(FileNotFoundError):
+        lib.load(os.path.join(TMP_DIR, "unknown.json"), cache=cache)
+
+    lib.load(os.path.join(TMP_DIR, "config.json"), cache=True)
+    lib.load(os.path.join(TMP_DIR, "config.json"), cache=True)
+    assert LOAD_CACHE.hits >= 1
+
+
+def test_load_cache_eviction():
+    paths = [os.path.join(TMP_DIR, f"array_{i}.npy") for i in range(3)]
+    for i, path in enumerate(paths):
+        lib.save(np.full(1000, i), path)
+    cache = lib.LoadCache(max_bytes=2 * sizeof(np.zeros(1000)) + 10)
+
+    lib.load(paths[0], mmap_mode=None, cache=cache)
+    lib.load(paths[1], mmap_mode=None, cache=cache)
+    lib.load(paths[0], mmap_mode=None, cache=cache)
+    lib.load(paths[2], mmap_mode=None, cache=cache)
+    assert len(cache) == 2
+    assert cache.nbytes <= cache.max_bytes
+    lib.load(paths[0], mmap_mode=None, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 3)
+    lib.load(paths[1], mmap_mode=None, cache=cache)
+    assert (cache.hits, cache.misses) == (2, 4)
+
+    cache = lib.LoadCache(max_bytes=10)
+    lib.load(paths[0], mmap_mode=None, cache=cache)
+    assert len(cache) == 0
+
+
+def test_load_cache_access():
+    path = os.path.join(TMP_DIR, "config.json")
+    lib.save({'a': [1, 2]}, path)
+
+    cache = lib.LoadCache(access="copy")
+    res = lib.load(path, cache=cache)
+    res['a'].append(3)
+    assert lib.load(path, cache=cache) == {'a': [1, 2]}
+
+    cache = lib.LoadCache(access="readonly")
+    res = lib.load(path, cache=cache)
+    assert res == {'a': (1, 2)}
+    with pytest.raises(TypeError):
+        res['b'] = 1
+    assert lib.load(path, cache=cache) is res
+
+    with pytest.raises(ValueError):
+        lib.LoadCache(access="unknown")
@@ -1,4 +1,5 @@
 import os
+import numpy as np
 import pytest
 import shutil
 from collections import OrderedDict
@@ -115,6 +116,92 @@ def test_read_csv(capfd):
     assert readout(capfd) == "\r9/?\n"
 
 
+def test_read_csv_pushdown():
+
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+
+    # ---- Projection
+    rows = list(lib.read_csv(filepath, usecols=["value", "index"]))
+    assert len(rows) == 9
+    assert rows[0] == {'value': "110", 'index': "1"}
+    assert list(rows[0].keys()) == ["value", "index"]
+
+    # ---- Predicate
+    rows = lib.read_csv(filepath, usecols=["index"], where={'name': "in".__eq__})
+    assert list(rows) == [{'index': "1"}, {'index': "3"}, {'index': "8"}]
+
+    seen = []
+    rows = lib.read_csv(
+        filepath, where=lambda row: seen.append(row) or int(row[2]) > 100
+    )
+    assert [row['index'] for row in rows] == ["1", "3", "8"]
+    assert seen[0] == ["1", "in", "110"]
+
+    # ---- Head sampling
+    rows = lib.read_csv(filepath, nrows=2)
+    assert [row['index'] for row in rows] == ["1", "2"]
+    rows = lib.read_csv(filepath, skiprows=7)
+    assert [row['index'] for row in rows] == ["8", "9"]
+    rows = lib.read_csv(filepath, skiprows=1, nrows=4, where={'name': "in".__eq__})
+    assert [row['index'] for row in rows] == ["3"]
+
+    # ---- Batch mode
+    chunk, = lib.read_csv(
+        filepath,
+        usecols=["value"],
+        where={'name': "out".__eq__},
+        skiprows=1,
+        chunksize=10,
+        dtypes={'value': int},
+    )
+    assert list(chunk.keys()) == ["value"]
+    assert chunk['value'].tolist() == [80, 60, 50, 40, 30, 10]
+
+    # ---- Missing values
+    filepath = os.path.join(MOCK_DIR, "base_comma.csv")
+    rows = lib.read_csv(filepath, where=lambda row: row[2] == "")
+    assert [row['col_1'] for row in rows] == ["21"]
+
+    # ---- Errors
+    with pytest.raises(ValueError):
+        lib.read_csv(filepath, usecols=["col_1", "unknown"])
+    with pytest.raises(ValueError):
+        lib.read_csv(filepath, where={'unknown': bool})
+
+
+def test_read_csv_schema():
+
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+    schema = {'index': int, 'value': float}
+
+    rows = list(lib.read_csv(filepath, schema=schema))
+    assert rows[0] == {'index': 1, 'name': "in", 'value': 110.}
+
+    rows = list(lib.read_csv(filepath, schema=schema, usecols=["value"], nrows=2))
+    assert rows == [{'value': 110.}, {'value': 80.}]
+
+    rows = list(lib.read_csv(filepath, schema="infer"))
+    assert rows[1] == {'index': 2, 'name': "out", 'value': 80}
+
+    chunk, = lib.read_csv(filepath, schema="infer", chunksize=10)
+    assert chunk['index'].dtype == np.int64
+    assert chunk['value'].tolist() == [int(row['value']) for row in rows]
+    assert chunk['name'].dtype.kind == "U"
+
+    chunk, = lib.read_csv(
+        filepath, schema=schema, dtypes={'value': str}, chunksize=10
+    )
+    assert chunk['index'].dtype == np.int64
+    assert chunk['value'].dtype.kind == "U"
+
+    filepath = os.path.join(MOCK_DIR, "base_comma.csv")
+    rows = list(lib.read_csv(filepath, schema={'col_3': int}, nrows=3))
+    assert [row['col_3'] for row in rows] == [13, None, 33]
+
+    with pytest.raises(ValueError):
+        lib.read_csv(filepath, schema={'unknown': int})
+
+
 def test_write_csv():
 
     filepath = os.path.join(TMP_DIR, "file.txt")
@@ -200,8 +287,51 @@ def test_write_csv():
         "val_21,\n"
     ))
 
+    # # Rows from a generator
+    lib.write_csv(
+        ({'col_1': i, 'col_2': 2 * i} for i in range(2)),
+        filepath,
+    )
+    assert_content_equal(filepath, "col_1,col_2\n0,0\n1,2\n")
+
+    # ---- Fast paths
+
+    # # Tuple rows
+    lib.write_csv(
+        [("1, one", None), ["you", "me"]],
+        filepath,
+        fieldnames=["col_1", "col_two"],
+        delimiter=";",
+        pretty=True,
+    )
+    assert_content_equal(filepath, 'Col 1;Col Two\n1, one;\nyou;me\n')
+
+    lib.write_csv(iter([(1, 2), (3, 4)]), filepath, header=["a", "b"], chunksize=1)
+    assert_content_equal(filepath, "a,b\n1,2\n3,4\n")
+
+    # # Numpy columns
+    columns = {'a': np.arange(5), 'b': np.linspace(0, 1, 5), 'c': list("vwxyz")}
+    lib.write_csv(columns, filepath, chunksize=2)
+    assert_content_equal(filepath, (
+        "a,b,c\n0,0.0,v\n1,0.25,w\n2,0.5,x\n3,0.75,y\n4,1.0,z\n"
+    ))
+    lib.write_csv(columns, filepath, fieldnames=["c", "a"], header=["C", "A"])
+    assert list(lib.read_csv(filepath, chunksize=5))[0]['A'].tolist() == [
+        str(i) for i in range(5)
+    ]
+    lib.write_csv({'a': np.array([])}, filepath)
+    assert_content_equal(filepath, "a\n")
+
     # ---- ERRORS
 
+    # # tuple rows without fieldnames nor header
+    with pytest.raises(ValueError):
+        lib.write_csv([(1, 2)], filepath)
+
+    # # columns with different length
+    with pytest.raises(ValueError):
+        lib.write_csv({'a': np.arange(2), 'b': np.arange(3)}, filepath)
+
     # # Write ref to make sure file is not overwritten
     lib.write_csv([], filepath, fieldnames=['c_1', 'c_2'])
 
@@ -227,3 +357,62 @@ def test_write_csv():
             OrderedDict([('col_1', "val_11"), ('col_2', "val_12")]),
             OrderedDict([('col_1', ""), ('col_2', None)]),
         ], filepath, header=["First, Column", "Second Column", "Third Column"])
+
+
+def test_read_csv_chunks(capfd):
+
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+    chunks = list(lib.read_csv(filepath, chunksize=4))
+    assert [len(chunk['index']) for chunk in chunks] == [4, 4, 1]
+    assert list(chunks[0].keys()) == ["index", "name", "value"]
+    assert chunks[0]['name'].tolist() == ["in", "out", "in", "out"]
+    assert chunks[0]['index'].dtype.kind == "U"
+
+    chunks = list(lib.read_csv(
+        filepath, chunksize=10, dtypes={'index': int, 'value': float}
+    ))
+    assert len(chunks) == 1
+    assert chunks[0]['index'].tolist() == list(range(1, 10))
+    assert chunks[0]['value'].dtype == np.float64
+    assert chunks[0]['value'][:2].tolist() == [110., 80.]
+    assert readout(capfd) == ""
+
+    # ---- Smart delimiter and short rows
+    filepath = os.path.join(MOCK_DIR, "base_tab.csv")
+    chunk, = lib.read_csv(filepath, chunksize=10)
+    assert chunk['col_2'].tolist() == ["12", "22", "", "forty_two"]
+
+    # ---- Display counts chunks
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+    for i, chunk in lib.read_csv(filepath, chunksize=2, w_count=True, vbatch=1):
+        assert readout(capfd) == f"\r{i}/?"
+    assert readout(capfd) == "\r5/?\n"
+
+    with pytest.raises(ValueError):
+        lib.read_csv(filepath, chunksize=0)
+
+
+def test_rows2columns():
+    columns = lib.csv.rows2columns(
+        [["1", "a"], ["2"]], ["num", "char"], dtypes={'num': int}
+    )
+    assert columns['num'].tolist() == [1, 2]
+    assert columns['char'].tolist() == ["a", ""]
+
+    columns = lib.csv.rows2columns([], ["num", "char"])
+    assert columns['num'].shape == (0,)
+
+
+def test_csv_compressed():
+    filepath = os.path.join(MOCK_DIR, "base_semicolon.csv")
+    rows = list(lib.read_csv(filepath))
+
+    gzpath = os.path.join(TMP_DIR, "file.csv.gz")
+    lib.write_csv(rows, gzpath, delimiter=";", compresslevel=9)
+    with open(gzpath, "rb") as file:
+        assert file.read(2) == b"\x1f\x8b"
+    assert list(lib.read_csv(gzpath)) == rows
+    assert list(lib.read_csv(gzpath, usecols=["col_2"], buffering=16)) == [
+        {'col_2': row['col_2']} for row in rows
+    ]
+    assert list(lib.read_csv_parallel(gzpath, workers=2)) == rows
@@ -0,0 +1,155 @@
+import os
+import pytest
+import shutil
+import stat
+import time
+
+import olutils.storing as lib
+from olutils.storing import durability
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_fsync_paths():
+    path = os.path.join(TMP_DIR, "file.txt")
+    lib.write_txt("content", path)
+    durability.fsync_path(path)
+    durability.fsync_path(TMP_DIR)
+    durability.fsync_paths([path, path])
+    with pytest.raises(FileNotFoundError):
+        durability.fsync_path(os.path.join(TMP_DIR, "unknown.txt"))
+
+
+def test_atomic_path():
+    path = os.path.join(TMP_DIR, "file.txt")
+    lib.write_txt("old", path)
+
+    with durability.atomic_path(path, fsync=True) as tmp_path:
+        assert os.path.dirname(tmp_path) == TMP_DIR
+        lib.write_txt("new", tmp_path)
+        assert lib.read_txt(path, rtype=str) == "old"
+    assert lib.read_txt(path, rtype=str) == "new"
+    assert os.listdir(TMP_DIR) == ["file.txt"]
+
+    with pytest.raises(RuntimeError):
+        with durability.atomic_path(path) as tmp_path:
+            lib.write_txt("partial", tmp_path)
+            raise RuntimeError("crash")
+    assert lib.read_txt(path, rtype=str) == "new"
+    assert os.listdir(TMP_DIR) == ["file.txt"]
+
+
+def test_GroupCommit():
+    paths = [os.path.join(TMP_DIR, f"obj_{i}.json") for i in range(5)]
+
+    with lib.GroupCommit(max_pending=2) as commit:
+        for path in paths:
+            lib.save({'path': path}, path, atomic=True, fsync=commit)
+        assert commit.commits == 2
+        assert commit.pending == 1
+        assert not os.path.exists(paths[-1])  # Renamed on commit only
+    assert commit.commits == 3
+    assert commit.pending == 0
+    for path in paths:
+        assert lib.load(path) == {'path': path}
+    assert sorted(os.listdir(TMP_DIR)) == sorted(os.path.basename(p) for p in paths)
+
+    commit = lib.GroupCommit(delay=0.01)
+    lib.save([1], paths[0], fsync=commit)
+    assert commit.pending == 1
+    time.sleep(0.2)
+    assert commit.pending == 0
+    assert commit.commits == 1
+
+
+def test_GroupCommit_delayed_error(monkeypatch):
+    """Errors of delayed commits are raised to caller"""
+
+    def failing_fsync(fd):
+        raise OSError("disk failure")
+
+    path = os.path.join(TMP_DIR, "obj.json")
+    os.makedirs(TMP_DIR)
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    for call in ["commit", "add", "exit"]:
+        commit = lib.GroupCommit(delay=0.01)
+        lib.save([1], path, atomic=True, fsync=commit)
+        time.sleep(0.2)
+        assert commit.pending == 0 and commit.commits == 0
+        with pytest.raises(OSError, match="disk failure"):
+            if call == "commit":
+                commit.commit()
+            elif call == "add":
+                lib.save([2], path, atomic=True, fsync=commit)
+            else:
+                with commit:
+                    pass
+        commit.commit()  # Error is raised once
+        assert os.listdir(TMP_DIR) == []
+
+
+def test_GroupCommit_order(monkeypatch):
+    """Files are flushed, then renamed, then their directories are flushed"""
+    calls = []
+    fsync, replace = os.fsync, os.replace
+
+    def mock_fsync(fd):
+        calls.append("fsync_dir" if stat.S_ISDIR(os.fstat(fd).st_mode) else "fsync")
+        fsync(fd)
+
+    def mock_replace(src, dst):
+        calls.append("replace")
+        replace(src, dst)
+
+    monkeypatch.setattr(os, "fsync", mock_fsync)
+    monkeypatch.setattr(os, "replace", mock_replace)
+    paths = [os.path.join(TMP_DIR, f"obj_{i}.json") for i in range(3)]
+    with lib.GroupCommit() as commit:
+        for path in paths:
+            lib.save([1], path, atomic=True, fsync=commit)
+        assert calls == []
+    assert calls == ["fsync"] * 3 + ["replace"] * 3 + ["fsync_dir"]
+
+    # Temporary files are removed if commit fails
+    def failing_fsync(fd):
+        raise OSError("disk failure")
+
+    monkeypatch.setattr(os, "fsync", failing_fsync)
+    commit = lib.GroupCommit()
+    lib.save([2], paths[0], atomic=True, fsync=commit)
+    with pytest.raises(OSError):
+        commit.commit()
+    assert lib.load(paths[0]) == [1]
+    assert sorted(os.listdir(TMP_DIR)) == sorted(os.path.basename(p) for p in paths)
+
+
+def test_save_atomic():
+    path = os.path.join(TMP_DIR, "obj.csv.gz")
+    lib.save([{'a': 1, 'b': 2}], path, atomic=True, fsync=True)
+    assert list(lib.load(path)) == [{'a': "1", 'b': "2"}]
+    assert os.listdir(TMP_DIR) == ["obj.csv.gz"]
+
+    with pytest.raises(TypeError):
+        lib.save([1], path, atomic=True)
+    assert list(lib.load(path)) == [{'a': "1", 'b': "2"}]
+    assert os.listdir(TMP_DIR) == ["obj.csv.gz"]
+
+    with pytest.raises(ValueError):
+        lib.save([1], os.path.join(TMP_DIR, "obj.unk"), atomic=True)
+    assert os.listdir(TMP_DIR) == ["obj.csv.gz"]
@@ -65,3 +65,34 @@ def test_save_load():
     assert lib.load(path, rtype=str) == content
     lib.save([content], path, has_eol=False)
     assert lib.load(path) == [content+"\n"]
+
+
+def test_save_load_compressed():
+
+    obj = [
+        {"1": 1, "2": 2},
+        {"1": 10, "2": 20},
+    ]
+
+    for mthd in ["csv", "json", "pickle", "txt"]:
+        for compression in ["gz", "bz2", "xz"]:
+            path = os.path.join(TMP_DIR, f"__obj.{mthd}.{compression}")
+            content = ["line 1\n", "line 2\n"] if mthd == "txt" else obj
+            lib.save(content, path, compresslevel=1)
+            with open(path, "rb") as file:
+                assert file.read(1) not in b"[1"
+            res = lib.load(path)
+            if mthd == "csv":
+                assert list(res) == [
+                    {key: str(val) for key, val in row.items()} for row in obj
+                ]
+            else:
+                assert res == content
+
+    path = os.path.join(TMP_DIR, "__obj.gz")
+    with pytest.raises(ValueError):
+        lib.save(obj, path)
+    lib.save(obj, path, mthd="json")
+    assert lib.load(path, mthd="json") == obj
+    with pytest.raises(UnicodeDecodeError):
+        lib.load(path, mthd="json", compression=None, encoding="utf-8")
@@ -0,0 +1,148 @@
+import os
+import pytest
+import shutil
+
+import olutils.storing as lib
+from olutils.storing import index
+
+TMP_DIR = "tmp"
+MOCK_DIR = os.path.join("tests", "mockups")
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", newline="") as file:
+        file.write(content)
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_build_offsets():
+    path = os.path.join(TMP_DIR, "file.txt")
+
+    write(path, "a\nbb\n\nc")
+    assert index.build_offsets(path).tolist() == [0, 2, 5, 6, 7]
+    assert index.build_offsets(path, chunk_size=1).tolist() == [0, 2, 5, 6, 7]
+
+    write(path, 'h1,h2\n1,"a\n""b"""\n2,c\n')
+    expected = [0, 6, 18, 22]
+    assert index.build_offsets(path, quotechar='"').tolist() == expected
+    assert index.build_offsets(path, quotechar='"', chunk_size=3).tolist() == expected
+    assert index.build_offsets(path).tolist() == [0, 6, 11, 18, 22]
+
+    write(path, "")
+    assert index.build_offsets(path).tolist() == [0]
+
+    # Universal newlines, blank lines
+    write(path, "a\r\nb\rc\r\r\nd\r")
+    expected = [0, 3, 5, 7, 9, 11]
+    for chunk_size in [1, 2, 100]:
+        offsets = index.build_offsets(path, universal=True, chunk_size=chunk_size)
+        assert offsets.tolist() == expected
+    assert index.build_offsets(path).tolist() == [0, 3, 9, 11]
+    offsets = index.build_offsets(path, universal=True, skip_blank=True)
+    assert offsets.tolist() == [0, 3, 5, 9, 11]
+
+    write(path, '\nh\n\r\n1\n\n')
+    assert index.build_offsets(path, skip_blank=True).tolist() == [1, 5, 8]
+
+
+def test_LineIndex():
+    path = os.path.join(TMP_DIR, "file.txt")
+    sidecar = path + index.SIDECAR_SUFFIX
+    write(path, "a\nbb\nccc\n")
+
+    line_index = index.LineIndex(path)
+    assert os.path.isfile(sidecar)
+    assert len(line_index) == 3
+    assert line_index.span(1) == (2, 5)
+    assert line_index.read(1, 3) == b"bb\nccc\n"
+
+    # Sidecar is used when up-to-date, rebuilt otherwise
+    line_index = index.LineIndex(path, persist=False)
+    assert line_index._load() is not None
+    write(path, "a\nbb\nccc\nd\n")
+    assert line_index._load() is None
+    assert len(index.LineIndex(path, persist=False)) == 4
+    assert index.LineIndex(path, quotechar='"', persist=False)._load() is None
+
+    with pytest.raises(ValueError):
+        index.LineIndex(path + ".gz")
+
+
+def test_read_txt_index():
+    path = os.path.join(TMP_DIR, "file.txt")
+    lines = [f"line {i}\n" for i in range(25)]
+    write(path, "".join(lines))
+
+    content = lib.read_txt(path, index=True)
+    assert len(content) == 25
+    assert content[3] == "line 3\n"
+    assert content[-1] == "line 24\n"
+    assert content[5:8] == lines[5:8]
+    assert content[10:2:-3] == lines[10:2:-3]
+    assert list(content) == lines
+    assert content.sample(5, seed=1) == content.sample(5, seed=1)
+    assert len(set(content.sample(5))) == 5
+    assert set(content.sample(5)) <= set(lines)
+    with pytest.raises(IndexError):
+        content[25]
+
+    content = lib.read_txt(path, index=True, w_eol=False)
+    assert content[0] == "line 0"
+
+    # Line terminators are the ones of text mode
+    write(path, "a\r\nb\rc\n\r\nd")
+    content = lib.read_txt(path, index=True)
+    assert list(content) == lib.read_txt(path) == ["a\n", "b\n", "c\n", "\n", "d"]
+    assert len(content) == 5
+
+
+def test_IndexedFile():
+    with pytest.raises(TypeError):
+        index.IndexedFile(None)
+
+
+def test_read_csv_index(tmp_path):
+    path = os.path.join(TMP_DIR, "file.csv")
+    write(path, 'id,text\n1,"one\nline, two"\n2,"""quoted"""\n3,three\n')
+
+    rows = lib.read_csv(path, index=True)
+    assert len(rows) == 3
+    assert rows.fieldnames == ["id", "text"]
+    assert rows[0] == {'id': "1", 'text': "one\nline, two"}
+    assert rows[1:] == [{'id': "2", 'text': '"quoted"'}, {'id': "3", 'text': "three"}]
+    assert list(rows) == list(lib.read_csv(path))
+
+    rows = lib.read_csv(path, index=True, usecols=["id"], schema={'id': int})
+    assert rows[-1] == {'id': 3}
+
+    # Blank lines are skipped, as by read_csv
+    write(path, '\nid,text\n\n1,one\r\n\r\n2,two\n\n')
+    rows = lib.read_csv(path, delimiter=",", index=True)
+    assert len(rows) == 2
+    assert list(rows) == list(lib.read_csv(path, delimiter=","))
+    assert rows[1] == {'id': "2", 'text': "two"}
+
+    for kwargs in [{'where': bool}, {'nrows': 1}, {'skiprows': 1}, {'chunksize': 2}]:
+        with pytest.raises(ValueError):
+            lib.read_csv(path, delimiter=",", index=True, **kwargs)
+
+    filepath = str(tmp_path / "base_semicolon.csv")
+    shutil.copy(os.path.join(MOCK_DIR, "base_semicolon.csv"), filepath)
+    assert list(lib.read_csv(filepath, index=True)) == list(lib.read_csv(filepath))
+    assert os.path.isfile(filepath + index.SIDECAR_SUFFIX)
@@ -0,0 +1,78 @@
+import json
+import os
+import pytest
+import shutil
+
+import olutils.storing as lib
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+ELEMENTS = [
+    {'b': "line\nbreak", 'a': [1, 2.5, None]},
+    12345678901234567890,
+    -1.5e-10,
+    "é\"]",
+    [],
+    {},
+    True,
+    [{'x': {'y': [False]}}],
+]
+
+
+@pytest.mark.parametrize("read_size", [1, 3, 1024])
+def test_iter_json(read_size):
+    path = os.path.join(TMP_DIR, "data.json")
+    lib.save(ELEMENTS, path)
+    res = lib.load(path, stream=True, read_size=read_size)
+    assert not isinstance(res, list)
+    assert list(res) == ELEMENTS
+
+    lib.save(ELEMENTS, path, indent=None, separators=(",", ":"))
+    assert list(lib.load(path, stream=True, read_size=read_size)) == ELEMENTS
+
+    for content in ["[]", " [ ] ", "[1]", "\n[\n1 ,\n 2 ]\n"]:
+        lib.write_txt(content, path)
+        res = list(lib.load(path, stream=True, read_size=read_size))
+        assert res == json.loads(content)
+
+    for content in ["", "{}", "[1 2]", "[1,", "[1, tru]", "[1,]"]:
+        lib.write_txt(content, path)
+        with pytest.raises(json.JSONDecodeError):
+            list(lib.load(path, stream=True, read_size=read_size))
+
+
+def test_write_json():
+    path = os.path.join(TMP_DIR, "data.json")
+    for params in [{}, {'indent': None}, {'indent': "\t", 'sort_keys': False}]:
+        lib.save(ELEMENTS, path, write_size=10, **params)
+        expected = json.dumps(ELEMENTS, **{
+            'sort_keys': True, 'indent': 4, 'separators': (",", ": "), **params
+        })
+        assert lib.read_txt(path, rtype=str) == expected
+
+        lib.save(iter(ELEMENTS), path, **params)
+        assert lib.read_txt(path, rtype=str) == expected
+
+        lib.save(iter([]), path, **params)
+        assert lib.read_txt(path, rtype=str) == "[]"
+
+    lib.save((i for i in range(3)), path + ".gz")
+    assert list(lib.load(path + ".gz", stream=True)) == [0, 1, 2]
+    assert lib.load(path + ".gz") == [0, 1, 2]
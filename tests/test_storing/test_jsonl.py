@@ -0,0 +1,59 @@
+import json
+import os
+import pytest
+import shutil
+
+import olutils.storing as lib
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_jsonl():
+    records = [{'b': 1, 'a': [1, 2]}, "é", None, {'c': {'d': 1.5}}]
+    path = os.path.join(TMP_DIR, "events.jsonl")
+    lib.save(iter(records), path, chunksize=3)
+    with open(path) as file:
+        lines = file.readlines()
+    assert lines[0] == '{"b":1,"a":[1,2]}\n'
+    assert len(lines) == 4
+
+    res = lib.load(path)
+    assert not isinstance(res, list)
+    assert list(res) == records
+    assert list(lib.load(path, stream=True, vbatch=2)) == records
+
+    lib.save(records, path, sort_keys=True, ensure_ascii=False, encoding="utf-8")
+    with open(path, encoding="utf-8") as file:
+        assert file.readline() == '{"a":[1,2],"b":1}\n'
+        assert file.readline() == '"é"\n'
+
+    lib.save((i for i in range(3)), path + ".gz")
+    assert list(lib.load(path + ".gz")) == [0, 1, 2]
+
+    lib.save([], path)
+    assert list(lib.load(path)) == []
+
+
+def test_jsonl_errors():
+    path = os.path.join(TMP_DIR, "events.ndjson")
+    lib.write_txt(['{"a": 1}\n', "\n", "{not json}\n"], path)
+    records = lib.load(path)
+    assert next(records) == {'a': 1}
+    with pytest.raises(json.JSONDecodeError):
+        next(records)
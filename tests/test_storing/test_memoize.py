@@ -0,0 +1,169 @@
+import os
+import pytest
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import olutils.storing as lib
+from olutils.storing.memoize import file_lock, hash_args
+
+TMP_DIR = "tmp"
+CACHE_DIR = os.path.join(TMP_DIR, "cache")
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_hash_args():
+    assert hash_args({'a': 1, 'b': [1, 2]}) == hash_args({'b': [1, 2], 'a': 1})
+    assert hash_args({"x", "y", "z"}) == hash_args({"z", "y", "x"})
+    assert hash_args(1) != hash_args(True) != hash_args(1.0) != hash_args("1")
+    assert hash_args([1, 2]) != hash_args((1, 2))
+    assert hash_args([[1], 2]) != hash_args([1, [2]])
+    assert hash_args(np.arange(3)) == hash_args(np.arange(3))
+    assert hash_args(np.arange(3)) != hash_args(np.arange(3, dtype="int8"))
+    assert hash_args(np.arange(4).reshape(2, 2)) != hash_args(np.arange(4))
+    assert hash_args(np.arange(4).reshape(2, 2).T) == hash_args(
+        np.array([[0, 2], [1, 3]])
+    )
+
+
+def test_file_lock():
+    path = os.path.join(TMP_DIR, ".lock")
+    os.makedirs(TMP_DIR)
+    with file_lock(path):
+        assert os.path.exists(path)
+        with pytest.raises(TimeoutError):
+            with file_lock(path, timeout=0.05):
+                pass
+    assert not os.path.exists(path)
+
+    lib.write_txt("", path)
+    old = time.time() - 10
+    os.utime(path, (old, old))
+    with file_lock(path, stale=5):
+        with open(path) as file:
+            token = file.read()
+        assert len(token) == 32
+    assert not os.path.exists(path)
+    assert os.listdir(TMP_DIR) == []
+
+    # Lock broken (as stale) and taken by another holder is not released
+    with file_lock(path):
+        os.remove(path)
+        lib.write_txt("other", path)
+    assert lib.read_txt(path, rtype=str) == "other"
+    os.remove(path)
+    with file_lock(path):
+        os.remove(path)
+    assert os.listdir(TMP_DIR) == []
+
+
+def test_memoize_index_writes():
+    @lib.memoize(CACHE_DIR)
+    def double(x):
+        return 2 * x
+
+    double(1)
+    index_path = os.path.join(CACHE_DIR, "index.json")
+    mtime = os.stat(index_path).st_mtime_ns
+    os.utime(index_path, ns=(mtime - 10 ** 9, mtime - 10 ** 9))
+    assert double(1) == 2
+    assert double.hits == 1
+    assert os.stat(index_path).st_mtime_ns == mtime - 10 ** 9  # Not saved
+
+
+def test_memoize():
+    calls = []
+
+    @lib.memoize(CACHE_DIR)
+    def add(x, y=1, *args, **kwargs):
+        calls.append((x, y))
+        return {'sum': x + y + sum(args) + sum(kwargs.values())}
+
+    assert add(1) == {'sum': 2}
+    assert add(1) == {'sum': 2}
+    assert add(x=1, y=1) == {'sum': 2}
+    assert add(1, 2) == {'sum': 3}
+    assert add(1, 2, 3, z=4) == {'sum': 10}
+    assert add(1, 2, 3, z=4) == {'sum': 10}
+    assert calls == [(1, 1), (1, 2), (1, 2)]
+    assert (add.hits, add.misses) == (3, 3)
+    assert add.cache_info()["entries"] == 3
+    assert add.__name__ == "add"
+
+    add.cache_clear()
+    assert add.cache_info() == {'entries': 0, 'nbytes': 0}
+    assert sorted(os.listdir(CACHE_DIR)) == ["index.json"]
+    add(1)
+    assert len(calls) == 4
+
+    with pytest.raises(ValueError):
+        lib.memoize(CACHE_DIR, mthd="unknown")
+
+
+def test_memoize_eviction():
+    @lib.memoize(CACHE_DIR, mthd="npy", max_entries=2)
+    def zeros(size):
+        return np.zeros(size)
+
+    zeros(1)
+    zeros(2)
+    assert isinstance(zeros(1), np.memmap)
+    zeros(3)
+    assert zeros.cache_info()["entries"] == 2
+    zeros(1)
+    assert zeros.misses == 3
+    zeros(2)
+    assert zeros.misses == 4
+
+    @lib.memoize(CACHE_DIR, mthd="json", max_bytes=10)
+    def text(size):
+        return "a" * size
+
+    text(5)
+    text(4)
+    assert text.cache_info()["nbytes"] <= 10
+    text(20)
+    assert text(20) == "a" * 20
+    assert text.misses == 4
+
+    @lib.memoize(os.path.join(TMP_DIR, "ttl"), ttl=0.05)
+    def identity(x):
+        return x
+
+    identity(1)
+    identity(1)
+    assert identity.misses == 1
+    time.sleep(0.1)
+    identity(1)
+    assert identity.misses == 2
+
+
+@lib.memoize(CACHE_DIR)
+def square(x):
+    return x ** 2
+
+
+def test_memoize_processes():
+    with ProcessPoolExecutor(4) as executor:
+        res = list(executor.map(square, [i % 5 for i in range(40)]))
+    assert res == [(i % 5) ** 2 for i in range(40)]
+    assert square.cache_info()["entries"] == 5
+    assert square(3) == 9
+    assert square.hits == 1
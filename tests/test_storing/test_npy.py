@@ -0,0 +1,95 @@
+import os
+import pytest
+import shutil
+
+import numpy as np
+
+import olutils.storing as lib
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_npy():
+    array = np.arange(12, dtype="float32").reshape(3, 4)
+    path = os.path.join(TMP_DIR, "array.npy")
+    lib.save(array, path, atomic=True)
+
+    res = lib.load(path)
+    assert isinstance(res, np.memmap)
+    assert res.dtype == array.dtype
+    np.testing.assert_array_equal(res, array)
+    with pytest.raises(ValueError):
+        res[0, 0] = 1
+
+    res = lib.load(path, mmap_mode=None)
+    assert not isinstance(res, np.memmap)
+    np.testing.assert_array_equal(res, array)
+
+    lib.save([[1, 2], [3, 4]], path)
+    np.testing.assert_array_equal(lib.load(path), np.array([[1, 2], [3, 4]]))
+
+    path = os.path.join(TMP_DIR, "array.npy.gz")
+    lib.save(array, path)
+    np.testing.assert_array_equal(lib.load(path), array)
+
+    lib.save(np.array([{'a': 1}]), path, allow_pickle=True)
+    with pytest.raises(ValueError):
+        lib.load(path)
+    assert lib.load(path, allow_pickle=True)[0] == {'a': 1}
+
+
+def test_npz():
+    arrays = {
+        'ints': np.arange(10),
+        'matrix': np.asfortranarray(np.arange(6, dtype="float64").reshape(2, 3)),
+        'strings': np.array(["a", "bc"]),
+    }
+    path = os.path.join(TMP_DIR, "arrays.npz")
+    lib.save(arrays, path)
+
+    with lib.load(path) as archive:
+        assert sorted(archive) == ['ints', 'matrix', 'strings']
+        assert len(archive) == 3
+        assert not archive._arrays
+        matrix = archive['matrix']
+        assert isinstance(matrix, np.memmap)
+        assert list(archive._arrays) == ['matrix']
+        assert archive['matrix'] is matrix
+        for key, array in arrays.items():
+            np.testing.assert_array_equal(archive[key], array)
+    assert matrix.flags.f_contiguous
+    np.testing.assert_array_equal(matrix, arrays['matrix'])
+
+    lib.save(arrays, path, compressed=True)
+    with lib.load(path) as archive:
+        assert not isinstance(archive['ints'], np.memmap)
+        for key, array in arrays.items():
+            np.testing.assert_array_equal(archive[key], array)
+
+    lib.save(list(arrays.values()), path)
+    with lib.load(path, mmap_mode=None) as archive:
+        assert list(archive) == ['arr_0', 'arr_1', 'arr_2']
+        assert not isinstance(archive['arr_0'], np.memmap)
+        np.testing.assert_array_equal(archive['arr_1'], arrays['matrix'])
+
+    path = os.path.join(TMP_DIR, "arrays.npz.gz")
+    lib.save(arrays, path)
+    with lib.load(path) as archive:
+        for key, array in arrays.items():
+            np.testing.assert_array_equal(archive[key], array)
@@ -0,0 +1,177 @@
+import os
+import pytest
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+import olutils.storing as lib
+from olutils.storing import parallel
+
+TMP_DIR = "tmp"
+MOCK_DIR = os.path.join("tests", "mockups")
+
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w") as file:
+        file.write(content)
+
+
+def readout(capfd):
+    """Read output"""
+    return capfd.readouterr()[0]
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_split_ranges():
+    path = os.path.join(TMP_DIR, "file.txt")
+    write(path, "a\nbb\nccc\n\ndddd\n")
+
+    ranges = parallel.split_ranges(path, 1)
+    assert ranges == [(0, 2), (2, 5), (5, 9), (9, 10), (10, 15)]
+    assert parallel.split_ranges(path, 4) == [(0, 5), (5, 9), (9, 15)]
+    assert parallel.split_ranges(path, 100) == [(0, 15)]
+    assert parallel.split_ranges(path, 3, start=5) == [(5, 9), (9, 15)]
+
+    write(path, "no line terminator")
+    assert parallel.split_ranges(path, 4) == [(0, 18)]
+
+    with pytest.raises(ValueError):
+        parallel.split_ranges(path, 0)
+
+
+def test_pool_map():
+    with ThreadPoolExecutor(2) as executor:
+        res = parallel.pool_map(abs, range(-10, 0), executor, max_pending=3)
+        assert list(res) == list(range(10, 0, -1))
+        res = parallel.pool_map(abs, range(-10, 0), executor, ordered=False)
+        assert sorted(res) == list(range(1, 11))
+
+
+def test_read_csv_parallel(capfd):
+    filepath = os.path.join(MOCK_DIR, "base_comma_lg.csv")
+    expected = list(lib.read_csv(filepath))
+
+    rows = lib.read_csv_parallel(filepath, workers=2, range_size=10)
+    assert list(rows) == expected
+
+    rows = lib.read_csv_parallel(filepath, workers=2, range_size=10, ordered=False)
+    assert sorted(rows, key=lambda row: int(row['index'])) == expected
+
+    reader = lib.RowReader(fields={'idx': "index"}, conversions={'idx': int})
+    rows = lib.read_csv_parallel(filepath, reader=reader, workers=2, range_size=10)
+    assert [row['idx'] for row in rows] == list(range(1, 10))
+
+    for i, _ in lib.read_csv_parallel(filepath, workers=2, w_count=True, vbatch=4):
+        assert readout(capfd) == (f"\r{i}/?" if (i == 1 or i % 4 == 0) else "")
+    assert readout(capfd) == "\r9/?\n"
+
+    filepath = os.path.join(MOCK_DIR, "base_semicolon.csv")
+    assert (
+        list(lib.read_csv_parallel(filepath, workers=2, range_size=4))
+        == list(lib.read_csv(filepath))
+    )
+
+
+def test_read_csv_parallel_multiline():
+    path = os.path.join(TMP_DIR, "multiline.csv")
+    content = 'id,text\n0,zero\n1,"one\nline, two"\n2,"""quoted"""\n3,three\n'
+    write(path, content)
+    expected = list(lib.read_csv(path))
+    assert expected[1] == {'id': "1", 'text': "one\nline, two"}
+    for ordered in [True, False]:
+        rows = lib.read_csv_parallel(path, workers=2, range_size=1, ordered=ordered)
+        assert list(rows) == expected
+
+    # Ranges with quoted line terminators are detected while being parsed
+    start = content.index("1,")
+    end = content.index("2,")
+    args = (0, path, start, end, ["id", "text"], ",", "utf-8", None, b'"')
+    assert parallel._read_range(args) == (0, None)
+    start, end = 0, content.index("1,")
+    args = (0, path, start, end, ["id", "text"], ",", "utf-8", None, b'"')
+    rows = [{'id': "id", 'text': "text"}] + expected[:1]
+    assert parallel._read_range(args) == (0, rows)
+
+    # Header with quoted line terminator, blank lines before header
+    write(path, '\n"i\nd",text\n1,one\n2,two\n')
+    expected = list(lib.read_csv(path, delimiter=","))
+    assert list(expected[0]) == ["i\nd", "text"]
+    rows = lib.read_csv_parallel(path, delimiter=",", workers=2, range_size=1)
+    assert list(rows) == expected
+
+
+def test_read_csv_parallel_empty():
+    path = os.path.join(TMP_DIR, "empty.csv")
+    for content in ["", "\n\n", "id,text\n"]:
+        write(path, content)
+        rows = lib.read_csv_parallel(path, delimiter=",", workers=2)
+        assert list(rows) == list(lib.read_csv(path, delimiter=",")) == []
+
+
+def test_read_rows_parallel():
+    rows = [{'index': str(i)} for i in range(50)] + [{'index': "x"}]
+    rows += [{'index': "50"}, {'idx': "51"}]
+    reader = lib.RowReader(
+        fields={'idx': "index"}, conversions={'idx': int}, compiled=True
+    )
+
+    read = lib.read_rows_parallel(iter(rows), reader, workers=2, chunksize=7)
+    read = list(read)
+    assert [row['idx'] for row in read[:50]] == list(range(50))
+    assert read[51].idx == 50
+    errors = [read[50], read[52]]
+    assert all(isinstance(error, lib.RowError) for error in errors)
+    assert [error.index for error in errors] == [50, 52]
+    assert errors[0].row == {'index': "x"}
+    assert isinstance(errors[0].error, ValueError)
+    assert isinstance(errors[1].error, KeyError)
+
+    read = list(lib.read_rows_parallel(rows, reader, workers=2, errors="skip"))
+    assert [row.idx for row in read] == list(range(51))
+
+    read = lib.read_rows_parallel(rows, reader, workers=2, errors="raise")
+    with pytest.raises(ValueError):
+        list(read)
+
+    with pytest.raises(ValueError):
+        lib.read_rows_parallel(rows, reader, errors="ignore")
+    with pytest.raises(ValueError):
+        lib.read_rows_parallel(rows, reader, chunksize=0)
+
+
+class CodeError(Exception):
+    """Error that can't be unpickled (init has a required keyword argument)"""
+
+    def __init__(self, *, code):
+        super().__init__(f"code {code}")
+
+
+def check_code(value):
+    if value == "x":
+        raise CodeError(code=3)
+    return value
+
+
+def test_read_rows_parallel_unpicklable_error():
+    rows = [{'code': "a"}, {'code': "x"}, {'code': "b"}]
+    reader = lib.RowReader(fields={'code': "code"}, conversions={'code': check_code})
+    read = list(lib.read_rows_parallel(rows, reader, workers=2, chunksize=1))
+    assert [read[0]['code'], read[2]['code']] == ["a", "b"]
+    assert isinstance(read[1], lib.RowError)
+    assert isinstance(read[1].error, RuntimeError)
+    assert "CodeError: code 3" in str(read[1].error)
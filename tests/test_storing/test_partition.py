@@ -0,0 +1,104 @@
+import os
+import pytest
+import shutil
+
+import olutils.storing as lib
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+ROWS = [
+    {'day': f"d{i % 5}", 'id': str(i), 'text': "x" * (i % 7)} for i in range(100)
+]
+
+
+def by_day(rows):
+    res = {}
+    for row in rows:
+        res.setdefault(row['day'], []).append(row)
+    return res
+
+
+def test_write_partitioned():
+    template = os.path.join(TMP_DIR, "{key}", "events.csv")
+    paths = lib.write_partitioned(ROWS, template, key=lambda row: row['day'], max_open=2)
+    expected = by_day(ROWS)
+    assert sorted(paths) == sorted(expected)
+    for day, rows in expected.items():
+        assert paths[day] == [os.path.join(TMP_DIR, day, "events.csv")]
+        assert list(lib.load(paths[day][0])) == rows
+        assert lib.read_txt(paths[day][0])[0] == "day,id,text\n"
+
+    # Tuples rows, compressed files and keys with braces
+    template = os.path.join(TMP_DIR, "{key}.csv.gz")
+    with lib.PartitionedWriter(template, fieldnames=["a", "b"], max_open=1) as writer:
+        for i in range(10):
+            writer.writerow((i, i * 2), key=f"{{{i % 3}}}")
+        assert len(writer._open) == 1
+    assert list(lib.load(os.path.join(TMP_DIR, "{1}.csv.gz"))) == [
+        {'a': str(i), 'b': str(2 * i)} for i in [1, 4, 7]
+    ]
+
+    with pytest.raises(ValueError):
+        lib.write_partitioned([(1, 2)], template, key=lambda row: row[0])
+
+    # Fieldnames are quoted
+    template = os.path.join(TMP_DIR, "quoted_{key}.csv")
+    fieldnames = ["a,b", 'c"d']
+    for rows in [[("1", "2")], [dict(zip(fieldnames, ["1", "2"]))]]:
+        paths = lib.write_partitioned(
+            rows, template, key=lambda row: "x", fieldnames=fieldnames
+        )
+        assert list(lib.load(paths["x"][0], delimiter=",")) == [
+            {"a,b": "1", 'c"d': "2"}
+        ]
+
+
+def test_write_partitioned_rolling():
+    template = os.path.join(TMP_DIR, "{key}_{:02d}.csv")
+    paths = lib.write_partitioned(
+        ROWS, template, key=lambda row: row['day'], max_open=3, max_bytes=60
+    )
+    for day, rows in by_day(ROWS).items():
+        assert len(paths[day]) > 1
+        assert paths[day][0] == os.path.join(TMP_DIR, f"{day}_01.csv")
+        assert paths[day][1] == os.path.join(TMP_DIR, f"{day}_02.csv")
+        read = []
+        for path in paths[day]:
+            assert os.path.getsize(path) < 60 + 20
+            read += list(lib.load(path, delimiter=","))
+        assert read == rows
+
+    # Rerun overwrites files and removes stale rolls, literal braces are kept
+    day = ROWS[0]['day']
+    for i in [1, 2]:
+        lib.write_txt("", os.path.join(TMP_DIR, f"{day}_{len(paths[day]) + i:02d}.csv"))
+    rerun = lib.write_partitioned(
+        ROWS, template, key=lambda row: row['day'], max_open=3, max_bytes=60
+    )
+    assert rerun == paths
+    assert len(os.listdir(TMP_DIR)) == sum(len(files) for files in paths.values())
+    template = os.path.join(TMP_DIR, "{{x}}_{key}_{}.csv")
+    paths = lib.write_partitioned(
+        ROWS[:1], template, key=lambda row: "{}", max_bytes=60
+    )
+    assert paths == {"{}": [os.path.join(TMP_DIR, "{{x}}_{}_1.csv")]}
+
+    with pytest.raises(ValueError):
+        lib.PartitionedWriter(os.path.join(TMP_DIR, "{key}.csv"), max_bytes=60)
@@ -0,0 +1,64 @@
+import os
+import pickle
+import pytest
+import shutil
+
+import numpy as np
+
+import olutils.storing as lib
+from olutils.storing.pickle import OOB_ALIGNMENT
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def test_oob():
+    obj = {
+        'name': "model",
+        'weights': np.arange(1000, dtype="float64"),
+        'bias': np.ones((3, 2), dtype="int8"),
+        'empty': np.array([], dtype="float32"),
+    }
+    path = os.path.join(TMP_DIR, "model.pickle")
+    lib.save(obj, path, oob=True, atomic=True)
+    assert os.listdir(TMP_DIR) == ["model.pickle"]
+
+    res = lib.load(path)
+    assert res['name'] == "model"
+    for key in ['weights', 'bias', 'empty']:
+        assert res[key].dtype == obj[key].dtype
+        np.testing.assert_array_equal(res[key], obj[key])
+    assert res['weights'].ctypes.data % OOB_ALIGNMENT == 0
+    assert not res['weights'].flags.writeable
+
+    res = lib.load(path, mmap_mode="c")
+    res['weights'][0] = -1
+    assert lib.load(path)['weights'][0] == 0
+    with pytest.raises(ValueError):
+        lib.load(path, mmap_mode="r+")
+    with pytest.raises(pickle.UnpicklingError):
+        with open(path, "rb") as file:
+            pickle.load(file)
+
+    lib.save(obj, path)
+    np.testing.assert_array_equal(lib.load(path)['weights'], obj['weights'])
+
+    with pytest.raises(ValueError):
+        lib.save(obj, path, oob=True, protocol=4)
+    with pytest.raises(ValueError):
+        lib.save(obj, path + ".gz", oob=True)
@@ -0,0 +1,126 @@
+import os
+import pytest
+import shutil
+import subprocess
+import sys
+
+import olutils.storing as lib
+from olutils.storing import registry
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+    for name in ["upper", "upper.txt", "lazy"]:
+        if name in registry.formats():
+            registry.unregister_format(name)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def read_upper(path, /, **kwargs):
+    return lib.read_txt(path, rtype=str, **kwargs).lower()
+
+
+def write_upper(content, path, /, **kwargs):
+    lib.write_txt(content.upper(), path, **kwargs)
+
+
+def test_path2format():
+    assert registry.path2format("dir.v1/data.csv").name == "csv"
+    assert registry.path2format("data.csv.gz").name == "csv"
+    assert registry.path2format("data.tmp.json").name == "json"
+    with pytest.raises(ValueError):
+        registry.path2format("data.unk")
+    with pytest.raises(ValueError):
+        registry.path2format("csv")
+
+    lib.register_format(
+        "upper.txt", loader=read_upper, saver=write_upper, extensions=["upper.txt"]
+    )
+    assert registry.path2format("data.upper.txt").name == "upper.txt"
+    assert registry.path2format("data.txt").name == "txt"
+
+
+def test_register_format():
+    lib.register_format("upper", loader=read_upper, saver=write_upper)
+    with pytest.raises(ValueError):
+        lib.register_format("upper", loader=read_upper)
+    with pytest.raises(ValueError):
+        lib.register_format("other", loader=read_upper, extensions=["upper"])
+
+    path = os.path.join(TMP_DIR, "data.upper")
+    lib.save("Some content", path)
+    assert lib.read_txt(path, rtype=str) == "SOME CONTENT"
+    assert lib.load(path) == "some content"
+    assert lib.load(path, "txt", rtype=str) == "SOME CONTENT"
+    with pytest.raises(ValueError):
+        lib.load(path, stream=True)
+
+    lib.register_format("upper", loader=read_upper, replace=True)
+    with pytest.raises(ValueError):
+        lib.save("Some content", path)
+
+
+def test_lazy_hooks():
+    module = "tests.test_storing.lazy_format_mockup"
+    sys.modules.pop(module, None)
+    lib.register_format(
+        "lazy", loader=f"{module}:read_lazy", saver=f"{module}:write_lazy"
+    )
+    assert module not in sys.modules
+    path = os.path.join(TMP_DIR, "data.lazy")
+    os.makedirs(TMP_DIR)
+    lib.save("abc", path)
+    assert module in sys.modules
+    assert lib.load(path) == "abc"
+    fmt = registry.get_format("lazy")
+    assert fmt.loader is fmt.loader
+    registry.unregister_format("lazy")
+    with pytest.raises(ValueError):
+        registry.get_format("lazy")
+
+    lib.register_format("lazy", loader=f"{module}:unknown")
+    with pytest.raises(AttributeError):
+        lib.load(path)
+
+
+def test_lazy_builtin_formats():
+    """Modules of built-in formats are imported on first use only"""
+    code = "\n".join([
+        "import sys",
+        "import olutils.storing as lib",
+        "assert 'olutils.storing.csv' not in sys.modules",
+        "assert 'olutils.storing.npy' not in sys.modules",
+        "lib.load('tests/mockups/base_comma.csv')",
+        "assert 'olutils.storing.csv' in sys.modules",
+        "assert 'olutils.storing.npy' not in sys.modules",
+        "assert lib.read_npy is sys.modules['olutils.storing.npy'].read_npy",
+    ])
+    subprocess.run([sys.executable, "-c", code], check=True)
+    with pytest.raises(AttributeError):
+        lib.unknown
+
+
+def test_stream():
+    path = os.path.join(TMP_DIR, "data.txt")
+    lib.save(["a\n", "b\n"], path)
+    lines = lib.load(path, stream=True, w_eol=False)
+    assert not isinstance(lines, list)
+    assert list(lines) == ["a", "b"]
+
+    path = os.path.join(TMP_DIR, "data.csv")
+    rows = [{'a': "1", 'b': "x"}, {'a': "2", 'b': "y"}]
+    lib.save(rows, path)
+    assert list(lib.load(path, stream=True)) == rows
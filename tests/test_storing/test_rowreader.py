@@ -1,3 +1,4 @@
+import pickle
 import pytest
 from collections import OrderedDict
 
@@ -38,3 +39,216 @@ def test_RowReader():
     )
     row = reader.read({'ID': "8", 'Nom': "Octave"})
     assert row == {'id': 8, 'label': "8.Octave"}
+
+
+def label(row):
+    return str(row.id) + "." + row['name']
+
+
+def test_RowReader_compiled():
+    reader = lib.RowReader(
+        fields={'field1': "Header1", 'field2': "Header2"}, compiled=True,
+    )
+    row = reader.read({'Header1': 1, 'Header2': 2, 'Header3': 3})
+    assert row == {'field1': 1, 'field2': 2}
+    assert row.field1 == 1 and row['field2'] == 2
+    assert list(row) == ['field1', 'field2']
+    assert not hasattr(row, "__dict__")
+    with pytest.raises(KeyError, match="Header2"):
+        reader.read({'Header1': 1, 'Header3': 3})
+
+    reader = lib.RowReader(
+        fields={'id': "ID", 'name': "Nom"},
+        conversions={'id': int},
+        operations={'label': label},
+        compiled=True,
+    )
+    row = reader.read({'ID': "8", 'Nom': "Octave"})
+    assert row == {'id': 8, 'name': "Octave", 'label': "8.Octave"}
+    assert row.label == "8.Octave"
+
+    reader = lib.RowReader(
+        fields={'id': "ID", 'name': "Nom"},
+        conversions={'id': int, 'name': str.upper},
+        operations={'label': label},
+        delete=['name'],
+        compiled=True,
+    )
+    row = reader.read({'ID': "8", 'Nom': "Octave"})
+    assert row == {'id': 8, 'label': "8.OCTAVE"}
+    assert not hasattr(row, 'name')
+
+    # Readers and records are picklable
+    reader = pickle.loads(pickle.dumps(reader))
+    row = reader.read({'ID': "8", 'Nom': "Octave"})
+    assert pickle.loads(pickle.dumps(row)) == row
+
+    with pytest.raises(ValueError):
+        lib.RowReader(fields={'my field': "A"}, compiled=True)
+    with pytest.raises(ValueError):
+        lib.RowReader(fields={'keys': "A"}, compiled=True)
+
+    # Configuration errors are the same for all modes
+    for mode in [{}, {'compiled': True}, {'lazy': True}]:
+        kwargs = {'fields': {'id': "ID"}, 'operations': {'label': label}, **mode}
+        with pytest.raises(ValueError, match="'label'"):
+            lib.RowReader(**kwargs, conversions={'label': str.upper})
+        with pytest.raises(ValueError, match="'name'"):
+            lib.RowReader(**kwargs, delete=['name'])
+
+
+@lib.vectorized
+def total(table):
+    return table['price'] * table['quantity']
+
+
+def test_RowReader_read_many():
+    from datetime import datetime
+    import numpy as np
+
+    irows = [
+        {'P': "1.5", 'Q': "2", 'D': "2021-01-02", 'N': "a"},
+        {'P': "3", 'Q': "1", 'D': "2021-01-03 10:00:00", 'N': "b"},
+    ]
+    kwargs = {
+        'fields': {'price': "P", 'quantity': "Q", 'day': "D", 'name': "N"},
+        'conversions': {
+            'price': float, 'quantity': int, 'day': datetime.fromisoformat,
+            'name': str.upper,
+        },
+        'delete': ['quantity'],
+    }
+
+    for compiled in [False, True]:
+        reader = lib.RowReader(
+            **kwargs, operations={'total': total}, compiled=compiled
+        )
+        rows = reader.read_many(irows)
+        assert rows == [
+            {'price': 1.5, 'day': datetime(2021, 1, 2), 'name': "A", 'total': 3.0},
+            {'price': 3.0, 'day': datetime(2021, 1, 3, 10), 'name': "B", 'total': 3.0},
+        ]
+
+    reader = lib.RowReader(
+        **kwargs, operations={'label': label2, 'total': total}, compiled=True
+    )
+    columns = reader.read_many(irows, output="columns")
+    assert list(columns) == ['price', 'day', 'name', 'label', 'total']
+    assert columns['price'].dtype == np.float64
+    assert columns['day'].dtype == np.dtype("datetime64[us]")
+    assert columns['label'].tolist() == ["A2", "B1"]
+    assert columns['total'].tolist() == [3.0, 3.0]
+
+    # Columns, as read by read_csv in batch mode
+    rows = reader.read_columns(
+        {key: np.array([row[key] for row in irows]) for key in irows[0]},
+        output="rows",
+    )
+    assert rows[0].label == "A2" and rows[1].total == 3.0
+    assert rows[1].day == datetime(2021, 1, 3, 10)
+
+    # Errors are the ones of conversions
+    with pytest.raises(ValueError, match="invalid literal"):
+        reader.read_many([{**irows[0], 'Q': ""}])
+    with pytest.raises(KeyError, match="'N'"):
+        reader.read_many([irows[0], {'P': "1", 'Q': "1", 'D': "2021-01-01"}])
+    with pytest.raises(ValueError):
+        reader.read_many(irows, output="table")
+
+    # Vectorized operations can't read single rows
+    for mode in [{}, {'compiled': True}, {'lazy': True}]:
+        reader = lib.RowReader(**kwargs, operations={'total': total}, **mode)
+        with pytest.raises(ValueError, match="'total'"):
+            reader.read(irows[0])
+        assert reader.read_many(irows)[1]['total'] == 3.0
+
+
+def test_convert_column_parity():
+    """Columns are converted as values are by their conversion"""
+    from datetime import datetime
+    from olutils.storing.rowreader import convert_column
+    from olutils.storing.schema import str2datetime
+
+    values = ["2020-01-02", "2020-01-02 10:00:00.5", "2020-01-02T10"]
+    for func in [datetime.fromisoformat, str2datetime]:
+        assert convert_column(func, values).tolist() == [func(v) for v in values]
+        for value in [
+            "2020", "2020-01", "now", "today", "NaT", "+2020-01-02", "20200102",
+            "10000-01-02", "-2020-01-02",
+        ]:
+            try:
+                expected = [func(v) for v in values + [value]]
+            except Exception as error:
+                with pytest.raises(type(error)):
+                    convert_column(func, values + [value])
+            else:
+                assert convert_column(func, values + [value]) == expected
+        assert convert_column(func, ["20200102"]) == [func("20200102")]
+
+    reader = lib.RowReader(
+        fields={'day': "D"}, conversions={'day': datetime.fromisoformat}
+    )
+    rows = [{'D': "20200102"}]
+    assert reader.read_many(rows) == [reader.read(rows[0])]
+    assert reader.read_many(rows)[0]['day'] == datetime(2020, 1, 2)
+
+
+def label2(row):
+    return row['name'] + str(row['quantity'])
+
+
+def test_RowReader_requires():
+    calls = []
+
+    @lib.requires('name', 'code')
+    def label(row):
+        calls.append('label')
+        return row['name'] + "." + row['code']
+
+    @lib.requires('id')
+    def code(row):
+        calls.append('code')
+        return str(row['id'] * 2)
+
+    kwargs = {
+        'fields': {'id': "ID", 'name': "Nom"},
+        'conversions': {'id': int},
+        'operations': {'label': label, 'code': code},
+    }
+    irow = {'ID': "4", 'Nom': "Octave"}
+
+    # Eager modes run operations after the ones they depend on
+    for compiled in [False, True]:
+        reader = lib.RowReader(**kwargs, compiled=compiled)
+        assert reader.read(irow) == {
+            'id': 4, 'name': "Octave", 'code': "8", 'label': "Octave.8"
+        }
+        assert reader.read_many([irow], output="columns")['label'] == ["Octave.8"]
+
+    # Lazy mode runs operations on first access only
+    reader = lib.RowReader(**kwargs, delete=['code'], lazy=True)
+    calls.clear()
+    row = reader.read(irow)
+    assert calls == [] and row.id == 4
+    assert row.label == "Octave.8"
+    assert calls == ['label', 'code']
+    assert row['label'] == "Octave.8" and calls == ['label', 'code']
+    assert 'code' not in row and list(row) == ['id', 'name', 'label']
+    with pytest.raises(KeyError):
+        row['code']
+    assert row == {'id': 4, 'name': "Octave", 'label': "Octave.8"}
+    assert isinstance(pickle.loads(pickle.dumps(reader.read(irow))), OrderedDict)
+
+    # Dependencies are checked
+    with pytest.raises(ValueError, match="unknown"):
+        lib.RowReader(fields={'id': "ID"}, operations={'code': code, 'x': label})
+    with pytest.raises(ValueError, match="Cyclic"):
+        lib.RowReader(
+            fields={'id': "ID"},
+            operations={
+                'a': lib.requires('b')(lambda row: 1),
+                'b': lib.requires('a')(lambda row: 1),
+            },
+        )
+    with pytest.raises(ValueError):
+        lib.RowReader(fields={'id': "ID"}, compiled=True, lazy=True)
@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+from datetime import datetime
+
+from olutils.storing import schema as lib
+
+
+def test_str2bool():
+    assert lib.str2bool("True") is True
+    assert lib.str2bool(" y ") is True
+    assert lib.str2bool("0") is False
+    with pytest.raises(ValueError):
+        lib.str2bool("maybe")
+
+
+def test_str2datetime():
+    assert lib.str2datetime("2020-01-02T03:04:05") == datetime(2020, 1, 2, 3, 4, 5)
+    assert lib.str2datetime("Jan 2 2020") == datetime(2020, 1, 2)
+
+
+def test_compile_converter():
+    fieldnames = ["id", "name", "score", "ok", "date"]
+    convert = lib.compile_converter(fieldnames, {
+        'id': int, 'score': float, 'ok': bool, 'date': datetime,
+    })
+    assert convert(["1", "one", "1.5", "yes", "2020-01-01"]) == {
+        'id': 1,
+        'name': "one",
+        'score': 1.5,
+        'ok': True,
+        'date': datetime(2020, 1, 1),
+    }
+    assert convert(["", "", "", None, None]) == {
+        'id': None, 'name': "", 'score': None, 'ok': None, 'date': None,
+    }
+
+    convert = lib.compile_converter(fieldnames, {'id': int}, usecols=["ok", "id"])
+    assert convert(["1", "one", "1.5", "yes", "2020-01-01"]) == {'ok': "yes", 'id': 1}
+
+    with pytest.raises(ValueError):
+        lib.compile_converter(fieldnames, {'unknown': int})
+    with pytest.raises(ValueError):
+        lib.compile_converter(fieldnames, usecols=["unknown"])
+    with pytest.raises(ValueError):
+        lib.compile_converter(fieldnames, {'id': complex})
+
+
+def test_parse_column():
+    values = np.array(["1", "2", "3"])
+    assert lib.parse_column(values, str) is values
+    assert lib.parse_column(values, int).dtype == np.int64
+    assert lib.parse_column(values, float).tolist() == [1., 2., 3.]
+
+    res = lib.parse_column(np.array(["1", ""]), int)
+    assert res.dtype == np.float64
+    assert res[0] == 1 and np.isnan(res[1])
+
+    res = lib.parse_column(np.array(["True", "no", ""]), bool)
+    assert res.tolist() == [True, False, False]
+    with pytest.raises(ValueError):
+        lib.parse_column(np.array(["maybe"]), bool)
+
+    res = lib.parse_column(np.array(["2020-01-01", ""]), datetime)
+    assert res[0] == np.datetime64("2020-01-01")
+    assert np.isnat(res[1])
+
+    with pytest.raises(ValueError):
+        lib.parse_column(values, complex)
+
+
+def test_infer_schema():
+    assert lib.infer_schema([
+        {'a': "1", 'b': "1.5", 'c': "yes", 'd': "2020-01-01", 'e': "x", 'f': ""},
+        {'a': "", 'b': "2", 'c': "no", 'd': "2020-01-02", 'e': "1", 'f': ""},
+        {'a': "3", 'b': "", 'c': "", 'd': "", 'e': "", 'f': "", None: ["z"]},
+    ]) == {'a': int, 'b': float, 'c': bool, 'd': datetime, 'e': str, 'f': str}
+    assert lib.infer_schema([]) == {}
@@ -0,0 +1,92 @@
+import os
+import pytest
+import random
+import shutil
+
+import olutils.storing as lib
+
+TMP_DIR = "tmp"
+
+
+# --------------------------------------------------------------------------- #
+# Setup / Teardown
+
+def setup_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+def teardown_function(function):
+    if os.path.exists(TMP_DIR):
+        shutil.rmtree(TMP_DIR)
+
+
+# --------------------------------------------------------------------------- #
+# Tests
+
+def make_rows(n, seed=0):
+    rnd = random.Random(seed)
+    return [
+        {
+            'id': str(i),
+            'group': rnd.choice(["a", "b", "c", ""]),
+            'value': str(rnd.randint(-50, 50)),
+        }
+        for i in range(n)
+    ]
+
+
+def expected(rows, by, converters=None, reverse=False):
+    converters = converters or {}
+
+    def key(row):
+        return tuple(
+            (False, None) if row[col] == "" else
+            (True, converters.get(col, str)(row[col]))
+            for col in by
+        )
+
+    return sorted(rows, key=key, reverse=reverse)
+
+
+@pytest.mark.parametrize("memory,workers,fan_in", [
+    (10 ** 9, 1, 128),  # In memory
+    (5000, 1, 128),  # Runs merged at once
+    (5000, 1, 3),  # Several merge passes
+    (5000, 3, 4),  # Runs sorted in parallel
+])
+def test_sort_csv(memory, workers, fan_in):
+    rows = make_rows(500)
+    path = os.path.join(TMP_DIR, "data.csv")
+    output = os.path.join(TMP_DIR, "sorted.csv")
+    lib.save(rows, path, delimiter=";")
+    params = {'memory': memory, 'workers': workers, 'fan_in': fan_in,
+              'tmp_dir': TMP_DIR}
+
+    lib.sort_csv(path, output, "value", **params)
+    assert list(lib.load(output)) == expected(rows, ["value"])
+    assert sorted(os.listdir(TMP_DIR)) == ["data.csv", "sorted.csv"]
+    with open(output) as file:
+        assert file.readline() == "id;group;value\n"
+
+    lib.sort_csv(path, output, ["group", "value"], converters={'value': int}, **params)
+    assert list(lib.load(output)) == expected(
+        rows, ["group", "value"], {'value': int}
+    )
+
+    lib.sort_csv(path, output + ".gz", "value", converters={'value': int},
+                 reverse=True, **params)
+    assert list(lib.load(output + ".gz")) == expected(
+        rows, ["value"], {'value': int}, reverse=True
+    )
+
+
+def test_sort_csv_errors():
+    path = os.path.join(TMP_DIR, "data.csv")
+    lib.save(make_rows(10), path)
+    with pytest.raises(ValueError):
+        lib.sort_csv(path, os.path.join(TMP_DIR, "sorted.csv"), "unknown")
+
+    lib.write_txt("id,value\n", path)
+    lib.sort_csv(path, os.path.join(TMP_DIR, "sorted.csv"), "value")
+    assert lib.read_txt(os.path.join(TMP_DIR, "sorted.csv")) == ["id,value\n"]
@@ -1,4 +1,5 @@
 import os
+import re
 import pytest
 import shutil
 
@@ -98,3 +99,98 @@ def test_write_txt():
     lines = 30
     lib.write_txt(lines, path)
     assert_content_equal(path, str(lines))
+
+
+def test_txt_compressed():
+    path = os.path.join(TMP_DIR, "file.txt.xz")
+    lines = ["Hi,\n", "Bye\n"]
+    lib.write_txt(lines, path, compresslevel=0)
+    assert lib.read_txt(path) == lines
+    assert list(lib.read_txt(path, rtype="iter", w_eol=False)) == ["Hi,", "Bye"]
+    assert lib.read_txt(path, rtype=str, compression="xz") == "".join(lines)
+
+
+def test_iter_spans():
+    buffer = b"ab\ncd\n\nabab\nz"
+    assert list(lib.txt.iter_spans(buffer)) == [
+        (0, 3), (3, 6), (6, 7), (7, 12), (12, 13)
+    ]
+    assert list(lib.txt.iter_spans(buffer, re.compile(b"ab"))) == [(0, 3), (7, 12)]
+    assert list(lib.txt.iter_spans(buffer, re.compile(b"z$"))) == [(12, 13)]
+    assert list(lib.txt.iter_spans(b"")) == []
+    assert list(lib.txt.iter_spans(b"a\r\nb\rc\n")) == [(0, 3), (3, 5), (5, 7)]
+
+
+def test_read_txt_mmap_parity():
+    filepath = os.path.join(TMP_DIR, "file.txt")
+    os.makedirs(TMP_DIR)
+    contents = [b"foo\nbar\nbaz bar\n\nqux", b"foo\r\nbar\rbaz bar\r\n\r\nqux\r"]
+    patterns = [
+        "c", "^bar", "bar$", r"o\sb", r"\s", r"r\s*$", "^$", "^", "a.*", r"\n",
+        re.compile("^BA", re.I),
+    ]
+    for content in contents:
+        with open(filepath, "wb") as file:
+            file.write(content)
+        for pattern in patterns:
+            expected = lib.read_txt(filepath, pattern=pattern)
+            assert lib.read_txt(filepath, pattern=pattern, mmap=True) == expected
+            lines = lib.read_txt(filepath, pattern=pattern, mmap=True, rtype="iter")
+            assert list(lines) == expected
+
+
+def test_read_txt_mmap():
+    path = os.path.join(MOCK_DIR, "base_comma.csv")
+
+    for kwargs in [{}, {'w_eol': False}, {'f_eol': "\r\n"}]:
+        for rtype in [list, str]:
+            assert lib.read_txt(path, mmap=True, rtype=rtype, **kwargs) == (
+                lib.read_txt(path, rtype=rtype, **kwargs)
+            )
+        assert list(lib.read_txt(path, mmap=True, rtype="iter", **kwargs)) == (
+            lib.read_txt(path, **kwargs)
+        )
+
+    views = list(lib.read_txt(path, mmap=True, rtype=memoryview))
+    assert isinstance(views[0], memoryview)
+    assert [bytes(view) for view in views] == [
+        line.encode() for line in lib.read_txt(path)
+    ]
+    views = lib.read_txt(path, mmap=True, rtype="view", w_eol=False)
+    assert bytes(next(views)) == b"col_1,col_2,col_3"
+
+    # ---- Pattern
+    expected = ['21,22,""\n', '31,,33\n']
+    assert lib.read_txt(path, pattern=r"^[23]") == expected
+    assert lib.read_txt(path, pattern=r"(?m)^[23]", mmap=True) == expected
+    assert lib.read_txt(path, pattern=re.compile(r"(?m)^[23]"), mmap=True) == expected
+    assert lib.read_txt(path, pattern=b"3", mmap=True, rtype=str) == (
+        "col_1,col_2,col_3\n11,12,13\n31,,33\n"
+    )
+    views = lib.read_txt(path, pattern="forty", mmap=True, rtype="view")
+    assert [bytes(view) for view in views] == [b"forty_one,forty_two,forty_three\n"]
+
+    # ---- Line terminators and empty file
+    filepath = os.path.join(TMP_DIR, "file.txt")
+    os.makedirs(TMP_DIR)
+    with open(filepath, "wb") as file:
+        file.write(b"a\r\nb\rc")
+    assert lib.read_txt(filepath, mmap=True) == lib.read_txt(filepath)
+    assert lib.read_txt(filepath, mmap=True, w_eol=False) == ["a", "b", "c"]
+    views = lib.read_txt(filepath, mmap=True, rtype="view", w_eol=False)
+    assert [bytes(view) for view in views] == [b"a", b"b", b"c"]
+    assert lib.read_txt(filepath, pattern="c", mmap=True) == ["c"]
+
+    lib.write_txt("", filepath)
+    assert lib.read_txt(filepath, mmap=True) == []
+    assert lib.read_txt(filepath, mmap=True, rtype=str) == ""
+
+    # ---- Errors
+    with pytest.raises(ValueError):
+        lib.read_txt(path, rtype="view")
+    with pytest.raises(ValueError):
+        lib.read_txt(path, mmap=True, rtype="view", f_eol="\n")
+    with pytest.raises(ValueError):
+        lib.read_txt(path, mmap=True, rtype=int)
+    with pytest.raises(ValueError):
+        lib.read_txt(path + ".gz", mmap=True)